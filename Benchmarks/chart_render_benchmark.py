@@ -0,0 +1,102 @@
+"""Time consecutive bar and donut chart renders on pyplot-free Agg figures.
+
+Run from the repository root:
+
+    python -m Benchmarks.chart_render_benchmark --renders 500 --threads 1 4
+    python -m Benchmarks.chart_render_benchmark --formats png svg
+    python -m Benchmarks.chart_render_benchmark --check-svg --threads 8
+
+--check-svg renders one SVG chart many times across threads, interleaved with PNG renders,
+and fails unless every output is byte-identical (the render cache and image dedup rely on it).
+
+Sizes are reported raw and deflated, since PPTX files store images in a zip.
+"""
+
+import argparse
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from Components.chart_tools import _draw_chart_image
+
+WIDTH_IN = 4.3
+HEIGHT_IN = 3.5
+PAYLOADS = (
+    {
+        "chartType": "horizontal_bar_chart",
+        "bucket_label": "Years",
+        "count_label": "Physicians",
+        "aggregations": {"0 to 3": 10, "4 to 6": 0, "7 to 10": 10, "11 to 15": 30, "16 to 20": 30, ">25": 20},
+    },
+    {
+        "chartType": "donut_chart",
+        "aggregations": {"Yes": 40, "No": 35, "Unsure": 25},
+    },
+)
+
+
+def run(renders: int, threads: int, image_format: str = "png") -> tuple[float, list[bytes]]:
+    """Render alternating bar/donut charts and return the elapsed seconds and the rendered bytes."""
+
+    def render(index: int) -> bytes:
+        # Vary one value so every render draws fresh artists rather than an identical figure.
+        payload = PAYLOADS[index % 2]
+        first_label = next(iter(payload["aggregations"]))
+        varied = payload | {"aggregations": payload["aggregations"] | {first_label: index % 50}}
+        return _draw_chart_image(varied, WIDTH_IN, HEIGHT_IN, image_format).getvalue()
+
+    start = time.perf_counter()
+    if threads <= 1:
+        images = [render(index) for index in range(renders)]
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            images = list(executor.map(render, range(renders)))
+    return time.perf_counter() - start, images
+
+
+def check_svg_determinism(renders: int, threads: int) -> int:
+    """Render one SVG chart across threads, with PNG renders in between; return the distinct outputs."""
+
+    def render(index: int) -> bytes | None:
+        if index % 2:
+            _draw_chart_image(PAYLOADS[0], WIDTH_IN, HEIGHT_IN, "png")
+            return None
+        return _draw_chart_image(PAYLOADS[1], WIDTH_IN, HEIGHT_IN, "svg").getvalue()
+
+    with ThreadPoolExecutor(max_workers=max(2, threads)) as executor:
+        outputs = {image for image in executor.map(render, range(renders * 2)) if image is not None}
+    return len(outputs)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--renders", type=int, default=500)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1])
+    parser.add_argument("--formats", nargs="+", choices=("png", "svg"), default=["png"])
+    parser.add_argument("--check-svg", action="store_true", help="Only check threaded SVG renders are byte-identical.")
+    args = parser.parse_args(argv)
+
+    if args.check_svg:
+        threads = max(args.threads)
+        distinct = check_svg_determinism(args.renders, threads)
+        print(f"svg determinism: {args.renders} renders on {max(2, threads)} threads, {distinct} distinct output(s)")
+        if distinct != 1:
+            raise SystemExit(1)
+        return
+
+    # Warm Matplotlib's font cache so the first timed render does not pay for it.
+    run(2, 1)
+    print(f"{'format':<8}{'threads':>8}{'renders':>9}{'seconds':>10}{'ms/render':>11}{'KB/render':>11}{'zipped KB':>11}")
+    for image_format in args.formats:
+        for threads in args.threads:
+            seconds, images = run(args.renders, threads, image_format)
+            raw_kb = sum(len(image) for image in images) / 1024 / len(images)
+            zipped_kb = sum(len(zlib.compress(image)) for image in images) / 1024 / len(images)
+            print(
+                f"{image_format:<8}{threads:>8}{args.renders:>9}{seconds:>10.2f}"
+                f"{seconds * 1000 / args.renders:>11.2f}{raw_kb:>11.1f}{zipped_kb:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
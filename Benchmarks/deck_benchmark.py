@@ -0,0 +1,154 @@
+"""Build synthetic decks per scenario in fresh processes and record time, peak RSS and output size.
+
+Run from the repository root:
+
+    python -m Benchmarks.deck_benchmark --repeat 3
+    python -m Benchmarks.deck_benchmark --compare Benchmarks/results/<earlier run>.json
+
+Each run is saved under Benchmarks/results/ so later runs can be compared against it.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from Benchmarks.deck_generator import DeckSpec, generate_deck
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = REPO_ROOT / "Benchmarks" / "results"
+SCENARIOS = {
+    "small": DeckSpec(slides=5),
+    "charts_heavy": DeckSpec(slides=40, charts_per_slide=4),
+    "charts_native": DeckSpec(slides=40, charts_per_slide=4, chart_backend="native"),
+    "charts_svg": DeckSpec(slides=40, charts_per_slide=4, image_format="svg"),
+    "charts_draft": DeckSpec(slides=40, charts_per_slide=4, quality="draft"),
+    "charts_print": DeckSpec(slides=40, charts_per_slide=4, quality="print"),
+    "tables_heavy": DeckSpec(slides=40, table_rows=60, table_columns=4),
+    "deep_lists": DeckSpec(slides=40, list_items=30, list_depth=5),
+    "large_mixed": DeckSpec(slides=150, charts_per_slide=3, table_rows=25),
+}
+METRICS = ("build_s", "save_s", "peak_rss_mb", "output_bytes")
+# Runs in a fresh interpreter so import cost, caches and RSS do not leak between samples.
+BUILD_SNIPPET = """
+import json, resource, sys, time
+from pathlib import Path
+import aspose.slides as slides
+import main
+deck = json.loads(Path(sys.argv[1]).read_text(encoding="utf-8"))["deck"]
+with slides.Presentation() as presentation:
+    start = time.perf_counter()
+    main.create_slide(presentation, deck, int(sys.argv[3]))
+    built = time.perf_counter()
+    presentation.save(sys.argv[2], slides.export.SaveFormat.PPTX)
+    saved = time.perf_counter()
+    slide_count = len(presentation.slides)
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+rss_mb = rss / 1e6 if sys.platform == "darwin" else rss / 1024
+print(json.dumps({"build_s": built - start, "save_s": saved - built, "peak_rss_mb": rss_mb, "slides": slide_count}))
+"""
+
+
+def run_scenario(spec: DeckSpec, repeat: int, workers: int, warm_cache: bool) -> dict:
+    """Build one scenario repeat times in subprocesses and return median metrics."""
+
+    env = dict(os.environ)
+    if not warm_cache:
+        env["ACTIVEER_RENDER_CACHE"] = "0"
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp:
+        deck_path = Path(tmp) / "deck.json"
+        output_path = Path(tmp) / "deck.pptx"
+        deck_path.write_text(json.dumps(generate_deck(spec)), encoding="utf-8")
+        for _ in range(repeat):
+            completed = subprocess.run(
+                [sys.executable, "-c", BUILD_SNIPPET, str(deck_path), str(output_path), str(workers)],
+                cwd=REPO_ROOT,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            sample = json.loads(completed.stdout.strip().splitlines()[-1])
+            sample["output_bytes"] = output_path.stat().st_size
+            samples.append(sample)
+
+    result = {metric: statistics.median(sample[metric] for sample in samples) for metric in METRICS}
+    result["slides"] = samples[0]["slides"]
+    result["spec"] = spec._asdict()
+    return result
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def format_comparison(current: dict, baseline: dict) -> str:
+    """Render per-scenario metric changes against an earlier run."""
+
+    lines = [f"{'scenario':<16}{'metric':<14}{'baseline':>12}{'current':>12}{'change':>9}"]
+    for name, result in current["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        for metric in METRICS:
+            before, after = previous.get(metric), result[metric]
+            if not before:
+                continue
+            lines.append(f"{name:<16}{metric:<14}{before:>12.3f}{after:>12.3f}{(after - before) / before:>+9.1%}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Run only these scenarios.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=0, help="Render workers passed to create_slide.")
+    parser.add_argument("--warm-cache", action="store_true", help="Keep the render cache enabled between runs.")
+    parser.add_argument("--save", type=Path, help="Results file (default: Benchmarks/results/deck_benchmark_<time>.json).")
+    parser.add_argument("--compare", type=Path, help="Earlier results file to diff against.")
+    args = parser.parse_args(argv)
+
+    names = args.scenario or list(SCENARIOS)
+    run = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "workers": args.workers,
+        "warm_cache": args.warm_cache,
+        "scenarios": {},
+    }
+    print(f"{'scenario':<16}{'slides':>7}{'build s':>10}{'save s':>9}{'rss MB':>9}{'size KB':>10}")
+    for name in names:
+        result = run_scenario(SCENARIOS[name], max(1, args.repeat), args.workers, args.warm_cache)
+        run["scenarios"][name] = result
+        print(
+            f"{name:<16}{result['slides']:>7}{result['build_s']:>10.2f}{result['save_s']:>9.2f}"
+            f"{result['peak_rss_mb']:>9.1f}{result['output_bytes'] / 1024:>10.1f}"
+        )
+
+    save_path = args.save or RESULTS_DIR / f"deck_benchmark_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+    save_path.write_text(json.dumps(run, indent=2), encoding="utf-8")
+    print(f"Saved results to {save_path}")
+
+    if args.compare:
+        print(format_comparison(run, json.loads(args.compare.read_text(encoding="utf-8"))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Generate synthetic deck JSON in the schema load_deck reads, at configurable scale.
+
+Run from the repository root:
+
+    python -m Benchmarks.deck_generator --slides 60 --table-rows 40 -o build/synthetic.json
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import NamedTuple
+
+from Components.map_tools import US_STATE_ABBREVIATIONS
+
+CHART_TYPES = ("horizontal_bar_chart", "donut_chart")
+WORDS = (
+    "patient", "response", "therapy", "dose", "toxicity", "cohort", "survival", "median",
+    "oncologist", "trial", "outcome", "management", "adverse", "event", "interval", "baseline",
+)
+
+
+class DeckSpec(NamedTuple):
+    """Scale knobs for one synthetic deck."""
+
+    slides: int = 20
+    charts_per_slide: int = 3
+    table_rows: int = 12
+    table_columns: int = 3
+    list_items: int = 6
+    list_depth: int = 2
+    seed: int = 7
+    chart_backend: str | None = None
+    image_format: str | None = None
+    quality: str | None = None
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _chart(rng: random.Random, index: int) -> dict:
+    chart_type = CHART_TYPES[index % len(CHART_TYPES)]
+    buckets = rng.randint(3, 7)
+    component = {
+        "component": "chart",
+        "chartType": chart_type,
+        "name": f"{_sentence(rng, 4)}?",
+        "aggregations": {f"{b * 5} to {b * 5 + 4}": rng.randint(0, 60) for b in range(buckets)},
+    }
+    if chart_type == "horizontal_bar_chart":
+        component["bucket_label"] = "Years"
+        component["count_label"] = "Physicians"
+    return component
+
+
+def _table_markdown(rng: random.Random, rows: int, columns: int) -> str:
+    lines = ["| " + " | ".join(f"Column {c + 1}" for c in range(columns)) + " |"]
+    lines.append("|" + "|".join("------" for _ in range(columns)) + "|")
+    for _ in range(rows):
+        cells = [f"**{_sentence(rng, 1)}**"]
+        for _ in range(columns - 1):
+            cells.append(f"**{_sentence(rng, 2)}:** {_sentence(rng, rng.randint(3, 14))}<br>{_sentence(rng, 3)}")
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def _list_markdown(rng: random.Random, items: int, depth: int) -> str:
+    lines = []
+    for index in range(items):
+        level = index % max(1, depth)
+        lines.append("  " * level + f"- {_sentence(rng, rng.randint(6, 18))}")
+    return "\n".join(lines)
+
+
+def _meeting_info_slide(rng: random.Random, spec: DeckSpec, order: int) -> dict:
+    info = "\n".join(f"- **{label}** {_sentence(rng, 5)}" for label in ("Event", "Location", "Date | Time", "Moderator"))
+    attendees = ["| Institution | # of Attendees |", "|-------------|----------------|"]
+    attendees += [f"| {_sentence(rng, 3)} \\| Clinic | {rng.randint(1, 4)} |" for _ in range(spec.table_rows)]
+    return {
+        "slide_type": "meeting_info",
+        "order": order,
+        "title": "MEETING INFORMATION",
+        "body": [
+            {"component": "meeting_info_text", "content": info},
+            [
+                {"component": "meeting_info_table", "content": "\n".join(attendees), "styles": {"ratio": [3, 1]}},
+                {"component": "map", "content": rng.sample(US_STATE_ABBREVIATIONS, rng.randint(3, 12))},
+            ],
+        ],
+    }
+
+
+def _content_slide(rng: random.Random, spec: DeckSpec, order: int, variant: int) -> dict:
+    if variant == 0:
+        body = [_chart(rng, i) for i in range(max(1, spec.charts_per_slide))]
+    elif variant == 1:
+        body = [
+            {
+                "component": "table",
+                "content": _table_markdown(rng, spec.table_rows, spec.table_columns),
+                "styles": {"fontSize": 11, "ratio": [1] + [3] * (spec.table_columns - 1)},
+            },
+            {"component": "list", "content": _list_markdown(rng, spec.list_items, spec.list_depth), "styles": {"fontSize": 16}},
+        ]
+    else:
+        body = [
+            {"component": "text", "content": f"<p><b>{_sentence(rng, 3)}</b> {_sentence(rng, 30)}</p>"},
+            {"component": "list", "content": _list_markdown(rng, spec.list_items, spec.list_depth)},
+        ]
+    return {"slide_type": "content", "order": order, "title": _sentence(rng, 3), "body": body}
+
+
+def generate_deck(spec: DeckSpec) -> dict:
+    """Return {"deck": {...}} with spec.slides slides cycling through every slide and component type."""
+
+    rng = random.Random(spec.seed)
+    slides = []
+    for order in range(1, spec.slides + 1):
+        position = (order - 1) % 5
+        if position == 0:
+            slides.append({"slide_type": "title_only", "order": order, "title": _sentence(rng, 8)})
+        elif position == 1:
+            slides.append(_meeting_info_slide(rng, spec, order))
+        else:
+            slides.append(_content_slide(rng, spec, order, position - 2))
+    metadata = {"title": "Synthetic benchmark deck", "version": "1.0", "theme_key": "clinical_modern"}
+    if spec.chart_backend:
+        metadata["chart_backend"] = spec.chart_backend
+    if spec.image_format:
+        metadata["image_format"] = spec.image_format
+    if spec.quality:
+        metadata["quality"] = spec.quality
+    return {"deck": {"metadata": metadata, "slides": slides}}
+
+
+def main(argv: list[str] | None = None) -> None:
+    defaults = DeckSpec()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--slides", type=int, default=defaults.slides)
+    parser.add_argument("--charts-per-slide", type=int, default=defaults.charts_per_slide)
+    parser.add_argument("--table-rows", type=int, default=defaults.table_rows)
+    parser.add_argument("--table-columns", type=int, default=defaults.table_columns)
+    parser.add_argument("--list-items", type=int, default=defaults.list_items)
+    parser.add_argument("--list-depth", type=int, default=defaults.list_depth)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--chart-backend", choices=("image", "native"), help="Set metadata.chart_backend.")
+    parser.add_argument("--image-format", choices=("png", "svg"), help="Set metadata.image_format.")
+    parser.add_argument("--quality", choices=("draft", "screen", "print"), help="Set metadata.quality.")
+    parser.add_argument("-o", "--output", type=Path, default=Path("synthetic_deck.json"))
+    args = parser.parse_args(argv)
+
+    spec = DeckSpec(
+        args.slides,
+        args.charts_per_slide,
+        args.table_rows,
+        max(2, args.table_columns),
+        args.list_items,
+        args.list_depth,
+        args.seed,
+        args.chart_backend,
+        args.image_format,
+        args.quality,
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(generate_deck(spec), indent=2), encoding="utf-8")
+    print(f"Wrote {spec.slides} slides to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Time full-document and streamed parsing of a large synthetic deck file.
+
+Run from the repository root:
+
+    python -m Benchmarks.json_load_benchmark --slides 2000 --table-rows 80
+
+orjson and ijson are optional; rows for a parser that is not installed are skipped.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from Benchmarks.deck_generator import DeckSpec, generate_deck
+from Components import json_tools
+
+
+def measure(label: str, parse) -> None:
+    """Run parse() under tracemalloc and print elapsed time, first-slide latency and peak memory."""
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    first_slide, slide_count = parse(start)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<18}{slide_count:>8}{elapsed:>10.2f}{first_slide * 1000:>16.1f}{peak / 1e6:>12.1f}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--slides", type=int, default=2000)
+    parser.add_argument("--table-rows", type=int, default=80)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "deck.json"
+        path.write_text(json.dumps(generate_deck(DeckSpec(slides=args.slides, table_rows=args.table_rows))), encoding="utf-8")
+        print(f"{path.stat().st_size / 1e6:.1f} MB deck, parser backend: {json_tools.json_backend()}")
+        print(f"{'mode':<18}{'slides':>8}{'seconds':>10}{'first slide ms':>16}{'peak MB':>12}")
+
+        def full(parse_bytes):
+            def run(start: float) -> tuple[float, int]:
+                slides = parse_bytes(path.read_bytes())["deck"]["slides"]
+                return time.perf_counter() - start, len(slides)
+
+            return run
+
+        def streamed(start: float) -> tuple[float, int]:
+            _, slide_iter = json_tools.stream_deck(path)
+            first = None
+            count = 0
+            for _ in slide_iter:
+                if first is None:
+                    first = time.perf_counter() - start
+                count += 1
+            return first or 0.0, count
+
+        measure("json.loads", full(json.loads))
+        if json_tools.orjson is not None:
+            measure("orjson.loads", full(json_tools.orjson.loads))
+        try:
+            import ijson  # noqa: F401  # pyright: ignore[reportMissingImports]
+        except ImportError:
+            print("ijson not installed; stream_deck falls back to a full parse")
+        measure("stream_deck", streamed)
+
+
+if __name__ == "__main__":
+    main()
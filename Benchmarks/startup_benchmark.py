@@ -0,0 +1,138 @@
+"""Measure import cost and cold-start build time of the deck generator.
+
+Run from the repository root:
+
+    python -m Benchmarks.startup_benchmark --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("matplotlib", "pandas", "plotly", "numpy", "PIL", "kaleido")
+SAMPLE_DECKS = {
+    "title_only": {
+        "slides": [{"slide_type": "title_only", "order": 1, "title": "Quarterly Review"}],
+    },
+    "text_only": {
+        "slides": [
+            {
+                "slide_type": "content",
+                "order": 1,
+                "title": "Summary",
+                "body": [
+                    {"component": "text", "content": "<p>Plain <b>HTML</b> text</p>"},
+                    {"component": "list", "content": "- First\n- Second\n  - Nested"},
+                ],
+            }
+        ],
+    },
+}
+# Loads the deck in a fresh interpreter, builds it, and reports which heavy modules got imported.
+BUILD_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+main.build_deck(json.loads(sys.argv[1]), sys.argv[2])
+built = time.perf_counter()
+heavy = sorted({name.split(".")[0] for name in sys.modules} & set(json.loads(sys.argv[3])))
+print(json.dumps({"import_s": imported - start, "build_s": built - imported, "heavy_modules": heavy}))
+"""
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """Parse `-X importtime` output into (module, self_us, cumulative_us) rows."""
+
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            _, timings = line.split(":", 1)
+            self_us, cumulative_us, name = timings.split("|")
+            rows.append((name.strip(), int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    return rows
+
+
+def measure_import(module: str) -> dict:
+    """Import one module in a fresh interpreter under -X importtime."""
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    rows = parse_importtime(proc.stderr)
+    top_level = [row for row in rows if row[0] == module]
+    heaviest = sorted(rows, key=lambda row: row[1], reverse=True)[:10]
+    loaded = sorted({row[0].lstrip().split(".")[0] for row in rows} & set(HEAVY_MODULES))
+    return {
+        "module": module,
+        "ok": proc.returncode == 0,
+        "cumulative_ms": round(top_level[-1][2] / 1000, 2) if top_level else None,
+        "heavy_modules": loaded,
+        "heaviest_self_ms": [(name.strip(), round(self_us / 1000, 2)) for name, self_us, _ in heaviest],
+    }
+
+
+def measure_build(name: str, deck: dict, repeat: int) -> dict:
+    """Cold-start build of a sample deck, repeated in fresh interpreters."""
+
+    samples = []
+    heavy: list[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / f"{name}.pptx"
+        for _ in range(repeat):
+            proc = subprocess.run(
+                [sys.executable, "-c", BUILD_SNIPPET, json.dumps(deck), str(output), json.dumps(HEAVY_MODULES)],
+                cwd=REPO_ROOT,
+                capture_output=True,
+                text=True,
+            )
+            if proc.returncode != 0:
+                return {"deck": name, "ok": False, "error": proc.stderr.strip().splitlines()[-1:]}
+            result = json.loads(proc.stdout.strip().splitlines()[-1])
+            samples.append(result["import_s"] + result["build_s"])
+            heavy = result["heavy_modules"]
+    return {
+        "deck": name,
+        "ok": True,
+        "median_s": round(statistics.median(samples), 4),
+        "min_s": round(min(samples), 4),
+        "heavy_modules": heavy,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per sample deck.")
+    parser.add_argument("--json", type=Path, help="Also write the results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    results = {
+        "imports": [measure_import(module) for module in ("main", "Components.chart_tools", "Components.map_tools")],
+        "builds": [measure_build(name, deck, args.repeat) for name, deck in SAMPLE_DECKS.items()],
+    }
+    for entry in results["imports"]:
+        status = "" if entry["ok"] else "  (import failed)"
+        print(f"import {entry['module']:<24} {entry['cumulative_ms']} ms  heavy={entry['heavy_modules']}{status}")
+    for entry in results["builds"]:
+        if entry["ok"]:
+            print(f"build  {entry['deck']:<24} {entry['median_s']:.3f} s median  heavy={entry['heavy_modules']}")
+        else:
+            print(f"build  {entry['deck']:<24} failed: {entry['error']}")
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Per-table parse time of Components.table_parser on large HTML and markdown tables.
+
+Run from the repository root:
+
+    python -m Benchmarks.table_parse_benchmark --rows 100 1000 10000
+    python -m Benchmarks.table_parse_benchmark --check-inline
+
+--check-inline checks how cell text with stray emphasis markers is split into runs and fails on
+the first case that renders differently.
+"""
+
+import argparse
+import time
+from io import StringIO
+
+from Components.inline_markdown import parse_inline
+from Components.table_parser import parse_table
+
+COLUMNS = 8
+# Cell text -> (drawn text, italic text). Markers that do not hug a word stay literal.
+INLINE_CASES = {
+    "5*3*2": ("5*3*2", ""),
+    "*Note": ("*Note", ""),
+    "a * b *": ("a * b *", ""),
+    "snake_case_name": ("snake_case_name", ""),
+    "*italic* text": ("italic text", "italic"),
+    "an _italic_ word": ("an italic word", "italic"),
+    "(*aside*)": ("(aside)", "aside"),
+    "**bold** and *both*": ("bold and both", "both"),
+}
+
+
+def make_html_table(rows: int, columns: int = COLUMNS) -> str:
+    """Build an HTML table with a thead, <br> cells and one colspan per 10 rows."""
+
+    header = "".join(f"<th>Column {c}</th>" for c in range(columns))
+    body = []
+    for r in range(rows):
+        if r % 10 == 0:
+            cells = f'<td colspan="2">Span {r}</td>' + "".join(f"<td>r{r}c{c}</td>" for c in range(2, columns))
+        else:
+            cells = "".join(f"<td>Row {r}<br>cell {c}</td>" for c in range(columns))
+        body.append(f"<tr>{cells}</tr>")
+    return f"<table><thead><tr>{header}</tr></thead><tbody>{''.join(body)}</tbody></table>"
+
+
+def make_markdown_table(rows: int, columns: int = COLUMNS) -> str:
+    """Build a markdown table with escaped pipes and bold runs."""
+
+    lines = ["| " + " | ".join(f"Column {c}" for c in range(columns)) + " |"]
+    lines.append("|" + "|".join("---" for _ in range(columns)) + "|")
+    for r in range(rows):
+        lines.append("| " + " | ".join(f"**r{r}** c{c} \\| x" for c in range(columns)) + " |")
+    return "\n".join(lines)
+
+
+def best_of(func, content: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(content)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _pandas_read_html():
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    return lambda content: pd.read_html(StringIO(content))
+
+
+def check_inline_markdown() -> list[str]:
+    """Return a message for every INLINE_CASES entry whose runs differ from the expected text."""
+
+    failures = []
+    for text, expected in INLINE_CASES.items():
+        runs = parse_inline(text)
+        actual = ("".join(run.text for run in runs), "".join(run.text for run in runs if run.italic))
+        if actual != expected:
+            failures.append(f"{text!r}: expected {expected!r}, got {actual!r}")
+    return failures
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--check-inline", action="store_true", help="Only check inline-markdown emphasis parsing.")
+    args = parser.parse_args(argv)
+
+    if args.check_inline:
+        failures = check_inline_markdown()
+        print(f"inline markdown: {len(INLINE_CASES) - len(failures)}/{len(INLINE_CASES)} cases pass")
+        for failure in failures:
+            print(f"  {failure}")
+        if failures:
+            raise SystemExit(1)
+        return
+
+    read_html = _pandas_read_html()
+    print(f"{'format':<10}{'rows':>8}{'parse_table ms':>18}{'pandas ms':>12}")
+    for rows in args.rows:
+        html = make_html_table(rows)
+        markdown = make_markdown_table(rows)
+        html_ms = best_of(parse_table, html, args.repeat) * 1000
+        pandas_ms = "n/a"
+        if read_html is not None:
+            try:
+                pandas_ms = f"{best_of(read_html, html, args.repeat) * 1000:.2f}"
+            except Exception as exc:
+                pandas_ms = type(exc).__name__
+        markdown_ms = best_of(parse_table, markdown, args.repeat) * 1000
+        print(f"{'html':<10}{rows:>8}{html_ms:>18.2f}{pandas_ms:>12}")
+        print(f"{'markdown':<10}{rows:>8}{markdown_ms:>18.2f}{'n/a':>12}")
+
+
+if __name__ == "__main__":
+    main()
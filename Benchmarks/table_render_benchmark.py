@@ -0,0 +1,73 @@
+"""Per-table render time of Components.table_tools for growing row counts.
+
+Run from the repository root:
+
+    python -m Benchmarks.table_render_benchmark --rows 10 100 1000
+"""
+
+import argparse
+import time
+
+import aspose.slides as slides  # pyright: ignore[reportMissingModuleSource]
+
+from Benchmarks.table_parse_benchmark import make_markdown_table
+from Components.inline_markdown import parse_inline
+from Components.layout_tools import SlideObject
+from Components.table_tools import render_table
+
+COLUMNS = 8
+SLIDE_WIDTH = 960
+SLIDE_HEIGHT = 540
+STYLE_VARIANTS = {
+    "stripes": {},
+    "cell_colors": {"cell_bg": ["#FFFFFF", "#EEF2FA"], "cell_text_color": ["#10205E", "#333333"]},
+}
+# Status-style cell values; repeated tables cycle through these instead of unique text.
+REPEATED_VALUES = ("1", "Yes", "**No**", "*n/a*", "`OK`")
+
+
+def make_repeated_table(rows: int, columns: int = COLUMNS) -> str:
+    """Build a markdown table whose body cells cycle through a handful of values."""
+
+    lines = ["| " + " | ".join(f"Column {c}" for c in range(columns)) + " |"]
+    lines.append("|" + "|".join("---" for _ in range(columns)) + "|")
+    for r in range(rows):
+        lines.append("| " + " | ".join(REPEATED_VALUES[(r + c) % len(REPEATED_VALUES)] for c in range(columns)) + " |")
+    return "\n".join(lines)
+
+
+def render_once(rows: int, styles: dict, make_table=make_markdown_table) -> float:
+    """Render one table onto a fresh slide and return the seconds spent in render_table."""
+
+    component = {"component": "table", "content": make_table(rows, COLUMNS), "styles": styles}
+    with slides.Presentation() as presentation:
+        slide_object = SlideObject(presentation.slides[0], SLIDE_WIDTH, SLIDE_HEIGHT, chart_columns=1)
+        start = time.perf_counter()
+        render_table(slide_object, component, 20, 20, SLIDE_WIDTH - 40, SLIDE_HEIGHT - 40)
+        return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    # The first table pays for Aspose start-up; keep it out of the timings.
+    render_once(2, {})
+    print(f"{'styles':<14}{'rows':>8}{'cells':>8}{'ms':>12}{'us/cell':>10}")
+    for name, styles in STYLE_VARIANTS.items():
+        for rows in args.rows:
+            best = min(render_once(rows, styles) for _ in range(args.repeat))
+            cells = (rows + 1) * COLUMNS
+            print(f"{name:<14}{rows:>8}{cells:>8}{best * 1000:>12.1f}{best * 1e6 / cells:>10.1f}")
+    for rows in args.rows:
+        best = min(render_once(rows, {}, make_repeated_table) for _ in range(args.repeat))
+        cells = (rows + 1) * COLUMNS
+        print(f"{'repeated':<14}{rows:>8}{cells:>8}{best * 1000:>12.1f}{best * 1e6 / cells:>10.1f}")
+    info = parse_inline.cache_info()
+    print(f"inline markdown cache: {info.hits} hits, {info.misses} misses, {info.currsize} strings")
+
+
+if __name__ == "__main__":
+    main()
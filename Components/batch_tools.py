@@ -0,0 +1,157 @@
+import glob
+import re
+import sys
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+from Components.json_tools import load_path, loads
+
+DECK_NAME_KEYS = ("request_id", "id", "name")
+
+
+class DeckSource(NamedTuple):
+    """One deck found in the batch inputs; payload is None when it could not be read or is streamed from path."""
+
+    name: str
+    origin: str
+    payload: dict | None
+    error: str | None = None
+    path: Path | None = None
+
+
+class DeckResult(NamedTuple):
+    """Outcome of building one deck in a batch run."""
+
+    name: str
+    origin: str
+    output: str | None
+    seconds: float
+    slides: int
+    error: str | None = None
+
+
+def _slugify(value: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", value).strip("._")
+    return slug or "deck"
+
+
+def deck_from_document(document) -> dict:
+    """Accept either {"deck": {...}} or a bare deck object with a slides list."""
+
+    if not isinstance(document, dict):
+        raise ValueError("expected a JSON object")
+    deck = document.get("deck", document)
+    if not isinstance(deck, dict) or not isinstance(deck.get("slides"), list):
+        raise ValueError("missing deck.slides list")
+    return deck
+
+
+def _document_name(document, fallback: str) -> str:
+    if isinstance(document, dict):
+        for key in DECK_NAME_KEYS:
+            value = document.get(key)
+            if isinstance(value, str) and value.strip():
+                return _slugify(value)
+    return fallback
+
+
+def _iter_jsonl(lines, stem: str, origin: str) -> Iterator[DeckSource]:
+    for lineno, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        fallback = f"{stem}_{lineno}"
+        location = f"{origin}:{lineno}"
+        try:
+            document = loads(line)
+            yield DeckSource(_document_name(document, fallback), location, deck_from_document(document))
+        except ValueError as exc:
+            yield DeckSource(fallback, location, None, str(exc))
+
+
+def _iter_file(path: Path, stream: bool = False) -> Iterator[DeckSource]:
+    if path.suffix.lower() == ".jsonl":
+        try:
+            with path.open("r", encoding="utf-8") as fh:
+                yield from _iter_jsonl(fh, _slugify(path.stem), str(path))
+        except OSError as exc:
+            yield DeckSource(_slugify(path.stem), str(path), None, str(exc))
+        return
+
+    if stream:
+        # Parsed slide by slide while the deck is built; read errors surface then.
+        yield DeckSource(_slugify(path.stem), str(path), None, path=path)
+        return
+    try:
+        document = load_path(path)
+        yield DeckSource(_slugify(path.stem), str(path), deck_from_document(document))
+    except (OSError, ValueError) as exc:
+        yield DeckSource(_slugify(path.stem), str(path), None, str(exc))
+
+
+def _expand_input(value: str) -> list[Path]:
+    path = Path(value)
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if p.suffix.lower() in {".json", ".jsonl"})
+    if glob.has_magic(value):
+        return sorted(Path(p) for p in glob.glob(value, recursive=True) if Path(p).is_file())
+    return [path]
+
+
+def iter_deck_sources(inputs: list[str], stream: bool = False) -> Iterator[DeckSource]:
+    """Yield every deck named by the inputs: files, directories, globs, JSONL streams or "-" for stdin.
+
+    With stream=True, .json files are not parsed here; their DeckSource carries the path instead.
+    """
+
+    for value in inputs:
+        if value == "-":
+            yield from _iter_jsonl(sys.stdin, "stdin", "<stdin>")
+            continue
+        paths = _expand_input(value)
+        if not paths:
+            yield DeckSource(_slugify(value), value, None, "no deck files matched")
+        for path in paths:
+            yield from _iter_file(path, stream)
+
+
+def unique_output_path(output_dir: Path, name: str, used: set[str]) -> Path:
+    """Return <output_dir>/<name>.pptx, suffixing a counter when the name was already used."""
+
+    candidate = name
+    counter = 2
+    while candidate in used:
+        candidate = f"{name}_{counter}"
+        counter += 1
+    used.add(candidate)
+    return output_dir / f"{candidate}.pptx"
+
+
+def summarize_results(results: list[DeckResult], total_seconds: float) -> dict:
+    """Build a JSON-friendly summary of a batch run."""
+
+    failures = [r for r in results if r.error]
+    built = [r for r in results if not r.error]
+    return {
+        "decks": len(results),
+        "built": len(built),
+        "failed": len(failures),
+        "total_seconds": round(total_seconds, 3),
+        "deck_seconds": round(sum(r.seconds for r in built), 3),
+        "results": [r._asdict() for r in results],
+    }
+
+
+def format_summary(results: list[DeckResult], total_seconds: float) -> str:
+    """Render a human-readable timing and failure table for a batch run."""
+
+    lines = []
+    width = max([len(r.name) for r in results] + [4])
+    for result in results:
+        status = "FAILED" if result.error else "ok"
+        detail = result.error if result.error else f"{result.slides} slides -> {result.output}"
+        lines.append(f"{result.name:<{width}}  {status:<6}  {result.seconds:8.2f}s  {detail}")
+    failed = sum(1 for r in results if r.error)
+    lines.append(
+        f"{len(results)} deck(s), {len(results) - failed} built, {failed} failed in {total_seconds:.2f}s"
+    )
+    return "\n".join(lines)
@@ -1,13 +1,20 @@
-import matplotlib.pyplot as plt
 import aspose.slides as slides
 from aspose.pydrawing import Color
 from aspose.slides import FillType
+import os
+import threading
 from io import BytesIO
-from matplotlib.patches import Rectangle
 from typing import TYPE_CHECKING
 
+from Components.deck_schema import CHART_BACKENDS
+from Components.image_formats import DEFAULT_IMAGE_FORMAT
+from Components.native_charts import add_native_bar_chart, add_native_donut_chart
+from Components.profiling import profiled
+from Components.raster_quality import DEFAULT_QUALITY, pixels_per_unit
+from Components.render_cache import RenderCache, cache_key
+
 if TYPE_CHECKING:
-    from main import SlideObject
+    from Components.layout_tools import SlideObject
 
 
 CARD_PADDING = 12
@@ -21,6 +28,21 @@ HEIGHT_SCALE = 0.88
 DONUT_SCALE = 1.55
 DONUT_WIDTH_SCALE = 1.3
 DONUT_HEIGHT_SCALE = 1.35
+# Bump whenever _draw_chart_image output changes so stale cached PNGs are ignored.
+CHART_RENDER_VERSION = 1
+
+CHART_IMAGE_CACHES = {
+    "png": RenderCache("charts", suffix=".png"),
+    "svg": RenderCache("charts_svg", suffix=".svg"),
+}
+# Figure DPI; savefig overrides it with the quality profile's DPI for rasters.
+CHART_FIGURE_DPI = 150
+# Fixed salt for Matplotlib's SVG element ids so identical charts produce identical bytes.
+SVG_HASH_SALT = "activeer-charts"
+_SVG_RC_LOCK = threading.Lock()
+# "image" embeds a Matplotlib PNG; "native" builds an editable Aspose chart (CHART_BACKENDS).
+CHART_BACKEND_ENV = "ACTIVEER_CHART_BACKEND"
+DEFAULT_CHART_BACKEND = "image"
 
 def _apply_card_shadow(card: slides.IShape) -> None:  # pyright: ignore[reportAttributeAccessIssue]
     effect = card.effect_format
@@ -31,6 +53,9 @@ def _apply_card_shadow(card: slides.IShape) -> None:  # pyright: ignore[reportAt
     shadow.direction = 45
     shadow.shadow_color.color = Color.from_argb(102, 0, 0, 0)
 
+def _card_name(x: float, y: float) -> str:
+    return f"ChartCard_{int(x)}_{int(y)}"
+
 def _add_card_background(
     slide: slides.ISlide,
     x: float,
@@ -46,7 +71,7 @@ def _add_card_background(
         width + CARD_PADDING * 2,
         height + CARD_PADDING * 2,
     )
-    card.name = f"ChartCard_{int(x)}_{int(y)}"
+    card.name = _card_name(x, y)
     card.fill_format.fill_type = FillType.SOLID
     card.fill_format.solid_fill_color.color = Color.from_argb(255, 242, 242, 242)
     card.line_format.fill_format.fill_type = FillType.SOLID
@@ -57,25 +82,25 @@ def _add_card_background(
     _apply_card_shadow(card)
     return card
 
+@profiled("add_graph")
 def add_graph(
     slide_object: "SlideObject",
     aggregation_payload: dict,
     fallback_name: str,
 ) -> None:
-    """Add a Matplotlib-rendered chart inside an Aspose card."""
+    """Add a chart inside an Aspose card, as a Matplotlib PNG/SVG or a native Aspose chart."""
     if not aggregation_payload:
         return
     card_height = slide_object.get_chart_height()
     x, y = slide_object.get_next_chart_position(card_height)
-    card = _add_card_background(
+    card = slide_object.template_shape(_card_name(x, y)) or _add_card_background(
         slide_object.aspose_object,
         x,
         y,
         slide_object.chart_width,
         card_height,
     )
-    graph_width = slide_object.chart_width + CARD_PADDING * 2
-    graph_height = max(0, card_height - CARD_PADDING * 2)
+    _, graph_height = _graph_area(slide_object.chart_width, card_height)
     graph_x = x - CARD_PADDING
     graph_y = y + (card_height - graph_height) / 2
     chart_title_text = aggregation_payload.get("name", fallback_name).title()
@@ -91,6 +116,107 @@ def add_graph(
         portion.portion_format.font_bold = slides.NullableBool.TRUE
         portion.portion_format.fill_format.fill_type = slides.FillType.SOLID
         portion.portion_format.fill_format.solid_fill_color.color = Color.black
+    width_in, height_in = chart_figure_size(
+        aggregation_payload,
+        slide_object.chart_width,
+        card_height,
+    )
+    final_w, final_h = chart_frame_size(slide_object.chart_width, card_height)
+    shift_left_offset = 0
+    centered_y = graph_y + (graph_height - final_h) / 2
+    if resolve_chart_backend(aggregation_payload, slide_object.context.chart_backend) == "native":
+        _add_native_chart(slide_object, aggregation_payload, graph_x + shift_left_offset, centered_y, final_w, final_h)
+        return
+    image_format = slide_object.context.image_format
+    dpi = chart_raster_dpi(aggregation_payload, slide_object.chart_width, card_height, slide_object.context.quality)
+    chart_bytes = slide_object.context.prerendered.get(
+        chart_image_key(aggregation_payload, width_in, height_in, image_format, dpi)
+    )
+    if chart_bytes is None:
+        chart_bytes = _render_chart_image(
+            aggregation_payload,
+            width_in,
+            height_in,
+            image_format,
+            dpi,
+        )
+    image = slide_object.context.images.add(slide_object.aspose_object.presentation, chart_bytes, image_format)
+    frame = slide_object.aspose_object.shapes.add_picture_frame(
+        slides.ShapeType.RECTANGLE,
+        graph_x + shift_left_offset,
+        centered_y,
+        final_w,
+        final_h,
+        image,
+    )
+    frame.line_format.fill_format.fill_type = FillType.NO_FILL
+    frame.line_format.width = 0
+
+
+def resolve_chart_backend(aggregation_payload: dict, deck_backend: str | None = None) -> str:
+    """Pick the chart backend: component "backend", then deck metadata, then ACTIVEER_CHART_BACKEND."""
+
+    for candidate in (
+        aggregation_payload.get("backend"),
+        deck_backend,
+        os.environ.get(CHART_BACKEND_ENV),
+    ):
+        if isinstance(candidate, str) and candidate.strip().lower() in CHART_BACKENDS:
+            return candidate.strip().lower()
+    return DEFAULT_CHART_BACKEND
+
+
+def _add_native_chart(
+    slide_object: "SlideObject",
+    aggregation_payload: dict,
+    x: float,
+    y: float,
+    width: float,
+    height: float,
+) -> None:
+    """Draw the chart as an editable Aspose chart in the area the PNG would cover."""
+
+    slide = slide_object.aspose_object
+    if aggregation_payload.get("chartType") == "donut_chart":
+        add_native_donut_chart(slide, aggregation_payload, DONUT_COLORS, x, y, width, height)
+    else:
+        add_native_bar_chart(slide, aggregation_payload, BAR_CHART_COLOR, x, y, width, height)
+
+
+def _graph_area(chart_width: float, card_height: float) -> tuple[float, float]:
+    return chart_width + CARD_PADDING * 2, max(0, card_height - CARD_PADDING * 2)
+
+
+def chart_frame_size(chart_width: float, card_height: float) -> tuple[float, float]:
+    """Return the size (points) of the picture frame a chart image is displayed in."""
+
+    graph_width, graph_height = _graph_area(chart_width, card_height)
+    return graph_width, min(graph_height, graph_height * HEIGHT_SCALE)
+
+
+def chart_raster_dpi(
+    aggregation_payload: dict,
+    chart_width: float,
+    card_height: float,
+    quality: str = DEFAULT_QUALITY,
+) -> float:
+    """Return the savefig DPI that renders the chart figure at the quality profile's PPI on its frame."""
+
+    return pixels_per_unit(
+        quality,
+        chart_frame_size(chart_width, card_height),
+        chart_figure_size(aggregation_payload, chart_width, card_height),
+    )
+
+
+def chart_figure_size(
+    aggregation_payload: dict,
+    chart_width: float,
+    card_height: float,
+) -> tuple[float, float]:
+    """Return the Matplotlib figure size (inches) for a chart card of the given size."""
+
+    graph_width, graph_height = _graph_area(chart_width, card_height)
     if aggregation_payload.get("chartType") == "donut_chart":
         graph_width_in = graph_width / INCH_TO_PT
         graph_height_in = graph_height / INCH_TO_PT
@@ -110,39 +236,78 @@ def add_graph(
             min(DESIRED_CHART_HEIGHT_IN, graph_height / INCH_TO_PT)
             * HEIGHT_SCALE
         )
-    final_w_scale = WIDTH_SCALE
-    final_h_scale = HEIGHT_SCALE
-    chart_bytes = _render_chart_image(
-        aggregation_payload,
-        width_in,
-        height_in,
-    )
-    final_w = graph_width
-    final_h = min(graph_height, graph_height * final_h_scale)
-    shift_left_offset = 0
-    centered_y = graph_y + (graph_height - final_h) / 2
-    image = slide_object.aspose_object.presentation.images.add_image(chart_bytes)
-    frame = slide_object.aspose_object.shapes.add_picture_frame(
-        slides.ShapeType.RECTANGLE,
-        graph_x + shift_left_offset,
-        centered_y,
-        final_w,
-        final_h,
-        image,
+    return width_in, height_in
+
+
+def chart_image_key(
+    payload: dict,
+    width_in: float,
+    height_in: float,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
+    dpi: float | None = None,
+) -> str:
+    """Return the content hash of everything that affects a rendered chart image."""
+
+    aggregations = payload.get("aggregations", {}) or {}
+    return cache_key(
+        "chart",
+        CHART_RENDER_VERSION,
+        payload.get("chartType", "horizontal_bar_chart"),
+        [[str(label), value] for label, value in aggregations.items()],
+        payload.get("count_label", "Value"),
+        payload.get("bucket_label", "Category"),
+        round(width_in, 4),
+        round(height_in, 4),
+        image_format,
+        # Vector output does not depend on the raster resolution.
+        None if image_format == "svg" else dpi,
     )
-    frame.line_format.fill_format.fill_type = FillType.NO_FILL
-    frame.line_format.width = 0
 
+
+@profiled("render_chart_image")
 def _render_chart_image(
     payload: dict,
     width_in: float,
     height_in: float,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
+    dpi: float | None = None,
 ) -> BytesIO:
+    """Return chart PNG or SVG bytes, reusing a cached render for identical payload, size, format and DPI."""
+
+    key = chart_image_key(payload, width_in, height_in, image_format, dpi)
+    cache = CHART_IMAGE_CACHES[image_format]
+    cached = cache.get(key)
+    if cached is not None:
+        return BytesIO(cached)
+
+    buf = _draw_chart_image(payload, width_in, height_in, image_format=image_format, dpi=dpi)
+    cache.put(key, buf.getvalue())
+    buf.seek(0)
+    return buf
+
+
+def _draw_chart_image(
+    payload: dict,
+    width_in: float,
+    height_in: float,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
+    dpi: float | None = None,
+) -> BytesIO:
+    # Matplotlib is imported on first chart so decks without charts never load it.
+    import matplotlib
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Circle, Rectangle
+
     aggregations = payload.get("aggregations", {})
     labels = list(aggregations.keys())
     values = list(aggregations.values())
     chart_type = payload.get("chartType", "horizontal_bar_chart")
-    fig, ax = plt.subplots(figsize=(width_in, height_in), dpi=150)
+    buf = BytesIO()
+    # A pyplot-free figure: no global figure manager to close, and nothing shared across threads.
+    fig = Figure(figsize=(width_in, height_in), dpi=CHART_FIGURE_DPI)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
     fig.patch.set_alpha(0)
     if chart_type == "donut_chart":
         ax.axis("off")
@@ -174,7 +339,7 @@ def _render_chart_image(
                 linewidth=2,
             ),
         )
-        centre_circle = plt.Circle((0, 0), 0.25, fc="white")
+        centre_circle = Circle((0, 0), 0.25, fc="white")
         ax.add_artist(centre_circle)
         ax.set_aspect("equal")
         legend_handles = [
@@ -285,8 +450,13 @@ def _render_chart_image(
             top=0.90,
             bottom=0.15,
         )
-    buf = BytesIO()
-    fig.savefig(buf, format="png", transparent=True)
-    plt.close(fig)
+    if image_format == "svg":
+        # rcParams are process-global: hold the lock so no other thread's rc_context
+        # restore can drop the salt while this SVG is written.
+        with _SVG_RC_LOCK, matplotlib.rc_context({"svg.hashsalt": SVG_HASH_SALT}):
+            fig.savefig(buf, format="svg", transparent=True, metadata={"Date": None})
+    else:
+        # dpi only changes the pixel count; the layout is fixed by the figure size in inches.
+        fig.savefig(buf, format=image_format, transparent=True, dpi=dpi or "figure")
     buf.seek(0)
     return buf
@@ -0,0 +1,192 @@
+from Components.chart_tools import chart_figure_size, resolve_chart_backend
+from Components.deck_schema import COMPONENT_KINDS, normalize_deck
+from Components.image_formats import resolve_image_format
+from Components.raster_quality import resolve_quality
+from Components.layout_tools import (
+    SlideObject,
+    _all_charts,
+    chart_grid_slide_object,
+    manual_layout_columns,
+    manual_layout_slide_object,
+    split_stacked_slot,
+)
+from Components.utils import reserve_title_space
+
+
+class ComponentPlan:
+    """One normalized component and the slot rectangle it renders into."""
+
+    __slots__ = ("kind", "payload", "x", "y", "width", "height", "figure_size", "card")
+
+    def __init__(
+        self,
+        kind: str,
+        payload: dict,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        figure_size: tuple[float, float] | None = None,
+        card: tuple[float, float, float, float] | None = None,
+    ):
+        self.kind = kind
+        self.payload = payload
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        # Matplotlib figure size (inches) for charts drawn as images; None for everything else.
+        self.figure_size = figure_size
+        # Chart card content rectangle (x, y, width, height) as add_graph places it; None for non-charts.
+        self.card = card
+
+
+class SlidePlan:
+    """One slide's layout kind, title and components in render order."""
+
+    __slots__ = ("order", "slide_type", "title", "layout", "body", "content_bottom", "components", "source")
+
+    def __init__(
+        self,
+        order,
+        slide_type: str | None,
+        title: str,
+        layout: str,
+        body: list,
+        content_bottom: float,
+        components: list[ComponentPlan],
+        source: dict,
+    ):
+        self.order = order
+        self.slide_type = slide_type
+        self.title = title
+        # "title_only", "chart_grid" or "manual".
+        self.layout = layout
+        # Normalized top-level body items; a list item is a stacked slot.
+        self.body = body
+        self.content_bottom = content_bottom
+        self.components = components
+        # The slide payload as given, for fingerprinting.
+        self.source = source
+
+
+class DeckPlan:
+    """A validated deck: resolved deck options plus every slide plan in order."""
+
+    __slots__ = (
+        "metadata",
+        "slide_width",
+        "slide_height",
+        "chart_backend",
+        "image_format",
+        "quality",
+        "paginate_tables",
+        "slides",
+    )
+
+    def __init__(
+        self,
+        metadata: dict,
+        slide_width: float,
+        slide_height: float,
+        slides: list[SlidePlan],
+    ):
+        self.metadata = metadata
+        self.slide_width = slide_width
+        self.slide_height = slide_height
+        self.chart_backend = metadata.get("chart_backend")
+        self.image_format = resolve_image_format(metadata.get("image_format"))
+        self.quality = resolve_quality(metadata.get("quality"))
+        self.paginate_tables = metadata.get("paginate_tables") is True
+        self.slides = slides
+
+
+def _plan_chart(
+    slide_object: SlideObject,
+    component: dict,
+    deck_backend: str | None,
+) -> ComponentPlan:
+    """Place one chart on the slide object's grid exactly as add_graph will."""
+
+    card_height = slide_object.get_chart_height()
+    x, y = slide_object.get_next_chart_position(card_height)
+    figure_size = None
+    if resolve_chart_backend(component, deck_backend) == "image":
+        figure_size = chart_figure_size(component, slide_object.chart_width, card_height)
+    card = (x, y, slide_object.chart_width, card_height)
+    return ComponentPlan("chart", component, *card, figure_size, card)
+
+
+def _plan_slot(
+    plans: list[ComponentPlan],
+    slide_object: SlideObject,
+    item,
+    x: float,
+    y: float,
+    width: float,
+    height: float,
+    deck_backend: str | None,
+) -> None:
+    if isinstance(item, list):
+        if not item:
+            return
+        for nested, item_x, item_y, item_w, item_h in split_stacked_slot(item, x, y, width, height):
+            _plan_slot(plans, slide_object, nested, item_x, item_y, item_w, item_h, deck_backend)
+        return
+
+    kind = item["component"] if item["component"] in COMPONENT_KINDS else "text"
+    if kind == "chart":
+        with slide_object.chart_slot(x, y, width):
+            chart = _plan_chart(slide_object, item, deck_backend)
+        # The chart keeps the grid's card geometry; the slot is what the renderer is handed.
+        plans.append(ComponentPlan("chart", item, x, y, width, height, chart.figure_size, chart.card))
+    else:
+        plans.append(ComponentPlan(kind, item, x, y, width, height))
+
+
+def _plan_slide(
+    slide_payload: dict,
+    body: list,
+    title: str,
+    slide_width: float,
+    slide_height: float,
+    deck_backend: str | None,
+) -> SlidePlan:
+    """Compute the layout and slot rectangles of one validated slide."""
+
+    order = slide_payload.get("order", 0)
+    slide_type = slide_payload.get("slide_type")
+    if slide_type == "title_only":
+        return SlidePlan(order, slide_type, title, "title_only", [], 0.0, [], slide_payload)
+
+    if _all_charts(body):
+        slide_object = chart_grid_slide_object(None, slide_width, slide_height, body)
+        if title:
+            reserve_title_space(slide_object)
+        plans = [_plan_chart(slide_object, component, deck_backend) for component in body]
+        return SlidePlan(
+            order, slide_type, title, "chart_grid", body, slide_object.last_bottom_y, plans, slide_payload
+        )
+
+    slide_object = manual_layout_slide_object(None, slide_width, slide_height, body)
+    if title:
+        reserve_title_space(slide_object)
+    chart_height = slide_object.get_chart_height()
+    base_y = slide_object.chart_start_y
+    plans: list[ComponentPlan] = []
+    columns = manual_layout_columns(slide_object, len(body), slide_payload.get("column_widths"))
+    for item, (x, col_width) in zip(body, columns):
+        _plan_slot(plans, slide_object, item, x, base_y, col_width, chart_height, deck_backend)
+    return SlidePlan(order, slide_type, title, "manual", body, base_y + chart_height, plans, slide_payload)
+
+
+def compile_deck(deck_payload, slide_width: float, slide_height: float) -> DeckPlan:
+    """Validate and normalize a deck and compute every slot rectangle before any rendering."""
+
+    metadata, validated = normalize_deck(deck_payload)
+    deck_backend = metadata.get("chart_backend")
+    slide_plans = [
+        _plan_slide(slide_payload, body, title, slide_width, slide_height, deck_backend)
+        for slide_payload, body, title in validated
+    ]
+    return DeckPlan(metadata, slide_width, slide_height, slide_plans)
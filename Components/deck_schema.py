@@ -0,0 +1,229 @@
+from numbers import Real
+
+# Values accepted for metadata.chart_backend / a chart's "backend", metadata.image_format and metadata.quality.
+CHART_BACKENDS = ("image", "native")
+IMAGE_FORMATS = ("png", "svg")
+QUALITY_PROFILES = ("draft", "screen", "print")
+CHART_TYPES = ("horizontal_bar_chart", "donut_chart")
+# State codes a map component may highlight, compared upper-cased; also the map renderers' state order.
+US_STATE_ABBREVIATIONS = [
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
+    "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
+    "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
+    "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
+    "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+]
+# Component names with a dedicated renderer; anything else is drawn as HTML text.
+COMPONENT_KINDS = ("chart", "map", "table", "meeting_info_table", "list", "meeting_info_text", "text")
+# Alternate spellings accepted in component styles, mapped to the key the renderers read.
+STYLE_ALIASES = {
+    "font_size": "fontSize",
+    "max_height": "maxHeight",
+    "headerBg": "header_bg",
+    "headerText": "header_text",
+    "borderColor": "border_color",
+    "cellBg": "cell_bg",
+    "cellTextColor": "cell_text_color",
+}
+POSITIVE_NUMBER_STYLES = ("fontSize", "maxHeight")
+COLOR_STYLES = ("header_bg", "header_text", "border_color")
+COLOR_LIST_STYLES = ("cell_bg", "cell_text_color")
+MAX_REPORTED_ERRORS = 20
+
+
+class DeckValidationError(ValueError):
+    """Raised before rendering when a deck does not match the expected schema."""
+
+    def __init__(self, errors: list[str]):
+        self.errors = errors
+        shown = "; ".join(errors[:MAX_REPORTED_ERRORS])
+        more = len(errors) - MAX_REPORTED_ERRORS
+        suffix = f"; ... {more} more" if more > 0 else ""
+        super().__init__(f"invalid deck ({len(errors)} problem{'s' if len(errors) != 1 else ''}): {shown}{suffix}")
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def _is_positive_numbers(value) -> bool:
+    return isinstance(value, list) and bool(value) and all(_is_number(v) and v > 0 for v in value)
+
+
+def _check_choice(errors: list[str], path: str, value, choices: tuple[str, ...]) -> None:
+    if value is not None and (not isinstance(value, str) or value.strip().lower() not in choices):
+        errors.append(f"{path}: expected one of {', '.join(choices)}, got {value!r}")
+
+
+def _normalize_styles(styles, path: str, errors: list[str]) -> dict:
+    """Return styles with aliases folded into their canonical keys, recording type errors."""
+
+    if styles is None:
+        return {}
+    if not isinstance(styles, dict):
+        errors.append(f"{path}: expected an object, got {type(styles).__name__}")
+        return {}
+
+    normalized = {STYLE_ALIASES.get(key, key): value for key, value in styles.items() if key in STYLE_ALIASES}
+    # Canonical spellings win over aliases when both are given.
+    normalized.update((key, value) for key, value in styles.items() if key not in STYLE_ALIASES)
+    for key in POSITIVE_NUMBER_STYLES:
+        value = normalized.get(key)
+        if value is not None and not (_is_number(value) and value > 0):
+            errors.append(f"{path}.{key}: expected a positive number, got {value!r}")
+    ratio = normalized.get("ratio")
+    if ratio is not None and not _is_positive_numbers(ratio):
+        errors.append(f"{path}.ratio: expected a list of positive numbers, got {ratio!r}")
+    paginate = normalized.get("paginate")
+    if paginate is not None and not isinstance(paginate, bool):
+        errors.append(f"{path}.paginate: expected true or false, got {paginate!r}")
+    for key in COLOR_STYLES:
+        value = normalized.get(key)
+        if value is not None and not isinstance(value, str):
+            errors.append(f"{path}.{key}: expected a color string, got {value!r}")
+    for key in COLOR_LIST_STYLES:
+        value = normalized.get(key)
+        if value is not None and not (isinstance(value, list) and all(isinstance(v, str) for v in value)):
+            errors.append(f"{path}.{key}: expected a list of color strings, got {value!r}")
+    return normalized
+
+
+def _normalize_component(component, path: str, errors: list[str]) -> dict | None:
+    """Validate one component object (or bare string) and return its normalized dict."""
+
+    if isinstance(component, str):
+        return {"component": "text", "content": component}
+    if not isinstance(component, dict):
+        errors.append(f"{path}: expected a component object, list or string, got {type(component).__name__}")
+        return None
+
+    kind = component.get("component", "text")
+    if not isinstance(kind, str):
+        errors.append(f"{path}.component: expected a string, got {kind!r}")
+        return None
+    normalized = dict(component)
+    normalized["component"] = kind
+    if "styles" in component:
+        normalized["styles"] = _normalize_styles(component["styles"], f"{path}.styles", errors)
+    content = component.get("content")
+
+    if kind == "chart":
+        aggregations = component.get("aggregations")
+        if not isinstance(aggregations, dict):
+            errors.append(f"{path}.aggregations: expected an object of label -> number")
+        elif not all(_is_number(value) for value in aggregations.values()):
+            errors.append(f"{path}.aggregations: every value must be a number")
+        _check_choice(errors, f"{path}.chartType", component.get("chartType"), CHART_TYPES)
+        _check_choice(errors, f"{path}.backend", component.get("backend"), CHART_BACKENDS)
+        for key in ("name", "bucket_label", "count_label"):
+            if component.get(key) is not None and not isinstance(component[key], str):
+                errors.append(f"{path}.{key}: expected a string")
+    elif kind == "map":
+        if content is None:
+            normalized["content"] = []
+        elif not isinstance(content, list):
+            errors.append(f"{path}.content: expected a list of state abbreviations")
+        else:
+            for index, state in enumerate(content):
+                if not isinstance(state, str) or state.upper() not in US_STATE_ABBREVIATIONS:
+                    errors.append(f"{path}.content[{index}]: expected a US state abbreviation, got {state!r}")
+    elif kind in ("table", "meeting_info_table"):
+        if content is not None and not isinstance(content, (str, list)):
+            errors.append(f"{path}.content: expected markdown or HTML table text")
+        column_widths = component.get("column_widths")
+        if column_widths is not None and not _is_positive_numbers(column_widths):
+            errors.append(f"{path}.column_widths: expected a list of positive numbers")
+    elif content is not None and not isinstance(content, str):
+        errors.append(f"{path}.content: expected a string, got {type(content).__name__}")
+    return normalized
+
+
+def _normalize_slot(item, path: str, errors: list[str]):
+    """Normalize a body item: a component, or a list of items stacked in one slot."""
+
+    if isinstance(item, list):
+        stacked = []
+        for index, nested in enumerate(item):
+            if not nested:
+                continue
+            normalized = _normalize_slot(nested, f"{path}[{index}]", errors)
+            if normalized is not None:
+                stacked.append(normalized)
+        return stacked
+    return _normalize_component(item, path, errors)
+
+
+def _validate_metadata(metadata, errors: list[str]) -> dict:
+    if metadata is None:
+        return {}
+    if not isinstance(metadata, dict):
+        errors.append(f"metadata: expected an object, got {type(metadata).__name__}")
+        return {}
+    _check_choice(errors, "metadata.chart_backend", metadata.get("chart_backend"), CHART_BACKENDS)
+    _check_choice(errors, "metadata.image_format", metadata.get("image_format"), IMAGE_FORMATS)
+    _check_choice(errors, "metadata.quality", metadata.get("quality"), QUALITY_PROFILES)
+    paginate = metadata.get("paginate_tables")
+    if paginate is not None and not isinstance(paginate, bool):
+        errors.append(f"metadata.paginate_tables: expected true or false, got {paginate!r}")
+    return metadata
+
+
+def _validated_slides(deck_payload, errors: list[str]) -> list[tuple[dict, list, str]]:
+    """Return (slide payload, normalized body, title) per valid slide, sorted by order."""
+
+    if not isinstance(deck_payload, dict):
+        errors.append(f"deck: expected an object, got {type(deck_payload).__name__}")
+        return []
+    raw_slides = deck_payload.get("slides", [])
+    if not isinstance(raw_slides, list):
+        errors.append("slides: expected a list")
+        return []
+
+    validated = []
+    for index, slide_payload in enumerate(raw_slides):
+        path = f"slides[{index}]"
+        if not isinstance(slide_payload, dict):
+            errors.append(f"{path}: expected an object, got {type(slide_payload).__name__}")
+            continue
+        order = slide_payload.get("order", 0)
+        if not _is_number(order):
+            errors.append(f"{path}.order: expected a number, got {order!r}")
+        slide_type = slide_payload.get("slide_type")
+        if slide_type is not None and not isinstance(slide_type, str):
+            errors.append(f"{path}.slide_type: expected a string, got {slide_type!r}")
+        title = slide_payload.get("title") or ""
+        if not isinstance(title, str):
+            errors.append(f"{path}.title: expected a string, got {type(title).__name__}")
+            title = ""
+        column_widths = slide_payload.get("column_widths")
+        if column_widths is not None and not _is_positive_numbers(column_widths):
+            errors.append(f"{path}.column_widths: expected a list of positive numbers")
+        raw_body = slide_payload.get("body") or []
+        if not isinstance(raw_body, list):
+            errors.append(f"{path}.body: expected a list of components")
+            continue
+        body = []
+        for position, item in enumerate(raw_body):
+            normalized = _normalize_slot(item, f"{path}.body[{position}]", errors)
+            if normalized is not None:
+                body.append(normalized)
+        validated.append((slide_payload, body, title))
+    validated.sort(key=lambda entry: entry[0].get("order", 0) if _is_number(entry[0].get("order", 0)) else 0)
+    return validated
+
+
+def normalize_deck(deck_payload) -> tuple[dict, list[tuple[dict, list, str]]]:
+    """Return (metadata, [(slide payload, normalized body, title)]) or raise DeckValidationError."""
+
+    errors: list[str] = []
+    metadata = _validate_metadata(deck_payload.get("metadata") if isinstance(deck_payload, dict) else None, errors)
+    slides = _validated_slides(deck_payload, errors)
+    if errors:
+        raise DeckValidationError(errors)
+    return metadata, slides
+
+
+def validate_deck(deck_payload) -> None:
+    """Raise DeckValidationError listing every schema problem in the deck."""
+
+    normalize_deck(deck_payload)
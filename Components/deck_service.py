@@ -0,0 +1,440 @@
+import argparse
+import importlib
+import itertools
+import json
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from Components.batch_tools import deck_from_document
+from Components.deck_schema import validate_deck
+from Components.json_tools import loads
+
+PPTX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = 2
+DEFAULT_QUEUE_LIMIT = 16
+DEFAULT_TIMEOUT_SECONDS = 120.0
+DEFAULT_RECYCLE_AFTER = 50
+DEFAULT_MAX_BODY_BYTES = 64 * 1024 * 1024
+# Imported once per worker process so the first request does not pay for them.
+WARM_MODULES = (
+    "main",
+    "aspose.slides",
+    "matplotlib.figure",
+    "matplotlib.backends.backend_agg",
+    "pandas",
+    "plotly.express",
+)
+
+
+def _warm_worker() -> None:
+    """Pre-import the renderer stack inside a freshly started worker process."""
+
+    for name in WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+
+
+# Set in each worker by _init_worker: the queue on which it reports its pid and the jobs it starts.
+_EVENTS = None
+
+
+def _init_worker(events, generation: int) -> None:
+    """Report a freshly started worker's pid to the service, then pre-import the renderer stack."""
+
+    global _EVENTS
+    _EVENTS = events
+    events.put(("worker", generation, os.getpid()))
+    _warm_worker()
+
+
+def _render_deck_job(job_id: int, deck_payload: dict) -> bytes:
+    """Build one deck inside a worker process and return the PPTX bytes."""
+
+    from main import build_deck_bytes
+
+    if _EVENTS is not None:
+        _EVENTS.put(("job", job_id, os.getpid()))
+    return build_deck_bytes(deck_payload)
+
+
+class _Pool:
+    """One executor generation, with the worker pids and unfinished jobs the service tracks for it."""
+
+    __slots__ = ("executor", "generation", "pids", "jobs", "submitted", "condemned", "terminated")
+
+    def __init__(self, executor: ProcessPoolExecutor, generation: int):
+        self.executor = executor
+        self.generation = generation
+        self.pids: set[int] = set()
+        self.jobs: dict[int, "_Job"] = {}
+        self.submitted = 0
+        # Set once a running job times out: the pool takes no new work and is terminated
+        # as soon as every job still running in it is a timed-out one.
+        self.condemned = False
+        self.terminated = False
+
+
+class _Job:
+    __slots__ = ("job_id", "pool", "future", "started_at", "hung")
+
+    def __init__(self, job_id: int, pool: _Pool):
+        self.job_id = job_id
+        self.pool = pool
+        self.future = None
+        self.started_at: float | None = None
+        self.hung = False
+
+
+class DeckRenderService:
+    """Warm process pool that builds decks with admission control, timeouts and worker recycling."""
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        queue_limit: int = DEFAULT_QUEUE_LIMIT,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        recycle_after: int = DEFAULT_RECYCLE_AFTER,
+    ):
+        self.workers = max(1, workers)
+        self.queue_limit = max(0, queue_limit)
+        self.timeout = timeout
+        self.recycle_after = max(1, recycle_after)
+        # Running plus waiting requests; anything beyond is rejected instead of queued.
+        self._admission = threading.BoundedSemaphore(self.workers + self.queue_limit)
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._context = multiprocessing.get_context("spawn")
+        self._events = self._context.SimpleQueue()
+        self._generations = itertools.count()
+        self._job_ids = itertools.count()
+        self._pools: dict[int, _Pool] = {}
+        self._jobs: dict[int, _Job] = {}
+        self._pool = self._new_pool()
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.recycled = 0
+        self.terminated_pools = 0
+        threading.Thread(target=self._watch_events, name="deck-service-events", daemon=True).start()
+
+    def _new_pool(self) -> _Pool:
+        # Spawned workers start clean (no inherited Aspose state). Recycling is counted here
+        # rather than with max_tasks_per_child, so warm-up tasks do not use up a worker's jobs.
+        generation = next(self._generations)
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self._context,
+            initializer=_init_worker,
+            initargs=(self._events, generation),
+        )
+        pool = self._pools[generation] = _Pool(executor, generation)
+        return pool
+
+    def _warm(self, pool: _Pool) -> list:
+        """Start every worker of a pool; workers spawn lazily, one per submitted task."""
+
+        return [pool.executor.submit(_warm_worker) for _ in range(self.workers)]
+
+    def warm_up(self) -> None:
+        """Start every worker now instead of on the first request."""
+
+        for future in self._warm(self._pool):
+            future.result()
+
+    def _watch_events(self) -> None:
+        """Record worker pids and job start times reported by the workers."""
+
+        while True:
+            event = self._events.get()
+            if event is None:
+                return
+            kind, ident, pid = event
+            with self._changed:
+                if kind == "worker":
+                    pool = self._pools.get(ident)
+                    if pool is not None:
+                        pool.pids.add(pid)
+                else:
+                    job = self._jobs.get(ident)
+                    if job is not None:
+                        job.started_at = time.monotonic()
+                        self._changed.notify_all()
+
+    def _submit(self, deck_payload: dict) -> _Job:
+        """Submit a job to the current pool, retiring the pool once it has run its share of jobs."""
+
+        with self._lock:
+            pool = self._pool
+            pool.submitted += 1
+            fresh = None
+            if pool.submitted >= self.workers * self.recycle_after:
+                # Jobs already in the old pool finish there; later requests go to a fresh one.
+                fresh = self._pool = self._new_pool()
+                self.recycled += 1
+            job = _Job(next(self._job_ids), pool)
+            self._jobs[job.job_id] = pool.jobs[job.job_id] = job
+        job.future = pool.executor.submit(_render_deck_job, job.job_id, deck_payload)
+        job.future.add_done_callback(lambda _: self._job_done(job))
+        if fresh is not None:
+            self._warm(fresh)
+            pool.executor.shutdown(wait=False)
+        return job
+
+    def _job_done(self, job: _Job) -> None:
+        with self._changed:
+            job.pool.jobs.pop(job.job_id, None)
+            self._changed.notify_all()
+            terminate = self._ready_to_terminate(job.pool)
+            if not job.pool.jobs and job.pool is not self._pool:
+                self._pools.pop(job.pool.generation, None)
+        if terminate:
+            self._terminate(job.pool)
+
+    def _ready_to_terminate(self, pool: _Pool) -> bool:
+        # Jobs that never started are requeued when the pool dies, so only started ones are waited for.
+        if not pool.condemned or pool.terminated:
+            return False
+        if any(job.started_at is not None and not job.hung for job in pool.jobs.values()):
+            return False
+        pool.terminated = True
+        return True
+
+    def _wait_started(self, job: _Job) -> None:
+        with self._changed:
+            while job.started_at is None and not job.future.done():
+                self._changed.wait()
+
+    def render(self, deck_payload: dict) -> tuple[HTTPStatus, bytes | str]:
+        """Build a deck, returning (status, PPTX bytes) or (status, error message).
+
+        The timeout runs from when a worker starts the job, not from when it was queued.
+        """
+
+        if not self._admission.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            return HTTPStatus.SERVICE_UNAVAILABLE, "render queue is full"
+
+        with self._lock:
+            self.in_flight += 1
+        try:
+            while True:
+                job = self._submit(deck_payload)
+                try:
+                    self._wait_started(job)
+                    remaining = self.timeout
+                    if job.started_at is not None:
+                        remaining -= time.monotonic() - job.started_at
+                    data = job.future.result(timeout=max(0.0, remaining))
+                except FutureTimeoutError:
+                    self._condemn(job)
+                    with self._lock:
+                        self.timed_out += 1
+                    return HTTPStatus.GATEWAY_TIMEOUT, f"render exceeded {self.timeout:g}s"
+                except (CancelledError, BrokenProcessPool):
+                    if job.pool.condemned and not job.hung:
+                        # Never started, or its pool was retired around a hung job: run it on the current pool.
+                        continue
+                    self._replace_pool(job.pool)
+                    with self._lock:
+                        self.failed += 1
+                    return HTTPStatus.INTERNAL_SERVER_ERROR, "render worker crashed"
+                except Exception as exc:
+                    with self._lock:
+                        self.failed += 1
+                    return HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(exc).__name__}: {exc}"
+                finally:
+                    with self._lock:
+                        self._jobs.pop(job.job_id, None)
+                with self._lock:
+                    self.completed += 1
+                return HTTPStatus.OK, data
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._admission.release()
+
+    def _condemn(self, job: _Job) -> None:
+        """Retire the pool of a job that ran past its timeout.
+
+        A pool worker cannot be cancelled, only killed, and a dead worker breaks the whole
+        pool. So new work goes to a fresh pool and jobs that have not started move to it,
+        while jobs already running finish; then the old pool's workers are terminated.
+        """
+
+        pool = job.pool
+        with self._changed:
+            job.hung = True
+            fresh = None
+            if not pool.condemned:
+                pool.condemned = True
+                if self._pool is pool:
+                    fresh = self._pool = self._new_pool()
+            waiting = [other.future for other in pool.jobs.values() if other.started_at is None]
+            terminate = self._ready_to_terminate(pool)
+        if fresh is not None:
+            self._warm(fresh)
+        for future in waiting:
+            future.cancel()
+        if terminate:
+            self._terminate(pool)
+
+    def _terminate(self, pool: _Pool) -> None:
+        # Pids come from _init_worker, so this needs no executor internals.
+        for pid in pool.pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                continue
+        pool.executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._pools.pop(pool.generation, None)
+            self.terminated_pools += 1
+
+    def _replace_pool(self, broken: _Pool) -> None:
+        with self._lock:
+            fresh = None
+            if self._pool is broken:
+                fresh = self._pool = self._new_pool()
+            self._pools.pop(broken.generation, None)
+        if fresh is not None:
+            self._warm(fresh)
+        broken.executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        """Return request counters for the health endpoint."""
+
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "timeout_seconds": self.timeout,
+                "recycle_after": self.recycle_after,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "recycled": self.recycled,
+                "terminated_pools": self.terminated_pools,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.executor.shutdown(wait=pool is self._pool, cancel_futures=True)
+        self._events.put(None)
+
+
+class DeckRequestHandler(BaseHTTPRequestHandler):
+    """POST /render with deck JSON returns PPTX bytes; GET /health returns service counters."""
+
+    service: DeckRenderService
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str, extra_headers: dict | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: HTTPStatus, payload: dict, extra_headers: dict | None = None) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json", extra_headers)
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path.rstrip("/") == "/health":
+            self._send_json(HTTPStatus.OK, self.service.stats())
+            return
+        self._send_json(HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+    def do_POST(self) -> None:  # noqa: N802
+        if self.path.rstrip("/") != "/render":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "not found"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            length = -1
+        if length <= 0:
+            self._send_json(HTTPStatus.LENGTH_REQUIRED, {"error": "Content-Length required"})
+            return
+        if length > self.max_body_bytes:
+            self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "deck payload too large"})
+            return
+
+        try:
+            deck_payload = deck_from_document(loads(self.rfile.read(length)))
+            # Reject malformed decks here instead of after a worker has started rendering.
+            validate_deck(deck_payload)
+        except ValueError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+
+        start = time.perf_counter()
+        status, result = self.service.render(deck_payload)
+        elapsed = f"{time.perf_counter() - start:.3f}"
+        if status == HTTPStatus.OK:
+            self._send(status, result, PPTX_CONTENT_TYPE, {"X-Render-Seconds": elapsed})
+            return
+        headers = {"Retry-After": "1"} if status == HTTPStatus.SERVICE_UNAVAILABLE else None
+        self._send_json(status, {"error": result}, headers)
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: int = DEFAULT_WORKERS,
+    queue_limit: int = DEFAULT_QUEUE_LIMIT,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    recycle_after: int = DEFAULT_RECYCLE_AFTER,
+) -> None:
+    """Run the deck rendering HTTP service until interrupted."""
+
+    service = DeckRenderService(workers, queue_limit, timeout, recycle_after)
+    service.warm_up()
+    handler = type("BoundDeckRequestHandler", (DeckRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"Deck render service listening on http://{host}:{port} with {service.workers} worker(s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point: python -m Components.deck_service."""
+
+    parser = argparse.ArgumentParser(description="Serve deck builds over HTTP from a warm worker pool.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent deck builds.")
+    parser.add_argument("--queue-limit", type=int, default=DEFAULT_QUEUE_LIMIT, help="Requests allowed to wait for a worker.")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_SECONDS, help="Per-request timeout in seconds.")
+    parser.add_argument("--recycle-after", type=int, default=DEFAULT_RECYCLE_AFTER, help="Jobs per worker before the pool is replaced.")
+    args = parser.parse_args(argv)
+    serve(args.host, args.port, args.workers, args.queue_limit, args.timeout, args.recycle_after)
+
+
+if __name__ == "__main__":
+    main()
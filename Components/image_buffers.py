@@ -0,0 +1,164 @@
+import io
+import mmap
+import os
+import tempfile
+import threading
+from typing import BinaryIO
+
+# Rendered images kept in process memory per build; past this they are spilled to a mapped file.
+IMAGE_BUFFER_MAX_BYTES_ENV = "ACTIVEER_IMAGE_BUFFER_MAX_BYTES"
+DEFAULT_MAX_RESIDENT_BYTES = 32 * 1024 * 1024
+# Images at least this large skip memory and go straight to the spill file.
+SPILL_MIN_BYTES = 1024 * 1024
+
+_SPILL_TOTALS = {"spilled": 0, "spilled_bytes": 0, "peak_resident_bytes": 0}
+_SPILL_LOCK = threading.Lock()
+
+
+def _env_max_resident_bytes() -> int:
+    try:
+        return int(os.environ.get(IMAGE_BUFFER_MAX_BYTES_ENV, DEFAULT_MAX_RESIDENT_BYTES))
+    except ValueError:
+        return DEFAULT_MAX_RESIDENT_BYTES
+
+
+class _MappedReader(io.RawIOBase):
+    """Read-only, seekable stream over one image's byte range of a memory-mapped spill file."""
+
+    def __init__(self, mapped: mmap.mmap, offset: int, length: int):
+        self._mapped = mapped
+        self._start = offset
+        self._end = offset + length
+        self._pos = offset
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = min(len(buffer), self._end - self._pos)
+        if count <= 0:
+            return 0
+        buffer[:count] = self._mapped[self._pos:self._pos + count]
+        self._pos += count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: self._start, io.SEEK_CUR: self._pos, io.SEEK_END: self._end}[whence]
+        self._pos = min(max(base + offset, self._start), self._end)
+        return self._pos - self._start
+
+    def tell(self) -> int:
+        return self._pos - self._start
+
+
+class ImageBuffers:
+    """Rendered image bytes by key, resident up to a byte cap and spilled to a memory-mapped temp file past it.
+
+    get() hands out a fresh stream per call: a BytesIO for resident images, or a buffered reader
+    over the mapped spill file, so Aspose reads spilled images without copying them into the heap.
+    """
+
+    def __init__(self, max_resident_bytes: int | None = None, spill_min_bytes: int = SPILL_MIN_BYTES):
+        self.max_resident_bytes = _env_max_resident_bytes() if max_resident_bytes is None else max_resident_bytes
+        self.spill_min_bytes = spill_min_bytes
+        self._resident: dict[str, bytes] = {}
+        self._spilled: dict[str, tuple[int, int]] = {}
+        self._spill_file = None
+        self._spill_size = 0
+        self._mapped: mmap.mmap | None = None
+        self._mapped_size = 0
+        # Mappings replaced by a remap; readers handed out earlier may still use them until close().
+        self._retired_maps: list[mmap.mmap] = []
+        self._lock = threading.Lock()
+        self.resident_bytes = 0
+        self.peak_resident_bytes = 0
+        self.spilled_bytes = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._resident or key in self._spilled
+
+    def __len__(self) -> int:
+        return len(self._resident) + len(self._spilled)
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store data under key, in memory while under the cap and in the spill file otherwise."""
+
+        with self._lock:
+            if key in self._resident or key in self._spilled:
+                return
+            if len(data) < self.spill_min_bytes and self.resident_bytes + len(data) <= self.max_resident_bytes:
+                self._resident[key] = data
+                self.resident_bytes += len(data)
+                self.peak_resident_bytes = max(self.peak_resident_bytes, self.resident_bytes)
+                return
+            if self._spill_file is None:
+                self._spill_file = tempfile.TemporaryFile(prefix="activeer-images-")
+            self._spill_file.seek(self._spill_size)
+            self._spill_file.write(data)
+            self._spilled[key] = (self._spill_size, len(data))
+            self._spill_size += len(data)
+            self.spilled_bytes += len(data)
+        with _SPILL_LOCK:
+            _SPILL_TOTALS["spilled"] += 1
+            _SPILL_TOTALS["spilled_bytes"] += len(data)
+
+    def get(self, key: str) -> BinaryIO | None:
+        """Return a stream over the image stored under key, or None if there is none."""
+
+        with self._lock:
+            data = self._resident.get(key)
+            if data is not None:
+                return io.BytesIO(data)
+            location = self._spilled.get(key)
+            if location is None:
+                return None
+            if self._mapped is None or self._mapped_size < self._spill_size:
+                # Remap after appends; readers already handed out keep the mapping they were given.
+                self._spill_file.flush()
+                if self._mapped is not None:
+                    self._retired_maps.append(self._mapped)
+                self._mapped = mmap.mmap(self._spill_file.fileno(), self._spill_size, access=mmap.ACCESS_READ)
+                self._mapped_size = self._spill_size
+            return io.BufferedReader(_MappedReader(self._mapped, *location))
+
+    def close(self) -> None:
+        """Drop resident images, unmap the spill file and delete it."""
+
+        with self._lock:
+            with _SPILL_LOCK:
+                _SPILL_TOTALS["peak_resident_bytes"] = max(
+                    _SPILL_TOTALS["peak_resident_bytes"], self.peak_resident_bytes
+                )
+            self._resident.clear()
+            self._spilled.clear()
+            for mapped in self._retired_maps + [self._mapped]:
+                if mapped is not None:
+                    mapped.close()
+            self._retired_maps.clear()
+            self._mapped = None
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+            self._spill_size = self._mapped_size = self.resident_bytes = 0
+
+    def stats(self) -> dict:
+        """Return resident/spilled counters for this build."""
+
+        with self._lock:
+            return {
+                "resident": len(self._resident),
+                "resident_bytes": self.resident_bytes,
+                "peak_resident_bytes": self.peak_resident_bytes,
+                "spilled": len(self._spilled),
+                "spilled_bytes": self.spilled_bytes,
+            }
+
+
+def image_buffer_stats() -> dict:
+    """Return spill counters summed over every ImageBuffers in this process, with the largest resident peak."""
+
+    with _SPILL_LOCK:
+        return dict(_SPILL_TOTALS)
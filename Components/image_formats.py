@@ -0,0 +1,110 @@
+import hashlib
+import os
+import threading
+from io import BytesIO
+from typing import BinaryIO
+
+import aspose.slides as slides  # pyright: ignore[reportMissingModuleSource]
+
+from Components.deck_schema import IMAGE_FORMATS
+
+# IMAGE_FORMATS: "png" embeds rasters; "svg" embeds vector drawings through Aspose's SvgImage.
+IMAGE_FORMAT_ENV = "ACTIVEER_IMAGE_FORMAT"
+DEFAULT_IMAGE_FORMAT = "png"
+
+# Read size when hashing a non-BytesIO image stream, e.g. one over a spilled image.
+DIGEST_CHUNK_BYTES = 1024 * 1024
+
+_DEDUP_TOTALS = {"added": 0, "reused": 0, "bytes_added": 0, "bytes_saved": 0}
+_DEDUP_LOCK = threading.Lock()
+
+
+def resolve_image_format(deck_format: str | None = None) -> str:
+    """Pick the chart/map image format: deck metadata, then ACTIVEER_IMAGE_FORMAT, then PNG."""
+
+    for candidate in (deck_format, os.environ.get(IMAGE_FORMAT_ENV)):
+        if isinstance(candidate, str) and candidate.strip().lower() in IMAGE_FORMATS:
+            return candidate.strip().lower()
+    return DEFAULT_IMAGE_FORMAT
+
+
+def add_presentation_image(
+    presentation: slides.Presentation,  # pyright: ignore[reportAttributeAccessIssue]
+    data: BinaryIO,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
+):
+    """Add rendered chart/map bytes to the presentation image collection and return the PPImage."""
+
+    if image_format == "svg":
+        return presentation.images.add_image(slides.SvgImage(data))
+    return presentation.images.add_image(data)
+
+
+def _stream_digest(data: BinaryIO) -> tuple[bytes, int]:
+    """Return (sha256 digest, size) of a stream's bytes without copying them, leaving it rewound."""
+
+    if isinstance(data, BytesIO):
+        with data.getbuffer() as view:
+            return hashlib.sha256(view).digest(), len(view)
+    digest = hashlib.sha256()
+    size = 0
+    data.seek(0)
+    while chunk := data.read(DIGEST_CHUNK_BYTES):
+        digest.update(chunk)
+        size += len(chunk)
+    data.seek(0)
+    return digest.digest(), size
+
+
+class ImageRegistry:
+    """Per-presentation map from rendered image bytes to the PPImage already embedded for them."""
+
+    def __init__(self):
+        self._images: dict[tuple[str, bytes], object] = {}
+        self.added = 0
+        self.reused = 0
+        self.bytes_added = 0
+        self.bytes_saved = 0
+
+    def add(
+        self,
+        presentation: slides.Presentation,  # pyright: ignore[reportAttributeAccessIssue]
+        data: BinaryIO,
+        image_format: str = DEFAULT_IMAGE_FORMAT,
+    ):
+        """Return the PPImage for data, embedding it only the first time identical bytes are seen."""
+
+        digest, size = _stream_digest(data)
+        key = (image_format, digest)
+        image = self._images.get(key)
+        reused = image is not None
+        if not reused:
+            image = add_presentation_image(presentation, data, image_format)
+            self._images[key] = image
+            self.added += 1
+            self.bytes_added += size
+        else:
+            self.reused += 1
+            self.bytes_saved += size
+
+        with _DEDUP_LOCK:
+            _DEDUP_TOTALS["reused" if reused else "added"] += 1
+            _DEDUP_TOTALS["bytes_saved" if reused else "bytes_added"] += size
+        return image
+
+    def stats(self) -> dict:
+        """Return embed/reuse counters for this presentation."""
+
+        return {
+            "added": self.added,
+            "reused": self.reused,
+            "bytes_added": self.bytes_added,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+def image_dedup_stats() -> dict:
+    """Return embed/reuse counters summed over every ImageRegistry in this process."""
+
+    with _DEDUP_LOCK:
+        return dict(_DEDUP_TOTALS)
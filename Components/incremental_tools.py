@@ -0,0 +1,114 @@
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from Components.chart_tools import CHART_RENDER_VERSION, resolve_chart_backend
+from Components.map_tools import MAP_RENDER_VERSION, _resolve_renderer
+from Components.render_cache import cache_key
+
+if TYPE_CHECKING:
+    from Components.deck_plan import DeckPlan
+
+# Bump whenever slide layout or component styling changes so every slide is rebuilt once.
+SLIDE_RENDER_VERSION = 1
+MANIFEST_SUFFIX = ".slides.json"
+
+
+class SlideRecord(NamedTuple):
+    """Where one payload's slides live in a built PPTX."""
+
+    fingerprint: str
+    index: int
+    count: int
+
+
+def renderer_version() -> list[int]:
+    """Return the version stamps that invalidate previously built slides."""
+
+    return [SLIDE_RENDER_VERSION, CHART_RENDER_VERSION, MAP_RENDER_VERSION]
+
+
+def render_settings(deck_plan: "DeckPlan") -> dict:
+    """Return the resolved deck-wide render settings, including those that come from ACTIVEER_* variables."""
+
+    return {
+        "quality": deck_plan.quality,
+        "image_format": deck_plan.image_format,
+        "chart_backend": resolve_chart_backend({}, deck_plan.chart_backend),
+        "map_renderer": _resolve_renderer(None, deck_plan.image_format),
+    }
+
+
+def slide_fingerprint(
+    slide_payload: dict,
+    deck_metadata: dict | None = None,
+    settings: dict | None = None,
+) -> str:
+    """Hash a slide payload (ignoring its position) with deck metadata, render settings and renderer versions."""
+
+    content = {key: value for key, value in slide_payload.items() if key != "order"}
+    return cache_key("slide", renderer_version(), deck_metadata or {}, settings or {}, content)
+
+
+def manifest_path(output_path: Path | str) -> Path:
+    """Return the fingerprint manifest stored next to a built deck."""
+
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.name + MANIFEST_SUFFIX)
+
+
+def deck_signature(output_path: Path | str) -> dict | None:
+    """Return the size and mtime of a built PPTX, which its manifest must match to be reused."""
+
+    try:
+        stat = Path(output_path).stat()
+    except OSError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def remove_manifest(output_path: Path | str) -> None:
+    """Delete the manifest next to output_path, before anything else overwrites that PPTX."""
+
+    manifest_path(output_path).unlink(missing_ok=True)
+
+
+def load_manifest(output_path: Path | str) -> dict[str, SlideRecord]:
+    """Return fingerprint -> SlideRecord for the previous build, or {} if it cannot be reused."""
+
+    signature = deck_signature(output_path)
+    if signature is None:
+        return {}
+    try:
+        data = json.loads(manifest_path(output_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("renderer_version") != renderer_version():
+        return {}
+    # A PPTX written after the manifest (another build, a hand edit) no longer has these slide indices.
+    if data.get("pptx") != signature:
+        return {}
+
+    records: dict[str, SlideRecord] = {}
+    for entry in data.get("slides", []):
+        try:
+            record = SlideRecord(str(entry["fingerprint"]), int(entry["index"]), int(entry["count"]))
+        except (KeyError, TypeError, ValueError):
+            return {}
+        records.setdefault(record.fingerprint, record)
+    return records
+
+
+def save_manifest(output_path: Path | str, records: list[SlideRecord]) -> None:
+    """Write the fingerprint manifest for a freshly built deck, atomically and tied to its PPTX."""
+
+    data = {
+        "renderer_version": renderer_version(),
+        "pptx": deck_signature(output_path),
+        "slides": [record._asdict() for record in records],
+    }
+    path = manifest_path(output_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
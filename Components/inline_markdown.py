@@ -0,0 +1,64 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+# Distinct strings kept compiled; table cells repeat the same few values ("1", "Yes") thousands of times.
+INLINE_CACHE_SIZE = 8192
+# Alternatives are tried left to right, so inline code wins over emphasis markers inside it.
+# Single-marker emphasis needs text hugging both markers and no word character outside them,
+# so "5*3*2", "*Note" and "a * b *" stay literal.
+_INLINE_RE = re.compile(
+    r"`(?P<code>[^`]+)`"
+    r"|\*\*(?P<bold>.+?)\*\*"
+    r"|\[(?P<label>[^\]]+)\]\((?P<url>[^)\s]+)\)"
+    r"|(?<!\w)\*(?=\S)(?P<star>.+?)(?<=\S)\*(?!\w)"
+    r"|(?<!\w)_(?=\S)(?P<under>.+?)(?<=\S)_(?!\w)"
+)
+
+
+class Run(NamedTuple):
+    """A stretch of inline-markdown text drawn with one set of font attributes."""
+
+    text: str
+    bold: bool = False
+    italic: bool = False
+    code: bool = False
+    link: str | None = None
+
+    @property
+    def styled(self) -> bool:
+        return self.bold or self.italic or self.code or self.link is not None
+
+
+def _runs(text: str, bold: bool, italic: bool, link: str | None) -> list[Run]:
+    runs: list[Run] = []
+    pos = 0
+    for match in _INLINE_RE.finditer(text):
+        if match.start() > pos:
+            runs.append(Run(text[pos:match.start()], bold, italic, False, link))
+        if match.group("code") is not None:
+            runs.append(Run(match.group("code"), bold, italic, True, link))
+        elif match.group("bold") is not None:
+            runs.extend(_runs(match.group("bold"), True, italic, link))
+        elif match.group("label") is not None:
+            runs.extend(_runs(match.group("label"), bold, italic, match.group("url")))
+        else:
+            runs.extend(_runs(match.group("star") or match.group("under"), bold, True, link))
+        pos = match.end()
+    if pos < len(text):
+        runs.append(Run(text[pos:], bold, italic, False, link))
+    return runs
+
+
+@lru_cache(maxsize=INLINE_CACHE_SIZE)
+def parse_inline(text: str) -> tuple[Run, ...]:
+    """Split a line of inline markdown (**bold**, *italic*, `code`, [links](url)) into runs."""
+
+    return tuple(run for run in _runs(text, False, False, None) if run.text)
+
+
+@lru_cache(maxsize=INLINE_CACHE_SIZE)
+def plain_text(text: str) -> str:
+    """Return a line of inline markdown as it is drawn, without markers or link targets."""
+
+    return "".join(run.text for run in parse_inline(text))
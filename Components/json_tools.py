@@ -0,0 +1,71 @@
+import json
+from pathlib import Path
+from typing import Iterator
+
+# orjson parses bytes several times faster than the standard library; both raise
+# ValueError subclasses on bad input, so callers handle either the same way.
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    orjson = None
+
+
+def json_backend() -> str:
+    """Return the name of the parser loads() uses."""
+
+    return "orjson" if orjson is not None else "json"
+
+
+def loads(data: bytes | str):
+    """Parse a JSON document with orjson when installed, else the standard library."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_path(path: Path):
+    """Parse a JSON file, handing the raw bytes straight to the parser."""
+
+    return loads(path.read_bytes())
+
+
+def _deck_prefix(ijson, path: Path) -> str:
+    """Return the ijson prefix of the deck object: "deck" for {"deck": {...}}, "" for a bare deck."""
+
+    with path.open("rb") as fh:
+        for prefix, event, value in ijson.parse(fh):
+            if prefix == "" and event == "map_key" and value in ("deck", "slides"):
+                return "deck" if value == "deck" else ""
+    return "deck"
+
+
+def _join(prefix: str, key: str) -> str:
+    return f"{prefix}.{key}" if prefix else key
+
+
+def _iter_items(ijson, path: Path, prefix: str) -> Iterator:
+    with path.open("rb") as fh:
+        yield from ijson.items(fh, prefix, use_float=True)
+
+
+def stream_deck(path: Path) -> tuple[dict, Iterator[dict]]:
+    """Return (metadata, slides) for a deck file, yielding slides one at a time as they are parsed.
+
+    Uses ijson when installed so only one slide is held in memory at a time; without it the
+    whole file is parsed up front and its slides are yielded from the parsed document.
+    """
+
+    try:
+        import ijson  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        document = load_path(path)
+        deck = document.get("deck", document) if isinstance(document, dict) else document
+        if not isinstance(deck, dict) or not isinstance(deck.get("slides"), list):
+            raise ValueError("missing deck.slides list")
+        return deck.get("metadata") or {}, iter(deck["slides"])
+
+    prefix = _deck_prefix(ijson, path)
+    # Stops reading as soon as metadata is found, so it is cheap when metadata precedes slides.
+    metadata = next(_iter_items(ijson, path, _join(prefix, "metadata")), None) or {}
+    return metadata, _iter_items(ijson, path, _join(prefix, "slides.item"))
@@ -0,0 +1,233 @@
+import math
+from contextlib import contextmanager
+
+import aspose.slides as slides  # pyright: ignore[reportMissingModuleSource]
+
+from Components.image_buffers import ImageBuffers
+from Components.image_formats import ImageRegistry
+
+CARD_PADDING = 12
+INCH_TO_PT = 72
+SHAPE_MAX_HEIGHT_IN = 7
+SHAPE_MAX_HEIGHT = SHAPE_MAX_HEIGHT_IN * INCH_TO_PT
+CARD_MAX_HEIGHT_IN = 5.2
+CARD_MAX_HEIGHT = CARD_MAX_HEIGHT_IN * INCH_TO_PT
+SLOT_GAP = 12
+
+
+class BuildContext:
+    """Deck-wide state shared by every SlideObject of one build."""
+
+    def __init__(
+        self,
+        prerendered: ImageBuffers | None = None,
+        paginate_tables: bool = False,
+        chart_backend: str | None = None,
+        image_format: str = "png",
+        quality: str = "screen",
+    ):
+        # Pre-rendered chart/map images by render key, bounded in memory and spilled to disk past the cap.
+        self.prerendered = prerendered if prerendered is not None else ImageBuffers()
+        self.paginate_tables = paginate_tables
+        self.chart_backend = chart_backend
+        self.image_format = image_format
+        # Raster quality profile ("draft", "screen", "print") that sets chart DPI and map scale.
+        self.quality = quality
+        # Identical chart/map renders share one embedded image part in the PPTX.
+        self.images = ImageRegistry()
+
+    def close(self) -> None:
+        """Release the pre-rendered image buffers once every slide is built."""
+
+        self.prerendered.close()
+
+
+class SlideObject:
+    """State holder for a slide while we build it."""
+
+    def __init__(
+        self,
+        aspose_object: slides.ISlide,
+        slide_width: float,
+        slide_height: float,
+        chart_columns: int = 3,
+        column_gap: float = 60,
+        row_gap: float = 50,
+        total_charts: int = 0,
+        height_cap: float = CARD_MAX_HEIGHT,
+        context: BuildContext | None = None,
+    ):  # pyright: ignore[reportAttributeAccessIssue]
+        self.aspose_object = aspose_object
+        self.context = context or BuildContext()
+        self.title = ""
+        # Slides inserted after this one for content that overflowed it (e.g. paginated tables).
+        self.continuations: list[SlideObject] = []
+        # Prebuilt shapes of the skeleton this slide was cloned from, by shape name.
+        self.template_shapes: dict = {}
+        self.last_right_x = 0
+        self.last_bottom_y = 0
+        self.slide_width = slide_width
+        self.slide_height = slide_height
+        self.left_margin = 20
+        self.chart_columns = max(1, chart_columns)
+        self.column_gap = max(25, column_gap)
+        self.row_gap = max(20, row_gap)
+        self.total_charts = max(1, total_charts)
+        self.max_rows = max(1, math.ceil(self.total_charts / self.chart_columns))
+        self.chart_start_y = 120
+        self.current_column = 0
+        self.current_row = 0
+        self.height_cap = height_cap
+        self.chart_width = (
+            (self.slide_width - self.left_margin * 2)
+            - self.column_gap * (self.chart_columns - 1)
+        ) / self.chart_columns
+
+    def template_shape(self, name: str):
+        """Hand out the skeleton shape with this name once, or None if the slide has none."""
+
+        return self.template_shapes.pop(name, None)
+
+    def get_next_chart_position(self, chart_height: float) -> tuple[float, float]:
+        if self.current_column >= self.chart_columns:
+            self.current_column = 0
+            self.current_row += 1
+        x = self.left_margin + (self.chart_width + self.column_gap) * self.current_column
+        y = self.chart_start_y + self.current_row * (chart_height + self.row_gap)
+        self.current_column += 1
+        self.last_bottom_y = y + chart_height
+        return x, y
+
+    def get_chart_height(self) -> float:
+        """Return a per-row height that keeps all charts within the slide."""
+
+        rows = max(1, self.max_rows)
+        available_height = (
+            self.slide_height
+            - self.chart_start_y
+            - self.row_gap * (rows - 1)
+            - CARD_PADDING * 1  # reduced bottom margin
+        )
+        per_row = available_height / rows if available_height > 0 else 120
+        per_row = min(per_row, self.height_cap)
+        return max(120, per_row)
+
+    @contextmanager
+    def chart_slot(self, x: float, y: float, width: float):
+        """Temporarily point chart positioning at a single slot, restoring the grid afterwards."""
+
+        original_left = self.left_margin
+        original_chart_width = self.chart_width
+        original_chart_start_y = self.chart_start_y
+        self.left_margin = x
+        self.chart_width = width
+        self.chart_start_y = y
+        self.current_column = 0
+        self.current_row = 0
+        try:
+            yield self
+        finally:
+            self.left_margin = original_left
+            self.chart_width = original_chart_width
+            self.chart_start_y = original_chart_start_y
+
+
+def _all_charts(components: list) -> bool:
+    if not components:
+        return False
+    return all(isinstance(c, dict) and c.get("component") == "chart" for c in components)
+
+
+def chart_grid_slide_object(
+    aspose_object,
+    slide_width: float,
+    slide_height: float,
+    components: list,
+    context: BuildContext | None = None,
+) -> SlideObject:
+    """Create the SlideObject used for slides whose body holds only charts."""
+
+    column_count = max(1, len(components))
+    return SlideObject(
+        aspose_object,
+        slide_width,
+        slide_height,
+        chart_columns=column_count,
+        column_gap=35,
+        row_gap=35,
+        total_charts=max(1, len(components)),
+        height_cap=CARD_MAX_HEIGHT,
+        context=context,
+    )
+
+
+def manual_layout_slide_object(
+    aspose_object,
+    slide_width: float,
+    slide_height: float,
+    components: list,
+    context: BuildContext | None = None,
+) -> SlideObject:
+    """Create the SlideObject used for mixed-component slides."""
+
+    return SlideObject(
+        aspose_object,
+        slide_width,
+        slide_height,
+        chart_columns=len(components),
+        column_gap=35,
+        row_gap=35,
+        total_charts=len(components),
+        height_cap=SHAPE_MAX_HEIGHT,
+        context=context,
+    )
+
+
+def manual_layout_columns(
+    slide_object: SlideObject,
+    count: int,
+    column_widths: list | None = None,
+) -> list[tuple[float, float]]:
+    """Return (x, width) for each column of a mixed-component slide."""
+
+    total_gap = slide_object.column_gap * (count - 1)
+    usable_width = slide_object.slide_width - slide_object.left_margin * 2 - total_gap
+    # Equal split unless ratios are provided via column_widths.
+    if isinstance(column_widths, list) and column_widths and all(isinstance(v, (int, float)) and v > 0 for v in column_widths):
+        ratios = column_widths[:count]
+        if len(ratios) < count:
+            ratios += [1.0] * (count - len(ratios))
+        total = sum(ratios) or count
+        widths = [usable_width * r / total for r in ratios]
+    else:
+        widths = [usable_width / max(1, count)] * count
+
+    columns = []
+    for idx, col_width in enumerate(widths):
+        x = slide_object.left_margin + sum(widths[:idx]) + slide_object.column_gap * idx
+        columns.append((x, col_width))
+    return columns
+
+
+def split_stacked_slot(
+    items: list,
+    x: float,
+    y: float,
+    width: float,
+    height: float,
+) -> list[tuple[object, float, float, float, float]]:
+    """Stack nested components vertically inside one slot, returning (item, x, y, width, height)."""
+
+    available_height = height - SLOT_GAP * (len(items) - 1)
+    if len(items) == 2:
+        heights = [available_height * 0.6, available_height * 0.4]
+    else:
+        per = available_height / len(items)
+        heights = [per] * len(items)
+
+    stacked = []
+    current_y = y
+    for item, h in zip(items, heights):
+        stacked.append((item, x, current_y, width, h))
+        current_y += h + SLOT_GAP
+    return stacked
@@ -1,24 +1,124 @@
+import json
+import os
+from functools import lru_cache
 from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from Components.deck_schema import US_STATE_ABBREVIATIONS
+from Components.image_formats import DEFAULT_IMAGE_FORMAT
+from Components.profiling import profiled
+from Components.raster_quality import DEFAULT_QUALITY, pixels_per_unit
+from Components.render_cache import RenderCache, cache_key
 
-US_STATE_ABBREVIATIONS = [
-    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
-    "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
-    "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
-    "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
-    "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
-]
+# numpy, pandas, plotly and Pillow are imported inside the functions that need them
+# so decks without a map never pay for loading them.
+if TYPE_CHECKING:
+    import numpy as np
+    import plotly.graph_objects as go
 
+STATE_INDEX = {state: idx for idx, state in enumerate(US_STATE_ABBREVIATIONS)}
+BASE_STATE_COLOR = "#d1d5d8"
+HIGHLIGHT_STATE_COLOR = "#D9544D"
+NO_STATE_INDEX = 255
+# "mask" composites per-state masks drawn from vendored outlines; "plotly" rasterizes a full figure through kaleido.
+MAP_RENDERER_ENV = "ACTIVEER_MAP_RENDERER"
+DEFAULT_MAP_RENDERER = "mask"
+# Bump whenever map styling changes so cached composites are rebuilt.
+MAP_RENDER_VERSION = 2
+# Census cartographic state boundaries (cb_2016_us_state_500k, public domain), projected once with
+# Albers USA (the projection behind plotly's scope="usa"), simplified and stored in integer units.
+STATE_OUTLINES_PATH = Path(__file__).resolve().parent / "data" / "us_state_outlines.json"
+# Mask-map styling in layout points, matching the plotly choropleth defaults.
+STATE_BORDER_COLOR = "#444444"
+STATE_BORDER_WIDTH = 1
+MAP_BACKGROUND_COLOR = "#ffffff"
+LABEL_FONT_SIZE = 10
+MAP_SUPERSAMPLE = 2
+
+MAP_IMAGE_CACHES = {
+    "png": RenderCache("maps", suffix=".png"),
+    "svg": RenderCache("maps_svg", suffix=".svg"),
+}
+
+
+@profiled("render_map_image")
+def render_map_image(
+    highlight_states: list[str],
+    width: int,
+    height: int,
+    renderer: str | None = None,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
+    scale: float = 1.0,
+) -> BytesIO:
+    """Return a US map PNG or SVG with the given states highlighted.
+
+    width and height are the layout size in points; a PNG has scale times as many pixels per side.
+    """
 
-def render_map_image(highlight_states: list[str], width: int, height: int) -> BytesIO:
     normalized = {s.upper() for s in highlight_states or []}
+    renderer = _resolve_renderer(renderer, image_format)
+    key = map_image_key(highlight_states, width, height, renderer, image_format, scale)
+    cache = MAP_IMAGE_CACHES[image_format]
+    cached = cache.get(key)
+    if cached is not None:
+        return BytesIO(cached)
+
+    if renderer == "plotly":
+        buf = _render_plotly_map(normalized, width, height, image_format, scale)
+    else:
+        buf = _render_mask_map(normalized, width, height, scale)
+    cache.put(key, buf.getvalue())
+    buf.seek(0)
+    return buf
+
+
+def _resolve_renderer(renderer: str | None, image_format: str = DEFAULT_IMAGE_FORMAT) -> str:
+    # The mask atlas is raster-only, so vector maps always come from the plotly figure.
+    if image_format == "svg":
+        return "plotly"
+    return renderer or os.environ.get(MAP_RENDERER_ENV, DEFAULT_MAP_RENDERER)
+
+
+def map_image_key(
+    highlight_states: list[str],
+    width: int,
+    height: int,
+    renderer: str | None = None,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
+    scale: float = 1.0,
+) -> str:
+    """Return the content hash of everything that affects a rendered map image."""
+
+    normalized = sorted({s.upper() for s in highlight_states or []})
+    return cache_key(
+        "map",
+        MAP_RENDER_VERSION,
+        _resolve_renderer(renderer, image_format),
+        normalized,
+        width,
+        height,
+        image_format,
+        # Vector output does not depend on the raster resolution.
+        None if image_format == "svg" else scale,
+    )
+
+
+def map_raster_scale(width: float, height: float, quality: str = DEFAULT_QUALITY) -> float:
+    """Return the render scale that meets the quality profile's PPI for a map shown at width x height points."""
+
+    return pixels_per_unit(quality, (width, height), (int(width), int(height)))
+
+
+def _build_choropleth(highlight_flags: list[int]) -> "go.Figure":
+    import pandas as pd
+    import plotly.express as px
+    import plotly.graph_objects as go
+
     df = pd.DataFrame(
         {
             "state": US_STATE_ABBREVIATIONS,
-            "highlight": [1 if st in normalized else 0 for st in US_STATE_ABBREVIATIONS],
+            "highlight": highlight_flags,
         }
     )
 
@@ -28,7 +128,7 @@ def render_map_image(highlight_states: list[str], width: int, height: int) -> By
         locationmode="USA-states",
         color="highlight",
         scope="usa",
-        color_continuous_scale=["#d1d5d8", "#D9544D"],
+        color_continuous_scale=[BASE_STATE_COLOR, HIGHLIGHT_STATE_COLOR],
         range_color=(0, 1),
     )
     fig.update_layout(
@@ -37,7 +137,6 @@ def render_map_image(highlight_states: list[str], width: int, height: int) -> By
         paper_bgcolor="rgba(0,0,0,0)",
         plot_bgcolor="rgba(0,0,0,0)",
     )
-
     fig.add_trace(
         go.Scattergeo(
             locations=US_STATE_ABBREVIATIONS,
@@ -49,15 +148,156 @@ def render_map_image(highlight_states: list[str], width: int, height: int) -> By
             hoverinfo="skip",
         )
     )
+    return fig
+
 
+def _write_image(
+    fig: "go.Figure",
+    width: int,
+    height: int,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
+    scale: float = 1.0,
+) -> BytesIO:
     buf = BytesIO()
     fig.write_image(
         buf,
-        format="png",
+        format=image_format,
         engine="kaleido",
         width=width,
         height=height,
-        scale=1,
+        scale=scale,
     )
     buf.seek(0)
     return buf
+
+
+def _render_plotly_map(
+    normalized: set[str],
+    width: int,
+    height: int,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
+    scale: float = 1.0,
+) -> BytesIO:
+    """Export the full choropleth through kaleido (reference renderer, and the only vector one)."""
+
+    flags = [1 if st in normalized else 0 for st in US_STATE_ABBREVIATIONS]
+    return _write_image(_build_choropleth(flags), width, height, image_format, scale)
+
+
+@lru_cache(maxsize=1)
+def _state_outlines() -> dict:
+    """Return the vendored outlines: {"width", "height", "states": {code: {"rings", "label"}}} in integer units."""
+
+    with open(STATE_OUTLINES_PATH, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _outline_points(rings: list[list[int]], fit: float, left: float, top: float) -> list[list[tuple[float, float]]]:
+    return [
+        [(left + ring[i] * fit, top + ring[i + 1] * fit) for i in range(0, len(ring), 2)]
+        for ring in rings
+    ]
+
+
+@lru_cache(maxsize=4)
+def _label_font(size: int):
+    from PIL import ImageFont
+
+    return ImageFont.load_default(size=size)
+
+
+def _draw_state_layer(fill: str, size: tuple[int, int], scale: float) -> "np.ndarray":
+    """Draw every state in one fill color, with borders and labels, as an RGBA array of the given pixel size."""
+
+    import numpy as np
+    from PIL import Image, ImageDraw
+
+    outlines = _state_outlines()
+    # Drawn larger and downsampled, since ImageDraw polygons are not anti-aliased.
+    width, height = size[0] * MAP_SUPERSAMPLE, size[1] * MAP_SUPERSAMPLE
+    fit = min(width / outlines["width"], height / outlines["height"])
+    left = (width - outlines["width"] * fit) / 2
+    top = (height - outlines["height"] * fit) / 2
+    # Outlines are stroked inside each polygon, so neighbouring states each draw half the border.
+    line_width = max(1, round(STATE_BORDER_WIDTH * scale * MAP_SUPERSAMPLE / 2))
+
+    image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle(
+        (left, top, left + outlines["width"] * fit, top + outlines["height"] * fit),
+        fill=MAP_BACKGROUND_COLOR,
+    )
+    for state in US_STATE_ABBREVIATIONS:
+        for points in _outline_points(outlines["states"][state]["rings"], fit, left, top):
+            draw.polygon(points, fill=fill, outline=STATE_BORDER_COLOR, width=line_width)
+    image = image.resize(size, Image.Resampling.BOX)
+
+    draw = ImageDraw.Draw(image)
+    font = _label_font(max(1, round(LABEL_FONT_SIZE * scale)))
+    for state in US_STATE_ABBREVIATIONS:
+        x, y = outlines["states"][state]["label"]
+        draw.text(
+            ((left + x * fit) / MAP_SUPERSAMPLE, (top + y * fit) / MAP_SUPERSAMPLE),
+            state,
+            fill="black",
+            font=font,
+            anchor="mm",
+        )
+    return np.asarray(image)
+
+
+def _draw_state_index(size: tuple[int, int]) -> "np.ndarray":
+    """Draw each state's interior in its own index value, with NO_STATE_INDEX everywhere else."""
+
+    import numpy as np
+    from PIL import Image, ImageDraw
+
+    outlines = _state_outlines()
+    fit = min(size[0] / outlines["width"], size[1] / outlines["height"])
+    left = (size[0] - outlines["width"] * fit) / 2
+    top = (size[1] - outlines["height"] * fit) / 2
+
+    image = Image.new("L", size, NO_STATE_INDEX)
+    draw = ImageDraw.Draw(image)
+    for idx, state in enumerate(US_STATE_ABBREVIATIONS):
+        for points in _outline_points(outlines["states"][state]["rings"], fit, left, top):
+            draw.polygon(points, fill=idx)
+    return np.asarray(image)
+
+
+@lru_cache(maxsize=8)
+def _load_map_atlas(width: int, height: int, scale: float = 1.0) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Return (base RGBA, highlight RGBA, state index) arrays for one layout size and scale.
+
+    All three are rasterized from the size-independent vendored outlines, so no size needs kaleido.
+    """
+
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    base = _draw_state_layer(BASE_STATE_COLOR, size, scale)
+    highlight = _draw_state_layer(HIGHLIGHT_STATE_COLOR, size, scale)
+    state_index = _draw_state_index(size)
+    base.setflags(write=False)
+    highlight.setflags(write=False)
+    state_index.setflags(write=False)
+    return base, highlight, state_index
+
+
+def _render_mask_map(normalized: set[str], width: int, height: int, scale: float = 1.0) -> BytesIO:
+    """Composite highlighted states from the precomputed atlas without starting kaleido."""
+    import numpy as np
+    from PIL import Image
+
+    base, highlight, state_index = _load_map_atlas(width, height, scale)
+    lookup = np.zeros(256, dtype=bool)
+    for state in normalized:
+        idx = STATE_INDEX.get(state)
+        if idx is not None:
+            lookup[idx] = True
+
+    mask = lookup[state_index]
+    composite = np.where(mask[..., None], highlight, base).astype(np.uint8)
+
+    buf = BytesIO()
+    Image.fromarray(composite, mode="RGBA").save(buf, format="PNG")
+    buf.seek(0)
+    return buf
@@ -0,0 +1,148 @@
+import aspose.slides as slides  # pyright: ignore[reportMissingModuleSource]
+from aspose.pydrawing import Color  # pyright: ignore[reportAttributeAccessIssue, reportMissingModuleSource]
+from aspose.slides import FillType  # pyright: ignore[reportAttributeAccessIssue]
+from aspose.slides.charts import (  # pyright: ignore[reportMissingModuleSource]
+    ChartType,
+    CrossesType,
+    LegendDataLabelPosition,
+    LegendPositionType,
+    TickMarkType,
+)
+
+AXIS_TEXT_COLOR = "#666666"
+AXIS_TITLE_COLOR = "#444444"
+FOOTER_HEIGHT = 18
+# Matplotlib draws the donut ring 0.55 of the radius wide, leaving a 45% hole.
+DONUT_HOLE_PERCENT = 45
+BAR_GAP_WIDTH_PERCENT = 150
+
+
+def _hex_color(value: str) -> Color:
+    value = value.lstrip("#")
+    return Color.from_argb(255, int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16))
+
+
+def _style_text(text_format, size: float, color: str, bold: bool = False) -> None:
+    portion_format = text_format.portion_format
+    portion_format.font_height = size
+    portion_format.font_bold = slides.NullableBool.TRUE if bold else slides.NullableBool.FALSE
+    portion_format.fill_format.fill_type = FillType.SOLID
+    portion_format.fill_format.solid_fill_color.color = _hex_color(color)
+
+
+def _new_chart(slide: slides.ISlide, chart_type, x: float, y: float, width: float, height: float):  # pyright: ignore[reportAttributeAccessIssue]
+    """Add a chart with the sample data removed and a transparent background."""
+
+    chart = slide.shapes.add_chart(chart_type, x, y, width, height)
+    chart.chart_data.series.clear()
+    chart.chart_data.categories.clear()
+    chart.has_title = False
+    chart.format.fill.fill_type = FillType.NO_FILL
+    chart.format.line.fill_format.fill_type = FillType.NO_FILL
+    chart.plot_area.format.fill.fill_type = FillType.NO_FILL
+    return chart
+
+
+def _add_series(chart, label: str, aggregations: dict):
+    workbook = chart.chart_data.chart_data_workbook
+    for row, bucket in enumerate(aggregations, start=1):
+        chart.chart_data.categories.add(workbook.get_cell(0, row, 0, str(bucket)))
+    return chart.chart_data.series.add(workbook.get_cell(0, 0, 1, label), chart.type), workbook
+
+
+def add_native_bar_chart(
+    slide: slides.ISlide,  # pyright: ignore[reportAttributeAccessIssue]
+    payload: dict,
+    bar_color: str,
+    x: float,
+    y: float,
+    width: float,
+    height: float,
+):
+    """Draw a horizontal bar chart as an editable Aspose chart styled like the Matplotlib version."""
+
+    aggregations = payload.get("aggregations", {}) or {}
+    chart = _new_chart(slide, ChartType.CLUSTERED_BAR, x, y, width, height)
+    chart.has_legend = False
+    count_label = payload.get("count_label", "Value")
+    series, workbook = _add_series(chart, count_label, aggregations)
+    for row, value in enumerate(aggregations.values(), start=1):
+        series.data_points.add_data_point_for_bar_series(workbook.get_cell(0, row, 1, value))
+    series.format.fill.fill_type = FillType.SOLID
+    series.format.fill.solid_fill_color.color = _hex_color(bar_color)
+    series.parent_series_group.gap_width = BAR_GAP_WIDTH_PERCENT
+
+    labels = series.labels.default_data_label_format
+    labels.show_value = True
+    labels.position = LegendDataLabelPosition.OUTSIDE_END
+    _style_text(labels.text_format, 10, "#000000", bold=True)
+
+    # Bar charts put categories on the vertical axis; reverse it so the first bucket is on top.
+    # The value axis crosses at the last category, which keeps it at the bottom after the reversal.
+    category_axis = chart.axes.vertical_axis
+    value_axis = chart.axes.horizontal_axis
+    category_axis.is_plot_order_reversed = True
+    value_axis.cross_type = CrossesType.MAXIMUM
+    value_axis.major_grid_lines_format.line.fill_format.fill_type = FillType.NO_FILL
+    value_axis.major_tick_mark = TickMarkType.NONE
+    for axis, title, title_color in (
+        (value_axis, count_label, AXIS_TITLE_COLOR),
+        (category_axis, payload.get("bucket_label", "Category"), "#000000"),
+    ):
+        _style_text(axis.text_format, 11, AXIS_TEXT_COLOR)
+        axis.has_title = True
+        axis.title.add_text_frame_for_overriding(title)
+        _style_text(axis.title.text_format, 12, title_color)
+    return chart
+
+
+def add_native_donut_chart(
+    slide: slides.ISlide,  # pyright: ignore[reportAttributeAccessIssue]
+    payload: dict,
+    colors: list[str],
+    x: float,
+    y: float,
+    width: float,
+    height: float,
+):
+    """Draw a donut chart with percentage labels, a bottom legend and an n= footer."""
+
+    aggregations = payload.get("aggregations", {}) or {}
+    chart_height = max(0.0, height - FOOTER_HEIGHT)
+    chart = _new_chart(slide, ChartType.DOUGHNUT, x, y, width, chart_height)
+    series, workbook = _add_series(chart, "Share", aggregations)
+    for row, value in enumerate(aggregations.values(), start=1):
+        series.data_points.add_data_point_for_doughnut_series(workbook.get_cell(0, row, 1, value))
+    for index, point in enumerate(series.data_points):
+        point.format.fill.fill_type = FillType.SOLID
+        point.format.fill.solid_fill_color.color = _hex_color(colors[index % len(colors)])
+        point.format.line.fill_format.fill_type = FillType.SOLID
+        point.format.line.fill_format.solid_fill_color.color = Color.white
+        point.format.line.width = 2
+    series.parent_series_group.doughnut_hole_size = DONUT_HOLE_PERCENT
+    series.parent_series_group.is_color_varied = True
+
+    labels = series.labels.default_data_label_format
+    labels.show_value = False
+    labels.show_percentage = True
+    labels.number_format = "0%"
+    labels.is_number_format_linked_to_source = False
+    _style_text(labels.text_format, 12, "#FFFFFF", bold=True)
+
+    chart.has_legend = True
+    chart.legend.position = LegendPositionType.BOTTOM
+    chart.legend.overlay = False
+    _style_text(chart.legend.text_format, 12, AXIS_TEXT_COLOR)
+
+    footer = slide.shapes.add_auto_shape(
+        slides.ShapeType.RECTANGLE, x, y + chart_height, width, FOOTER_HEIGHT
+    )
+    footer.fill_format.fill_type = FillType.NO_FILL
+    footer.line_format.fill_format.fill_type = FillType.NO_FILL
+    footer.text_frame.text = f"n={sum(aggregations.values())}"
+    footer.text_frame.paragraphs[0].paragraph_format.alignment = slides.TextAlignment.RIGHT
+    for portion in footer.text_frame.paragraphs[0].portions:
+        portion.portion_format.font_height = 10
+        portion.portion_format.fill_format.fill_type = FillType.SOLID
+        portion.portion_format.fill_format.solid_fill_color.color = _hex_color(AXIS_TEXT_COLOR)
+    return chart
@@ -0,0 +1,224 @@
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+# Returned by span() while profiling is off so instrumented code pays one global lookup.
+_NO_SPAN = nullcontext()
+_ACTIVE: "Profiler | None" = None
+
+
+class SpanRecord:
+    """One finished span: wall/CPU time in nanoseconds and peak traced memory in bytes."""
+
+    __slots__ = ("index", "parent", "name", "args", "thread_id", "start_ns", "wall_ns", "cpu_ns", "peak_bytes")
+
+    def __init__(self, index: int, parent: int | None, name: str, args: dict, thread_id: int, start_ns: int):
+        self.index = index
+        self.parent = parent
+        self.name = name
+        self.args = args
+        self.thread_id = thread_id
+        self.start_ns = start_ns
+        self.wall_ns = 0
+        self.cpu_ns = 0
+        self.peak_bytes = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "args": self.args,
+            "wall_s": round(self.wall_ns / 1e9, 6),
+            "cpu_s": round(self.cpu_ns / 1e9, 6),
+            "peak_bytes": self.peak_bytes,
+        }
+
+
+class Profiler:
+    """Collects nested spans per thread and turns them into a JSON report or a Chrome trace."""
+
+    def __init__(self, memory: bool = True):
+        self.memory = memory
+        self.records: list[SpanRecord] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started_ns = time.perf_counter_ns()
+        self._stopped_ns: int | None = None
+        self._owns_tracemalloc = False
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, **args):
+        stack = self._stack()
+        with self._lock:
+            record = SpanRecord(
+                len(self.records),
+                stack[-1][0].index if stack else None,
+                name,
+                args,
+                threading.get_ident(),
+                time.perf_counter_ns() - self._started_ns,
+            )
+            self.records.append(record)
+        # Each frame keeps [record, start traced bytes, highest absolute peak seen in children].
+        frame = [record, 0, 0]
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                # Resetting below would lose the parent's peak so far; fold it in first.
+                stack[-1][2] = max(stack[-1][2], peak)
+            frame[1] = current
+            tracemalloc.reset_peak()
+        stack.append(frame)
+        cpu_start = time.thread_time_ns()
+        wall_start = time.perf_counter_ns()
+        try:
+            yield record
+        finally:
+            record.wall_ns = time.perf_counter_ns() - wall_start
+            record.cpu_ns = time.thread_time_ns() - cpu_start
+            stack.pop()
+            if self.memory:
+                peak = max(tracemalloc.get_traced_memory()[1], frame[2])
+                record.peak_bytes = max(0, peak - frame[1])
+                if stack:
+                    stack[-1][2] = max(stack[-1][2], peak)
+
+    def stop(self) -> None:
+        if self._stopped_ns is None:
+            self._stopped_ns = time.perf_counter_ns()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def report(self) -> dict:
+        """Summarize spans per name and per slide, with each slide's direct component spans."""
+
+        end_ns = self._stopped_ns or time.perf_counter_ns()
+        totals: dict[str, dict] = {}
+        children: dict[int, list[SpanRecord]] = {}
+        for record in self.records:
+            entry = totals.setdefault(record.name, {"count": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_bytes": 0})
+            entry["count"] += 1
+            entry["wall_s"] += record.wall_ns / 1e9
+            entry["cpu_s"] += record.cpu_ns / 1e9
+            entry["peak_bytes"] = max(entry["peak_bytes"], record.peak_bytes)
+            if record.parent is not None:
+                children.setdefault(record.parent, []).append(record)
+        for entry in totals.values():
+            entry["wall_s"] = round(entry["wall_s"], 6)
+            entry["cpu_s"] = round(entry["cpu_s"], 6)
+
+        slides_report = []
+        for record in self.records:
+            if record.name != "slide":
+                continue
+            slide_entry = record.as_dict()
+            slide_entry["components"] = [child.as_dict() for child in children.get(record.index, [])]
+            slides_report.append(slide_entry)
+
+        return {
+            "wall_s": round((end_ns - self._started_ns) / 1e9, 6),
+            "memory_traced": self.memory,
+            "totals": dict(sorted(totals.items(), key=lambda item: item[1]["wall_s"], reverse=True)),
+            "slides": slides_report,
+        }
+
+    def chrome_trace(self) -> dict:
+        """Return the spans as Chrome trace events (load in chrome://tracing or Perfetto)."""
+
+        pid = os.getpid()
+        events = []
+        for record in self.records:
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": record.start_ns / 1000,
+                    "dur": record.wall_ns / 1000,
+                    "pid": pid,
+                    "tid": record.thread_id,
+                    "args": record.args | {"cpu_ms": record.cpu_ns / 1e6, "peak_kb": record.peak_bytes / 1024},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_report(self, path: Path | str) -> None:
+        Path(path).write_text(json.dumps(self.report(), indent=2, default=str), encoding="utf-8")
+
+    def write_chrome_trace(self, path: Path | str) -> None:
+        Path(path).write_text(json.dumps(self.chrome_trace(), default=str), encoding="utf-8")
+
+
+def enable_profiling(memory: bool = True) -> Profiler:
+    """Start recording spans in this process and return the active profiler."""
+
+    global _ACTIVE
+    if _ACTIVE is not None:
+        _ACTIVE.stop()
+    _ACTIVE = Profiler(memory=memory)
+    return _ACTIVE
+
+
+def disable_profiling() -> Profiler | None:
+    """Stop recording and return the profiler that was active, if any."""
+
+    global _ACTIVE
+    profiler, _ACTIVE = _ACTIVE, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+def span(name: str, **args):
+    """Context manager timing a block under name; a shared no-op while profiling is disabled."""
+
+    profiler = _ACTIVE
+    if profiler is None:
+        return _NO_SPAN
+    return profiler.span(name, **args)
+
+
+def profiled(name: str | None = None):
+    """Decorator recording every call of the function as a span."""
+
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _ACTIVE
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.span(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def format_profile(report: dict, limit: int = 15) -> str:
+    """Render the per-name totals of a report as a text table."""
+
+    lines = [f"{'span':<32}{'count':>7}{'wall s':>10}{'cpu s':>10}{'peak MB':>10}"]
+    for name, entry in list(report["totals"].items())[:limit]:
+        lines.append(
+            f"{name:<32}{entry['count']:>7}{entry['wall_s']:>10.3f}{entry['cpu_s']:>10.3f}"
+            f"{entry['peak_bytes'] / 1e6:>10.2f}"
+        )
+    lines.append(f"profiled {report['wall_s']:.2f}s, {len(report['slides'])} slide(s)")
+    return "\n".join(lines)
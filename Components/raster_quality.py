@@ -0,0 +1,46 @@
+import os
+
+from Components.deck_schema import QUALITY_PROFILES
+
+# QUALITY_PROFILES: "draft" for fast previews, "screen" for projection, "print" for paper.
+QUALITY_ENV = "ACTIVEER_QUALITY"
+DEFAULT_QUALITY = "screen"
+# Target pixels per inch of the picture frame an image is finally displayed in.
+QUALITY_PPI = {"draft": 72, "screen": 150, "print": 300}
+# Longest raster side any profile may ask for, so huge slots cannot blow up render time.
+MAX_RASTER_SIDE_PX = 6000
+POINTS_PER_INCH = 72
+
+
+def resolve_quality(deck_quality: str | None = None) -> str:
+    """Pick the raster quality profile: deck metadata, then ACTIVEER_QUALITY, then "screen"."""
+
+    for candidate in (deck_quality, os.environ.get(QUALITY_ENV)):
+        if isinstance(candidate, str) and candidate.strip().lower() in QUALITY_PROFILES:
+            return candidate.strip().lower()
+    return DEFAULT_QUALITY
+
+
+def pixels_per_unit(
+    quality: str,
+    display_size_pt: tuple[float, float],
+    layout_size: tuple[float, float],
+) -> float:
+    """Return the render scale (pixels per layout unit) that meets the profile's PPI at display size.
+
+    layout_size is the image's size in its renderer's own units (Matplotlib inches, plotly
+    pixels); the larger of the two axis ratios is used so neither axis falls short when the
+    frame stretches the image. The result is rounded so it is stable as a cache key part.
+    """
+
+    ppi = QUALITY_PPI.get(quality, QUALITY_PPI[DEFAULT_QUALITY])
+    ratios = [
+        display / POINTS_PER_INCH / layout
+        for display, layout in zip(display_size_pt, layout_size)
+        if layout > 0
+    ]
+    scale = ppi * max(ratios, default=1.0 / POINTS_PER_INCH)
+    longest = max(layout_size, default=0)
+    if longest > 0:
+        scale = min(scale, MAX_RASTER_SIDE_PX / longest)
+    return round(scale, 2)
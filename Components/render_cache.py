@@ -0,0 +1,271 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".render_cache"
+DEFAULT_MEMORY_ITEMS = 128
+# The memory tier is also capped by size, so a few large rasters cannot pin hundreds of MB.
+DEFAULT_MEMORY_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_DISK_MAX_BYTES = 256 * 1024 * 1024
+EVICTION_TARGET_RATIO = 0.9
+CACHE_ENABLED_ENV = "ACTIVEER_RENDER_CACHE"
+CACHE_DIR_ENV = "ACTIVEER_RENDER_CACHE_DIR"
+CACHE_MAX_BYTES_ENV = "ACTIVEER_RENDER_CACHE_MAX_BYTES"
+
+_REGISTERED_CACHES: dict[str, "RenderCache"] = {}
+
+
+def cache_key(*parts) -> str:
+    """Return a stable sha256 hex digest for JSON-serializable key parts."""
+
+    canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _env_enabled() -> bool:
+    value = os.environ.get(CACHE_ENABLED_ENV, "1").strip().lower()
+    return value not in {"0", "false", "off", "no"}
+
+
+def _env_directory() -> Path:
+    value = os.environ.get(CACHE_DIR_ENV)
+    return Path(value) if value else DEFAULT_CACHE_DIR
+
+
+def _env_max_bytes() -> int:
+    try:
+        return int(os.environ.get(CACHE_MAX_BYTES_ENV, DEFAULT_DISK_MAX_BYTES))
+    except ValueError:
+        return DEFAULT_DISK_MAX_BYTES
+
+
+class RenderCache:
+    """Content-addressed byte store with an in-process LRU in front of a disk directory."""
+
+    def __init__(
+        self,
+        namespace: str,
+        suffix: str = ".bin",
+        memory_items: int = DEFAULT_MEMORY_ITEMS,
+        memory_max_bytes: int = DEFAULT_MEMORY_MAX_BYTES,
+        disk_max_bytes: int | None = None,
+        directory: Path | None = None,
+        enabled: bool | None = None,
+    ):
+        self.namespace = namespace
+        self.suffix = suffix
+        self.memory_items = max(0, memory_items)
+        self.memory_max_bytes = max(0, memory_max_bytes)
+        self.disk_max_bytes = _env_max_bytes() if disk_max_bytes is None else disk_max_bytes
+        self.root = (directory or _env_directory()) / namespace
+        self.enabled = _env_enabled() if enabled is None else enabled
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: int | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        _REGISTERED_CACHES[namespace] = self
+
+    def _path_for(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}{self.suffix}"
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if not self.memory_items or len(data) > self.memory_max_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while len(self._memory) > self.memory_items or self._memory_bytes > self.memory_max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def get(self, key: str, remember: bool = True) -> bytes | None:
+        """Return cached bytes for key, or None on a miss or when disabled.
+
+        remember=False leaves a disk hit out of the memory tier, for callers that keep the bytes themselves.
+        """
+
+        if not self.enabled:
+            return None
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return data
+
+        path = self._path_for(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            data = None
+
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            if remember:
+                self._remember(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store bytes under key in memory and on disk, evicting old entries past the cap."""
+
+        if not self.enabled:
+            return
+        with self._lock:
+            self._remember(key, data)
+            self.writes += 1
+
+        if self.disk_max_bytes <= 0 or len(data) > self.disk_max_bytes:
+            return
+        path = self._path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_bytes()
+            else:
+                self._disk_bytes += len(data)
+            over_cap = self._disk_bytes > self.disk_max_bytes
+        if over_cap:
+            self._evict_disk()
+
+    def _scan_disk_bytes(self) -> int:
+        total = 0
+        for entry in self.root.glob(f"*/*{self.suffix}"):
+            try:
+                total += entry.stat().st_size
+            except OSError:
+                continue
+        return total
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used files until the store is under its target size."""
+
+        entries = []
+        for entry in self.root.glob(f"*/*{self.suffix}"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.disk_max_bytes * EVICTION_TARGET_RATIO)
+        evicted = 0
+        for _, size, entry in entries:
+            if total <= target:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self._disk_bytes = total
+            self.evictions += evicted
+
+    def clear(self) -> None:
+        """Drop every memory and disk entry of this cache."""
+
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._disk_bytes = 0
+        for entry in self.root.glob(f"*/*{self.suffix}"):
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for this cache."""
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "memory_items": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+            }
+
+
+def configure_render_caches(
+    enabled: bool | None = None,
+    directory: Path | None = None,
+    disk_max_bytes: int | None = None,
+) -> None:
+    """Apply switch, location, or size cap to every registered render cache.
+
+    The settings are also exported to the environment, so worker processes started
+    afterwards, such as pre-render workers, read and write the same store.
+    """
+
+    if enabled is not None:
+        os.environ[CACHE_ENABLED_ENV] = "1" if enabled else "0"
+    if directory is not None:
+        os.environ[CACHE_DIR_ENV] = str(directory)
+    if disk_max_bytes is not None:
+        os.environ[CACHE_MAX_BYTES_ENV] = str(disk_max_bytes)
+    for cache in _REGISTERED_CACHES.values():
+        if enabled is not None:
+            cache.enabled = enabled
+        if directory is not None:
+            cache.root = Path(directory) / cache.namespace
+            cache._disk_bytes = None
+        if disk_max_bytes is not None:
+            cache.disk_max_bytes = disk_max_bytes
+
+
+def render_cache_stats() -> dict[str, dict]:
+    """Return hit/miss counters for every registered render cache, keyed by namespace."""
+
+    return {name: cache.stats() for name, cache in _REGISTERED_CACHES.items()}
+
+
+def format_render_cache_stats(stats: dict[str, dict]) -> str:
+    """Summarize render cache stats as one line: overall hit rate, then hits/lookups per namespace."""
+
+    parts = []
+    hits = lookups = 0
+    for name, entry in stats.items():
+        entry_lookups = entry["hits"] + entry["misses"]
+        if not entry_lookups:
+            continue
+        hits += entry["hits"]
+        lookups += entry_lookups
+        parts.append(f"{name} {entry['hits']}/{entry_lookups}")
+    if not lookups:
+        return "Render cache: no lookups"
+    return f"Render cache: {hits}/{lookups} hits ({hits / lookups:.0%}); " + ", ".join(parts)
@@ -0,0 +1,112 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, NamedTuple
+
+from Components.chart_tools import CHART_IMAGE_CACHES, _render_chart_image, chart_image_key, chart_raster_dpi
+from Components.image_buffers import ImageBuffers
+from Components.image_formats import DEFAULT_IMAGE_FORMAT
+from Components.map_tools import MAP_IMAGE_CACHES, map_image_key, map_raster_scale, render_map_image
+
+if TYPE_CHECKING:
+    from Components.deck_plan import DeckPlan, SlidePlan
+
+
+class RasterJob(NamedTuple):
+    """One PNG/SVG the deck will need, with everything a worker process needs to render it."""
+
+    kind: str
+    key: str
+    payload: object
+    width: float
+    height: float
+    image_format: str = DEFAULT_IMAGE_FORMAT
+    # Savefig DPI for charts, pixels per layout point for maps.
+    scale: float = 1.0
+
+
+def plan_raster_jobs(deck_plan: "DeckPlan", slide_plans: list["SlidePlan"] | None = None) -> list[RasterJob]:
+    """List every chart/map image the compiled deck (or the given slides of it) will embed."""
+
+    image_format = deck_plan.image_format
+    jobs: list[RasterJob] = []
+    for slide_plan in deck_plan.slides if slide_plans is None else slide_plans:
+        for component in slide_plan.components:
+            if component.kind == "chart" and component.figure_size is not None:
+                width_in, height_in = component.figure_size
+                _, _, chart_width, card_height = component.card
+                dpi = chart_raster_dpi(component.payload, chart_width, card_height, deck_plan.quality)
+                jobs.append(
+                    RasterJob(
+                        "chart",
+                        chart_image_key(component.payload, width_in, height_in, image_format, dpi),
+                        component.payload,
+                        width_in,
+                        height_in,
+                        image_format,
+                        dpi,
+                    )
+                )
+            elif component.kind == "map":
+                states = component.payload.get("content", []) or []
+                width, height = int(component.width), int(component.height)
+                scale = map_raster_scale(component.width, component.height, deck_plan.quality)
+                jobs.append(
+                    RasterJob(
+                        "map",
+                        map_image_key(states, width, height, image_format=image_format, scale=scale),
+                        states,
+                        width,
+                        height,
+                        image_format,
+                        scale,
+                    )
+                )
+    return jobs
+
+
+def render_raster_job(job: RasterJob) -> tuple[str, bytes]:
+    """Render one planned job; runs inside a worker process."""
+
+    if job.kind == "map":
+        buf = render_map_image(job.payload, job.width, job.height, image_format=job.image_format, scale=job.scale)
+    else:
+        buf = _render_chart_image(job.payload, job.width, job.height, job.image_format, job.scale)
+    return job.key, buf.getvalue()
+
+
+def _cached_bytes(job: RasterJob) -> bytes | None:
+    caches = MAP_IMAGE_CACHES if job.kind == "map" else CHART_IMAGE_CACHES
+    cache = caches[job.image_format]
+    # The bytes go straight into the build's ImageBuffers, so keep them out of the cache's memory tier.
+    return cache.get(job.key, remember=False)
+
+
+def prerender_raster_jobs(jobs: list[RasterJob], workers: int) -> ImageBuffers:
+    """Render every planned job in a process pool and return the images in buffers keyed by job key.
+
+    Jobs already in the render cache are served without a worker. A job that fails
+    in a worker is left out so the inline renderer retries it and surfaces the error.
+    """
+
+    rendered = ImageBuffers()
+    pending: dict[str, RasterJob] = {}
+    for job in jobs:
+        if job.key in rendered or job.key in pending:
+            continue
+        cached = _cached_bytes(job)
+        if cached is not None:
+            rendered.put(job.key, cached)
+        else:
+            pending[job.key] = job
+
+    if not pending or workers < 1:
+        return rendered
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+        # as_completed drops each future once yielded, so finished results are not all held at once.
+        for future in as_completed([executor.submit(render_raster_job, job) for job in pending.values()]):
+            try:
+                key, data = future.result()
+            except Exception:
+                continue
+            rendered.put(key, data)
+    return rendered
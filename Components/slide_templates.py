@@ -0,0 +1,183 @@
+import os
+import threading
+from typing import TYPE_CHECKING
+
+import aspose.slides as slides  # pyright: ignore[reportMissingModuleSource]
+from aspose.slides import FillType  # pyright: ignore[reportAttributeAccessIssue]
+
+from Components.chart_tools import _add_card_background
+from Components.layout_tools import SlideObject, chart_grid_slide_object
+from Components.utils import _remove_default_placeholders, add_title_box, add_title_only_box, reserve_title_space
+
+if TYPE_CHECKING:
+    from Components.deck_plan import SlidePlan
+
+# "0" turns skeleton cloning off and builds every slide from an empty one.
+SLIDE_TEMPLATES_ENV = "ACTIVEER_SLIDE_TEMPLATES"
+# A skeleton is built the second time its layout appears; layouts used once are drawn directly.
+TEMPLATE_MIN_USES = 2
+# Components whose slot is an empty, unfilled rectangle the renderer writes text into.
+FRAME_KINDS = ("list", "meeting_info_text", "text")
+
+_TEMPLATE_TOTALS = {"skeletons": 0, "cloned": 0, "built": 0}
+_TEMPLATE_LOCK = threading.Lock()
+
+
+def slide_templates_enabled() -> bool:
+    return os.environ.get(SLIDE_TEMPLATES_ENV, "1").strip() != "0"
+
+
+def slot_frame_name(x: float, y: float) -> str:
+    return f"SlotFrame_{int(x)}_{int(y)}"
+
+
+def add_slot_frame(slide: slides.ISlide, x: float, y: float, width: float, height: float) -> slides.IShape:  # pyright: ignore[reportAttributeAccessIssue]
+    """Add the borderless, unfilled rectangle that text-like components render into."""
+
+    shape = slide.shapes.add_auto_shape(slides.ShapeType.RECTANGLE, x, y, width, height)
+    shape.name = slot_frame_name(x, y)
+    shape.fill_format.fill_type = FillType.NO_FILL
+    shape.line_format.fill_format.fill_type = FillType.NO_FILL
+    return shape
+
+
+def add_layout_guides(slide_object: SlideObject, columns: int) -> None:
+    """Draw plain background guides that divide the available width into columns."""
+
+    slide = slide_object.aspose_object
+    chart_height = slide_object.get_chart_height()
+    total_gap = (columns - 1) * slide_object.column_gap
+    col_width = (
+        (slide_object.slide_width - slide_object.left_margin * 2 - total_gap)
+        / max(1, columns)
+    )
+
+    y = slide_object.chart_start_y
+    for idx in range(columns):
+        x = slide_object.left_margin + idx * (col_width + slide_object.column_gap)
+        guide = slide.shapes.add_auto_shape(
+            slides.ShapeType.RECTANGLE,
+            x,
+            y,
+            col_width,
+            chart_height,
+        )
+        guide.fill_format.fill_type = FillType.NO_FILL
+        guide.line_format.fill_format.fill_type = FillType.NO_FILL
+
+
+def skeleton_key(slide_plan: "SlidePlan") -> tuple:
+    """Return what a slide's skeleton depends on: layout, title box and the static shapes' rectangles."""
+
+    if slide_plan.layout == "title_only":
+        return ("title_only",)
+    shapes = tuple(
+        (component.kind, component.card if component.kind == "chart" else (component.x, component.y, component.width, component.height))
+        for component in slide_plan.components
+        if component.kind == "chart" or component.kind in FRAME_KINDS
+    )
+    return (slide_plan.layout, bool(slide_plan.title), len(slide_plan.body), shapes)
+
+
+def draw_skeleton(slide: slides.ISlide, slide_plan: "SlidePlan", slide_width: float, slide_height: float) -> None:  # pyright: ignore[reportAttributeAccessIssue]
+    """Draw the content-independent shapes of a slide: title box, guides, chart cards and text frames."""
+
+    if slide_plan.layout == "title_only":
+        add_title_only_box(slide, slide_width, slide_height)
+        return
+    if slide_plan.title:
+        add_title_box(slide)
+    if slide_plan.layout == "chart_grid":
+        slide_object = chart_grid_slide_object(slide, slide_width, slide_height, slide_plan.body)
+        if slide_plan.title:
+            reserve_title_space(slide_object)
+        add_layout_guides(slide_object, len(slide_plan.body))
+    for component in slide_plan.components:
+        if component.kind == "chart":
+            _add_card_background(slide, *component.card)
+        elif component.kind in FRAME_KINDS:
+            add_slot_frame(slide, component.x, component.y, component.width, component.height)
+
+
+class SlideTemplates:
+    """Hands out new slides, cloning a prebuilt skeleton for layouts that repeat within a build.
+
+    Skeletons live in a scratch presentation, so the output's slide indices only ever hold real
+    slides. Use as a context manager so the scratch presentation is disposed after the build.
+    """
+
+    def __init__(
+        self,
+        presentation: slides.Presentation,
+        layout_slide: slides.ILayoutSlide,
+        enabled: bool | None = None,
+    ):  # pyright: ignore[reportAttributeAccessIssue]
+        self.presentation = presentation
+        self.layout_slide = layout_slide
+        self.enabled = slide_templates_enabled() if enabled is None else enabled
+        self.slide_width = presentation.slide_size.size.width
+        self.slide_height = presentation.slide_size.size.height
+        self._scratch = None
+        self._skeletons: dict[tuple, slides.ISlide] = {}  # pyright: ignore[reportAttributeAccessIssue]
+        self._uses: dict[tuple, int] = {}
+        self.cloned = 0
+        self.built = 0
+
+    def __enter__(self) -> "SlideTemplates":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._scratch is not None:
+            self._scratch.dispose()
+            self._scratch = None
+        self._skeletons.clear()
+
+    def _skeleton(self, key: tuple, slide_plan: "SlidePlan") -> slides.ISlide | None:  # pyright: ignore[reportAttributeAccessIssue]
+        skeleton = self._skeletons.get(key)
+        if skeleton is not None or not self.enabled:
+            return skeleton
+        self._uses[key] = uses = self._uses.get(key, 0) + 1
+        if uses < TEMPLATE_MIN_USES:
+            return None
+        if self._scratch is None:
+            self._scratch = slides.Presentation()
+            self._scratch.slide_size.set_size(self.slide_width, self.slide_height, slides.SlideSizeScaleType.DO_NOT_SCALE)
+        skeleton = self._scratch.slides.add_empty_slide(self._scratch.layout_slides[0])
+        _remove_default_placeholders(skeleton)
+        draw_skeleton(skeleton, slide_plan, self.slide_width, self.slide_height)
+        self._skeletons[key] = skeleton
+        with _TEMPLATE_LOCK:
+            _TEMPLATE_TOTALS["skeletons"] += 1
+        return skeleton
+
+    def new_slide(self, slide_plan: "SlidePlan") -> tuple[slides.ISlide, dict | None]:  # pyright: ignore[reportAttributeAccessIssue]
+        """Append a slide for slide_plan and return it with its skeleton's shapes by name, or None if built empty."""
+
+        skeleton = self._skeleton(skeleton_key(slide_plan), slide_plan)
+        if skeleton is None:
+            slide = self.presentation.slides.add_empty_slide(self.layout_slide)
+            _remove_default_placeholders(slide)
+            self.built += 1
+            with _TEMPLATE_LOCK:
+                _TEMPLATE_TOTALS["built"] += 1
+            return slide, None
+        slide = self.presentation.slides.add_clone(skeleton, self.layout_slide)
+        self.cloned += 1
+        with _TEMPLATE_LOCK:
+            _TEMPLATE_TOTALS["cloned"] += 1
+        return slide, {shape.name: shape for shape in slide.shapes}
+
+    def stats(self) -> dict:
+        """Return skeleton/clone counters for this build."""
+
+        return {"skeletons": len(self._skeletons), "cloned": self.cloned, "built": self.built}
+
+
+def slide_template_stats() -> dict:
+    """Return skeleton/clone counters summed over every build in this process."""
+
+    with _TEMPLATE_LOCK:
+        return dict(_TEMPLATE_TOTALS)
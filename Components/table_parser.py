@@ -0,0 +1,192 @@
+import re
+from html import unescape
+from typing import Iterator
+
+_HTML_TABLE_RE = re.compile(r"<\s*table\b", re.IGNORECASE)
+_MARKDOWN_SEPARATOR_RE = re.compile(r"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+_WHITESPACE_RE = re.compile(r"[ \t\r\n\f\v]+")
+# Comments/doctypes, start or end tags (name + raw attributes), or text (a stray "<" is text).
+_HTML_TOKEN_RE = re.compile(
+    r"<!--.*?-->|<![^>]*>|<(/?)([a-zA-Z][a-zA-Z0-9]*)([^>]*)>|([^<]+|<)",
+    re.DOTALL,
+)
+_SPAN_ATTR_RE = re.compile(r"\b(colspan|rowspan)\s*=\s*[\"']?\s*(\d+)", re.IGNORECASE)
+_SKIPPED_CONTENT_TAGS = {"script", "style"}
+
+
+def _split_row(row: str) -> list[str]:
+    # handle escaped pipes \|
+    row = row.strip().strip("|")
+    parts = re.split(r"(?<!\\)\|", row)
+    return [cell.replace("\\|", "|").strip() for cell in parts]
+
+
+def _parse_markdown_table(md: str) -> list[list[str]]:
+    lines = [line for line in md.splitlines() if line.strip()]
+    if len(lines) < 2:
+        return []
+    header = _split_row(lines[0])
+    data_lines = lines[2:] if _MARKDOWN_SEPARATOR_RE.match(lines[1]) else lines[1:]
+    rows = [_split_row(line) for line in data_lines]
+    return [header] + rows
+
+
+def sniff_table_format(content: str) -> str | None:
+    """Return "html", "markdown" or None depending on what the content looks like."""
+
+    if _HTML_TABLE_RE.search(content):
+        return "html"
+    if content.lstrip().startswith("<"):
+        return None
+    if "|" in content:
+        return "markdown"
+    return None
+
+
+class _TableRowParser:
+    """Collect rows of the first top-level <table>, expanding colspan/rowspan into repeated cells."""
+
+    def __init__(self):
+        self.completed_rows: list[list[str]] = []
+        self.finished = False
+        self._table_depth = 0
+        self._row: list[str] | None = None
+        self._cell_parts: list[str] | None = None
+        self._cell_span = (1, 1)
+        # column index -> (rows still covered, text) for cells spanning down.
+        self._pending_rowspans: dict[int, tuple[int, str]] = {}
+
+    def _fill_rowspans(self) -> None:
+        """Copy cells that span down from earlier rows into the current column position."""
+
+        while self._row is not None and len(self._row) in self._pending_rowspans:
+            column = len(self._row)
+            remaining, text = self._pending_rowspans[column]
+            self._row.append(text)
+            if remaining <= 1:
+                del self._pending_rowspans[column]
+            else:
+                self._pending_rowspans[column] = (remaining - 1, text)
+
+    def _end_cell(self) -> None:
+        if self._cell_parts is None or self._row is None:
+            return
+        lines = [_WHITESPACE_RE.sub(" ", part).strip() for part in "".join(self._cell_parts).split("\n")]
+        text = "\n".join(line for line in lines if line)
+        colspan, rowspan = self._cell_span
+        self._fill_rowspans()
+        for _ in range(colspan):
+            if rowspan > 1:
+                self._pending_rowspans[len(self._row)] = (rowspan - 1, text)
+            self._row.append(text)
+            self._fill_rowspans()
+        self._cell_parts = None
+
+    def _end_row(self) -> None:
+        self._end_cell()
+        if self._row is None:
+            return
+        self._fill_rowspans()
+        # Rowspans whose column lies past the last cell of this row still consume it.
+        for column in sorted(c for c in self._pending_rowspans if c >= len(self._row)):
+            while len(self._row) < column:
+                self._row.append("")
+            self._fill_rowspans()
+        if self._row:
+            self.completed_rows.append(self._row)
+        self._row = None
+
+    @staticmethod
+    def _spans(raw_attrs: str) -> tuple[int, int]:
+        spans = {"colspan": 1, "rowspan": 1}
+        for name, value in _SPAN_ATTR_RE.findall(raw_attrs):
+            spans[name.lower()] = max(1, min(int(value), 1000))
+        return spans["colspan"], spans["rowspan"]
+
+    def handle_starttag(self, tag: str, raw_attrs: str) -> None:
+        if self.finished:
+            return
+        if tag == "table":
+            self._table_depth += 1
+            return
+        if self._table_depth != 1:
+            return
+        if tag == "tr":
+            self._end_row()
+            self._row = []
+        elif tag in ("td", "th"):
+            self._end_cell()
+            if self._row is None:
+                self._row = []
+            self._cell_parts = []
+            self._cell_span = self._spans(raw_attrs)
+        elif tag == "br" and self._cell_parts is not None:
+            self._cell_parts.append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if self.finished:
+            return
+        if tag == "table":
+            if self._table_depth == 1:
+                self._end_row()
+                self.finished = True
+            self._table_depth = max(0, self._table_depth - 1)
+            return
+        if self._table_depth != 1:
+            return
+        if tag in ("td", "th"):
+            self._end_cell()
+        elif tag in ("tr", "thead", "tbody", "tfoot"):
+            self._end_row()
+
+    def handle_data(self, data: str) -> None:
+        if self._cell_parts is not None and self._table_depth == 1:
+            self._cell_parts.append(unescape(data) if "&" in data else data)
+
+    def drain(self) -> list[list[str]]:
+        rows, self.completed_rows = self.completed_rows, []
+        return rows
+
+
+def iter_html_table_rows(content: str) -> Iterator[list[str]]:
+    """Yield rows of the first HTML table as soon as each one is closed, in a single pass."""
+
+    parser = _TableRowParser()
+    skipping: str | None = None
+    for match in _HTML_TOKEN_RE.finditer(content):
+        closing, tag, raw_attrs, text = match.groups()
+        if tag:
+            tag = tag.lower()
+            if skipping:
+                if closing and tag == skipping:
+                    skipping = None
+                continue
+            if closing:
+                parser.handle_endtag(tag)
+            elif tag in _SKIPPED_CONTENT_TAGS:
+                skipping = tag
+            else:
+                parser.handle_starttag(tag, raw_attrs)
+        elif text is not None and not skipping:
+            parser.handle_data(text)
+        else:
+            continue
+        if parser.completed_rows:
+            yield from parser.drain()
+        if parser.finished:
+            return
+    parser._end_row()
+    yield from parser.drain()
+
+
+def parse_table(content: str) -> list[list[str]]:
+    """Parse an HTML or markdown table into rows of cell strings, header row first."""
+
+    if not isinstance(content, str) or not content.strip():
+        return []
+    table_format = sniff_table_format(content)
+    if table_format == "html":
+        return list(iter_html_table_rows(content))
+    if table_format == "markdown":
+        return _parse_markdown_table(content)
+    return []
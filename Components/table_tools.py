@@ -1,29 +1,39 @@
-import re
-from io import StringIO
+import json
 
-import pandas as pd
 import aspose.slides as slides  # pyright: ignore[reportMissingModuleSource]
 from aspose.pydrawing import Color  # pyright: ignore[reportAttributeAccessIssue, reportMissingModuleSource]
 from aspose.slides import FillType  # pyright: ignore[reportAttributeAccessIssue]
 
-from Components.text_tools import render_html_into_shape
-
-
-def _split_row(row: str) -> list[str]:
-    # handle escaped pipes \|
-    row = row.strip().strip("|")
-    parts = re.split(r"(?<!\\)\|", row)
-    return [cell.replace("\\|", "|").strip() for cell in parts]
-
-
-def _parse_markdown_table(md: str) -> list[list[str]]:
-    lines = [line for line in md.splitlines() if line.strip()]
-    if len(lines) < 2:
-        return []
-    header = _split_row(lines[0])
-    data_lines = lines[2:] if set(lines[1].replace("|", "").strip("-").strip()) == set() else lines[1:]
-    rows = [_split_row(line) for line in data_lines]
-    return [header] + rows
+from Components.inline_markdown import Run, plain_text
+from Components.json_tools import loads
+from Components.profiling import profiled
+from Components.render_cache import RenderCache, cache_key
+from Components.table_parser import _parse_markdown_table, parse_table
+from Components.text_metrics import text_block_height, wrapped_line_counts
+from Components.text_tools import add_markdown_portions, apply_run_format, render_html_into_shape
+from Components.utils import continuation_slide_object
+
+_CELL_MARGIN = 2
+_BORDER_WIDTH = 1.0
+# Bump whenever parse_table or _parse_markdown_table output changes so stale cached rows are ignored.
+TABLE_PARSE_VERSION = 1
+TABLE_ROWS_CACHE = RenderCache("tables", suffix=".json")
+# Smaller tables parse faster than a hashed disk lookup (and a miss also pays the write), so they skip the cache.
+TABLE_CACHE_MIN_CHARS = 2048
+
+
+def _cached_rows(content: str, parser=parse_table) -> list[list[str]]:
+    """Parse table content once per distinct string across decks and runs, via the render cache."""
+
+    if len(content) < TABLE_CACHE_MIN_CHARS:
+        return parser(content)
+    key = cache_key("table", TABLE_PARSE_VERSION, parser.__name__, content)
+    cached = TABLE_ROWS_CACHE.get(key)
+    if cached is not None:
+        return loads(cached)
+    rows = parser(content)
+    TABLE_ROWS_CACHE.put(key, json.dumps(rows, separators=(",", ":")).encode("utf-8"))
+    return rows
 
 
 def _color_from_style(value: str, fallback: Color) -> Color:
@@ -43,6 +53,252 @@ def _color_from_style(value: str, fallback: Color) -> Color:
     return fallback
 
 
+class _TableStylePlan:
+    """Table formatting resolved once from the styles instead of once per cell."""
+
+    def __init__(
+        self,
+        styles: dict,
+        num_cols: int,
+        header_bg: Color,
+        header_text: Color,
+        border_color: Color,
+        stripe_even: Color | None,
+        stripe_odd: Color | None,
+        header_bold: bool,
+        body_bold: bool,
+        font_size: int,
+        cell_bg: list[Color] | None,
+        cell_text_color: list[Color] | None,
+    ):
+        self.num_cols = num_cols
+        self.header_bg = header_bg
+        self.header_text = header_text
+        self.border_color = border_color
+        self.header_bold = header_bold
+        self.body_bold = body_bold
+        self.font_size = font_size
+        self.cell_bg = cell_bg
+        self.cell_text_colors = cell_text_color
+        if stripe_even is None and stripe_odd is None:
+            self.stripes = (Color.white, Color.white)
+        else:
+            self.stripes = (stripe_even or Color.white, stripe_odd or Color.white)
+
+        autofit = styles.get("autofit", "shape")
+        # shrink-to-fit inside cell unless "normal" is requested
+        self.autofit_type = (
+            slides.TextAutofitType.NORMAL if autofit == "normal" else slides.TextAutofitType.SHAPE
+        )
+        # Default: anchor center vertically (normalize style value).
+        anchor_value = str(styles.get("anchor", "center") or "").lower()
+        if anchor_value == "top":
+            self.anchoring_type = slides.TextAnchorType.TOP
+        elif anchor_value == "bottom":
+            self.anchoring_type = slides.TextAnchorType.BOTTOM
+        else:
+            self.anchoring_type = slides.TextAnchorType.CENTER
+        # Default: align left; override with styles.align
+        align = styles.get("align", "left")
+        if align == "right":
+            self.alignment = slides.TextAlignment.RIGHT
+        elif align == "center":
+            self.alignment = slides.TextAlignment.CENTER
+        else:
+            self.alignment = slides.TextAlignment.LEFT
+
+    def row_bold(self, r: int) -> bool:
+        return self.header_bold if r == 0 else self.body_bold
+
+    def row_fill(self, r: int) -> Color | None:
+        """Return the fill shared by the whole row, or None when cell_bg colours cells individually."""
+
+        if r == 0:
+            return self.header_bg
+        if self.cell_bg:
+            return None
+        return self.stripes[r % 2]
+
+    def cell_fill(self, r: int, c: int) -> Color:
+        return self.cell_bg[((r - 1) * self.num_cols + c) % len(self.cell_bg)]
+
+    def cell_text_color(self, r: int, c: int) -> Color | None:
+        """Return a body cell's text colour when cell_text_color overrides the row default."""
+
+        if r == 0 or not self.cell_text_colors:
+            return None
+        return self.cell_text_colors[((r - 1) * self.num_cols + c) % len(self.cell_text_colors)]
+
+    def apply_cell_format(self, fmt, fill_color: Color) -> None:
+        fmt.fill_format.fill_type = FillType.SOLID
+        fmt.fill_format.solid_fill_color.color = fill_color
+        for border in (fmt.border_top, fmt.border_bottom, fmt.border_left, fmt.border_right):
+            border.fill_format.fill_type = FillType.SOLID
+            border.fill_format.solid_fill_color.color = self.border_color
+            border.width = _BORDER_WIDTH
+
+    def text_frame_format(self):
+        text_frame_format = slides.TextFrameFormat()
+        text_frame_format.wrap_text = slides.NullableBool.TRUE
+        text_frame_format.autofit_type = self.autofit_type
+        text_frame_format.margin_left = _CELL_MARGIN
+        text_frame_format.margin_right = _CELL_MARGIN
+        text_frame_format.margin_top = _CELL_MARGIN
+        text_frame_format.margin_bottom = _CELL_MARGIN
+        text_frame_format.anchoring_type = self.anchoring_type
+        return text_frame_format
+
+    def paragraph_format(self):
+        paragraph_format = slides.ParagraphFormat()
+        paragraph_format.alignment = self.alignment
+        return paragraph_format
+
+    def portion_format(self, bold: bool, color: Color):
+        portion_format = slides.PortionFormat()
+        portion_format.font_height = self.font_size
+        portion_format.font_bold = slides.NullableBool.TRUE if bold else slides.NullableBool.FALSE
+        portion_format.fill_format.fill_type = FillType.SOLID
+        portion_format.fill_format.solid_fill_color.color = color
+        return portion_format
+
+
+def _lines_from_value(value: object) -> list[str]:
+    if isinstance(value, list):
+        flattened = "\n".join(str(v) for v in value)
+    else:
+        flattened = str(value)
+    normalized = (
+        flattened.replace("<br />", "\n")
+        .replace("<br/>", "\n")
+        .replace("<br>", "\n")
+    )
+    return [line for line in normalized.splitlines() if line.strip()] or [""]
+
+
+def _measured_lines(value: object) -> list[str]:
+    """Return a cell's lines as they will be drawn: inline markers dropped, list dashes as bullets."""
+
+    lines = []
+    for line in _lines_from_value(value):
+        stripped = line.lstrip()
+        if stripped.startswith("- "):
+            line = "\u2022 " + stripped[2:].lstrip()
+        lines.append(plain_text(line))
+    return lines
+
+
+def _estimate_row_heights(
+    rows: list[list[str]],
+    num_cols: int,
+    col_widths: list[float],
+    font_size: float,
+    header_bold: bool,
+    body_bold: bool,
+) -> list[float]:
+    """Estimate each row's height from the wrapped line count of its tallest cell."""
+
+    text_widths = [max(width - 2 * _CELL_MARGIN, 1.0) for width in col_widths]
+    heights: list[float] = []
+    for first, last, bold in ((0, 1, header_bold), (1, len(rows), body_bold)):
+        texts: list[list[str]] = []
+        widths: list[float] = []
+        for row in rows[first:last]:
+            for c in range(num_cols):
+                texts.append(_measured_lines(row[c] if c < len(row) else ""))
+                widths.append(text_widths[c])
+        counts = wrapped_line_counts(texts, widths, font_size, bold)
+        for start in range(0, len(counts), num_cols):
+            line_count = max(counts[start:start + num_cols])
+            heights.append(max(16.0, text_block_height(line_count, font_size) + 4))
+    return heights
+
+
+def _paginate_rows(row_heights: list[float], available: float) -> list[tuple[int, int]]:
+    """Split body rows into [start, end) pages that fit below a repeated header, in one pass."""
+
+    body_space = available - row_heights[0]
+    pages: list[tuple[int, int]] = []
+    start, used = 1, 0.0
+    for index in range(1, len(row_heights)):
+        if index > start and used + row_heights[index] > body_space:
+            pages.append((start, index))
+            start, used = index, 0.0
+        used += row_heights[index]
+    pages.append((start, len(row_heights)))
+    return pages
+
+
+def _fit_row_heights(row_heights: list[float], available: float) -> list[float]:
+    """Scale row heights down (to a 14pt floor) when they overflow the slot."""
+
+    total_estimated = sum(row_heights)
+    if total_estimated <= available or total_estimated == 0:
+        return row_heights
+    scale = available / total_estimated
+    return [max(14.0, h * scale) for h in row_heights]
+
+
+def _fill_table(table, rows: list[list[str]], row_numbers: list[int], num_cols: int, plan: _TableStylePlan) -> None:
+    """Write and style table rows; row_numbers maps each table row to its index in rows."""
+
+    # Cell text first: the table- and row-level formats below only reach portions that exist.
+    styled_portions = []
+    colored_cells = []
+    for table_r, r in enumerate(row_numbers):
+        row = rows[r]
+        row_fill = plan.row_fill(r)
+        base_bold = plan.row_bold(r)
+        table_row = table.rows[table_r]
+        for c in range(num_cols):
+            cell = table_row[c]
+            plan.apply_cell_format(cell.cell_format, plan.cell_fill(r, c) if row_fill is None else row_fill)
+            text_color = plan.cell_text_color(r, c)
+            if text_color is not None:
+                colored_cells.append((cell, text_color))
+
+            cell_value = row[c] if c < len(row) else ""
+            # Normalize lists and <br> to lines
+            if isinstance(cell_value, list):
+                lines = [str(item) for item in cell_value]
+            else:
+                text_val = str(cell_value).replace("<br />", "\n").replace("<br/>", "\n").replace("<br>", "\n")
+                lines = text_val.splitlines() or [""]
+
+            tf = cell.text_frame
+            if len(lines) == 1 and plain_text(lines[0]) == lines[0] and not lines[0].lstrip().startswith("- "):
+                tf.text = lines[0]
+                continue
+
+            tf.paragraphs.clear()
+            for line in lines:
+                para = slides.Paragraph()
+                # Bullet if markdown-style list item
+                stripped = line.lstrip()
+                if stripped.startswith("- "):
+                    para.paragraph_format.bullet.type = slides.BulletType.SYMBOL
+                    para.paragraph_format.bullet.char = "\u2022"
+                    line = stripped[2:].lstrip()
+
+                for portion, run in add_markdown_portions(para, line):
+                    # Plain bold runs in an already-bold row need no override.
+                    if run.styled and not (base_bold and run == Run(run.text, bold=True)):
+                        styled_portions.append((portion, run))
+
+                tf.paragraphs.add(para)
+
+    # Shared formatting in a handful of bulk calls, then only the per-cell differences.
+    table.set_text_format(plan.text_frame_format())
+    table.set_text_format(plan.paragraph_format())
+    table.set_text_format(plan.portion_format(plan.body_bold, Color.black))
+    table.rows[0].set_text_format(plan.portion_format(plan.header_bold, plan.header_text))
+    for portion, run in styled_portions:
+        apply_run_format(portion.portion_format, run)
+    for cell, text_color in colored_cells:
+        for para in cell.text_frame.paragraphs:
+            for portion in para.portions:
+                portion.portion_format.fill_format.solid_fill_color.color = text_color
+
+
 def _render_table_core(
     slide_object,
     component: dict,
@@ -66,7 +322,7 @@ def _render_table_core(
     if isinstance(content, list):
         rows = content
     elif isinstance(content, str) and content.strip():
-        rows = _parse_markdown_table(content)
+        rows = _cached_rows(content, _parse_markdown_table)
     if not rows:
         return
 
@@ -99,136 +355,42 @@ def _render_table_core(
     else:
         col_widths = [width / num_cols] * num_cols
 
-    def _lines_from_value(value: object) -> list[str]:
-        if isinstance(value, list):
-            flattened = "\n".join(str(v) for v in value)
-        else:
-            flattened = str(value)
-        normalized = (
-            flattened.replace("<br />", "\n")
-            .replace("<br/>", "\n")
-            .replace("<br>", "\n")
-        )
-        return [line for line in normalized.splitlines() if line.strip()] or [""]
-
-    estimated_heights: list[float] = []
-    for row in rows:
-        line_count = max(len(_lines_from_value(cell)) for cell in row) if row else 1
-        estimated = max(16.0, line_count * font_size * 1.15 + 4)
-        estimated_heights.append(estimated)
+    estimated_heights = _estimate_row_heights(rows, num_cols, col_widths, font_size, header_bold, body_bold)
 
-    total_estimated = sum(estimated_heights)
-    if total_estimated <= height or total_estimated == 0:
-        row_heights = estimated_heights
-    else:
-        scale = height / total_estimated
-        row_heights = [max(14.0, h * scale) for h in estimated_heights]
-
-    table = slide_object.aspose_object.shapes.add_table(
-        x,
-        y,
-        col_widths,
-        row_heights,
+    plan = _TableStylePlan(
+        styles,
+        num_cols,
+        header_bg,
+        header_text,
+        border_color,
+        stripe_even,
+        stripe_odd,
+        header_bold,
+        body_bold,
+        font_size,
+        cell_bg,
+        cell_text_color,
     )
 
-    # styling
-    for r, row in enumerate(rows):
-        for c in range(num_cols):
-            cell = table.rows[r][c]
-            fmt = cell.cell_format
-            tf = cell.text_frame
-            tf.text_frame_format.wrap_text = slides.NullableBool.TRUE
-            autofit = styles.get("autofit", "shape")
-            if autofit == "normal":
-                tf.text_frame_format.autofit_type = slides.TextAutofitType.NORMAL
-            else:
-                tf.text_frame_format.autofit_type = slides.TextAutofitType.SHAPE  # shrink-to-fit inside cell
-            tf.text_frame_format.margin_left = 2
-            tf.text_frame_format.margin_right = 2
-            tf.text_frame_format.margin_top = 2
-            tf.text_frame_format.margin_bottom = 2
-            # Default: anchor center vertically (normalize style value).
-            anchor_value = str(styles.get("anchor", "center") or "").lower()
-            if anchor_value == "top":
-                tf.text_frame_format.anchoring_type = slides.TextAnchorType.TOP
-            elif anchor_value == "bottom":
-                tf.text_frame_format.anchoring_type = slides.TextAnchorType.BOTTOM
-            else:
-                tf.text_frame_format.anchoring_type = slides.TextAnchorType.CENTER
-            
-            # 1. Background Coloring (Zebra Striping)
-            fmt.fill_format.fill_type = FillType.SOLID
-            if r == 0:
-                fmt.fill_format.solid_fill_color.color = header_bg
-            else:
-                if cell_bg:
-                    cell_index = ((r - 1) * num_cols + c) % len(cell_bg)
-                    fmt.fill_format.solid_fill_color.color = cell_bg[cell_index]
-                elif stripe_even is None and stripe_odd is None:
-                    fmt.fill_format.solid_fill_color.color = Color.white
-                else:
-                    fmt.fill_format.solid_fill_color.color = stripe_even if r % 2 == 0 else (stripe_odd or Color.white)
-
-            # 2. Borders
-            for border in (fmt.border_top, fmt.border_bottom, fmt.border_left, fmt.border_right):
-                border.fill_format.fill_type = FillType.SOLID
-                border.fill_format.solid_fill_color.color = border_color
-                border.width = 1.0
-
-            tf.paragraphs.clear()
+    paginate = styles.get("paginate")
+    if not isinstance(paginate, bool):
+        paginate = slide_object.context.paginate_tables
+    pages = _paginate_rows(estimated_heights, height) if paginate else [(1, num_rows)]
 
-            cell_value = row[c] if c < len(row) else ""
-            # Normalize lists and <br> to lines
-            if isinstance(cell_value, list):
-                lines = [str(item) for item in cell_value]
-            else:
-                text_val = str(cell_value).replace("<br />", "\n").replace("<br/>", "\n").replace("<br>", "\n")
-                lines = text_val.splitlines() or [""]
-
-            for line in lines:
-                para = slides.Paragraph()
-                # Alignment: first column left, others center
-                # Default: align left; override with styles.align
-                align = styles.get("align", "left")
-                if align == "right":
-                    para.paragraph_format.alignment = slides.TextAlignment.RIGHT
-                elif align == "center":
-                    para.paragraph_format.alignment = slides.TextAlignment.CENTER
-                else:
-                    para.paragraph_format.alignment = slides.TextAlignment.LEFT
-
-                # Bullet if markdown-style list item
-                stripped = line.lstrip()
-                if stripped.startswith("- "):
-                    para.paragraph_format.bullet.type = slides.BulletType.SYMBOL
-                    para.paragraph_format.bullet.char = "\u2022"
-                    line = stripped[2:].lstrip()
-
-                parts = re.split(r"(\*\*.*?\*\*)", line)
-                base_bold = header_bold if r == 0 else body_bold
-                base_color = header_text if r == 0 else Color.black
-                if r > 0 and cell_text_color:
-                    idx = ((r - 1) * num_cols + c) % len(cell_text_color)
-                    base_color = cell_text_color[idx]
-
-                for part in parts:
-                    if not part:
-                        continue
-                    is_bold = part.startswith("**") and part.endswith("**") and len(part) >= 4
-                    text_part = part[2:-2] if is_bold else part
-                    portion = slides.Portion(text_part)
-                    pf = portion.portion_format
-                    pf.font_height = font_size
-                    pf.font_bold = slides.NullableBool.TRUE if (base_bold or is_bold) else slides.NullableBool.FALSE
-                    pf.fill_format.fill_type = FillType.SOLID
-                    pf.fill_format.solid_fill_color.color = base_color
-                    para.portions.add(portion)
-
-                tf.paragraphs.add(para)
-
-    slide_object.last_bottom_y = max(slide_object.last_bottom_y, y + height)
+    for page, (start, end) in enumerate(pages):
+        page_slide = slide_object if page == 0 else continuation_slide_object(slide_object, page)
+        row_numbers = [0, *range(start, end)]
+        table = page_slide.aspose_object.shapes.add_table(
+            x,
+            y,
+            col_widths,
+            _fit_row_heights([estimated_heights[r] for r in row_numbers], height),
+        )
+        _fill_table(table, rows, row_numbers, num_cols, plan)
+        page_slide.last_bottom_y = max(page_slide.last_bottom_y, y + height)
 
 
+@profiled("render_table")
 def render_table(
     slide_object,
     component: dict,
@@ -240,13 +402,13 @@ def render_table(
     header_text: Color | None = None,
     border_color: Color | None = None,
 ) -> None:
-    """Render a table component; prefers HTML parsing, falls back to HTML render."""
+    """Render a table component from HTML or markdown, falling back to an HTML text render."""
     content = component.get("content", "")
     if not isinstance(content, str) or not content.strip():
         return
 
     styles = component.get("styles", {}) if isinstance(component.get("styles"), dict) else {}
-    font_size = styles.get("font_size") or styles.get("fontSize") or 11
+    font_size = styles.get("fontSize") or 11
 
     if width is None or height is None or x is None or y is None:
         width = slide_object.chart_width
@@ -256,21 +418,8 @@ def render_table(
     if isinstance(max_height_style, (int, float)) and max_height_style > 0:
         height = min(height, float(max_height_style))
 
-    # Try to parse HTML into rows/cols; fallback to HTML-in-textframe if parsing fails
-    rows: list[list[str]] | None = None
-    try:
-        dfs = pd.read_html(StringIO(content))
-        if dfs:
-            df = dfs[0]
-            rows = [list(df.columns)]
-            rows.extend(df.astype(str).fillna("").values.tolist())
-    except Exception:
-        rows = None
-
-    # If HTML parsing fails, try markdown parsing.
-    if rows is None:
-        md_rows = _parse_markdown_table(content)
-        rows = md_rows if md_rows else None
+    # Parse HTML or markdown into rows/cols; fall back to HTML-in-textframe if neither yields a table.
+    rows = _cached_rows(content) or None
 
     if rows:
         header_bg_color = _color_from_style(
@@ -0,0 +1,150 @@
+import math
+from functools import lru_cache
+
+DEFAULT_FONT = "helvetica"
+LINE_SPACING = 1.15
+# Arial is metric-compatible with Helvetica; other fonts fall back to it as well.
+FONT_ALIASES = {"arial": "helvetica", "liberation sans": "helvetica"}
+FIRST_CHAR = 32
+# Advance widths (1/1000 em) of ASCII 32..126 from the Adobe core-14 Helvetica AFM files.
+HELVETICA_WIDTHS = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+HELVETICA_BOLD_WIDTHS = (
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+)
+FONT_WIDTHS = {
+    ("helvetica", False): HELVETICA_WIDTHS,
+    ("helvetica", True): HELVETICA_BOLD_WIDTHS,
+}
+# Characters outside the table (accents, CJK, symbols) are measured as a wide glyph.
+FALLBACK_WIDTH = 667
+
+
+@lru_cache(maxsize=None)
+def font_metrics(font: str = DEFAULT_FONT, bold: bool = False):
+    """Return a NumPy array of advance widths (1/1000 em) indexed by code point, last slot = fallback."""
+
+    import numpy as np
+
+    font = FONT_ALIASES.get(font.lower(), font.lower())
+    widths = FONT_WIDTHS.get((font, bold)) or FONT_WIDTHS[(DEFAULT_FONT, bold)]
+    table = np.full(FIRST_CHAR + len(widths) + 1, FALLBACK_WIDTH, dtype=np.float64)
+    table[:FIRST_CHAR] = 0.0
+    table[FIRST_CHAR:FIRST_CHAR + len(widths)] = widths
+    return table
+
+
+@lru_cache(maxsize=256)
+def _scaled_metrics(font: str, font_size: float, bold: bool):
+    return font_metrics(font, bold) * (font_size / 1000.0)
+
+
+def measure_words(words: list[str], font_size: float, bold: bool = False, font: str = DEFAULT_FONT):
+    """Return the width in points of every word, measured in one vectorized pass."""
+
+    import numpy as np
+
+    if not words:
+        return np.zeros(0)
+    metrics = _scaled_metrics(font, float(font_size), bold)
+    codes = np.frombuffer("".join(words).encode("utf-32-le"), dtype=np.uint32)
+    glyph_widths = metrics[np.minimum(codes, len(metrics) - 1)]
+    lengths = np.fromiter((len(word) for word in words), dtype=np.int64, count=len(words))
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    # reduceat on an empty word would return the next word's glyph; empty words are zero wide.
+    widths = np.add.reduceat(glyph_widths, np.minimum(starts, max(len(glyph_widths) - 1, 0)))
+    return np.where(lengths > 0, widths, 0.0)
+
+
+def _wrapped_count(word_widths, space_width: float, max_width: float) -> int:
+    """Greedy word wrap of one line; words wider than the box are broken across lines."""
+
+    lines = 1
+    used = 0.0
+    for width in word_widths:
+        if used and used + space_width + width <= max_width:
+            used += space_width + width
+            continue
+        if used:
+            lines += 1
+        if width > max_width:
+            lines += math.ceil(width / max_width) - 1
+            used = width - (math.ceil(width / max_width) - 1) * max_width
+        else:
+            used = width
+    return lines
+
+
+def wrapped_line_counts(
+    texts: list[list[str]],
+    max_widths: list[float],
+    font_size: float,
+    bold: bool = False,
+    font: str = DEFAULT_FONT,
+) -> list[int]:
+    """Return how many rendered lines each text (a list of hard lines) wraps to at its box width."""
+
+    import numpy as np
+
+    words: list[str] = []
+    line_spans: list[tuple[int, int, int]] = []  # (text index, first word, word count)
+    for index, lines in enumerate(texts):
+        for line in lines:
+            line_words = line.split()
+            line_spans.append((index, len(words), len(line_words)))
+            words.extend(line_words)
+
+    word_widths = measure_words(words, font_size, bold, font)
+    space_width = float(_scaled_metrics(font, float(font_size), bold)[ord(" ")])
+    # Lines that fit without wrapping (the common case) are settled with array arithmetic.
+    cumulative = np.concatenate(([0.0], np.cumsum(word_widths)))
+    firsts = np.fromiter((span[1] for span in line_spans), dtype=np.int64, count=len(line_spans))
+    word_counts = np.fromiter((span[2] for span in line_spans), dtype=np.int64, count=len(line_spans))
+    line_lengths = (
+        cumulative[firsts + word_counts] - cumulative[firsts] + space_width * np.maximum(word_counts - 1, 0)
+    )
+
+    counts = [0] * len(texts)
+    for position, (index, first, count) in enumerate(line_spans):
+        max_width = max(float(max_widths[index]), 1.0)
+        if line_lengths[position] <= max_width:
+            counts[index] += 1
+        else:
+            counts[index] += _wrapped_count(word_widths[first:first + count].tolist(), space_width, max_width)
+    return [max(count, 1) for count in counts]
+
+
+def text_block_height(line_count: int, font_size: float) -> float:
+    """Return the height in points of line_count lines at the standard line spacing."""
+
+    return line_count * font_size * LINE_SPACING
+
+
+def fit_font_size(
+    texts: list[list[str]],
+    max_widths: list[float],
+    max_height: float,
+    font_size: float,
+    min_font_size: float,
+    bold: bool = False,
+) -> float:
+    """Return the largest whole-point size, down to min_font_size, at which all texts stack within max_height."""
+
+    size = float(font_size)
+    while size > min_font_size:
+        line_count = sum(wrapped_line_counts(texts, max_widths, size, bold))
+        if text_block_height(line_count, size) <= max_height:
+            return size
+        size -= 1
+    return float(min_font_size)
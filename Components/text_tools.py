@@ -4,7 +4,42 @@ import aspose.slides as slides  # pyright: ignore[reportMissingModuleSource]
 from aspose.pydrawing import Color  # pyright: ignore[reportAttributeAccessIssue, reportMissingModuleSource]
 from aspose.slides import FillType  # pyright: ignore[reportAttributeAccessIssue]
 
+from Components.inline_markdown import Run, parse_inline, plain_text
+from Components.profiling import profiled
+from Components.text_metrics import fit_font_size, text_block_height, wrapped_line_counts
 
+LIST_MIN_FONT_SIZE = 10
+# Hanging indent PowerPoint gives each bullet level, in ems of the list font.
+LIST_LEVEL_INDENT_EM = 1.5
+# Typeface for `inline code` runs.
+CODE_FONT = "Consolas"
+
+
+def add_markdown_portions(para, text: str) -> list[tuple["slides.Portion", Run]]:  # pyright: ignore[reportAttributeAccessIssue]
+    """Append one portion per inline-markdown run of text to para and return (portion, run) pairs."""
+
+    added = []
+    for run in parse_inline(text):
+        portion = slides.Portion(run.text)
+        para.portions.add(portion)
+        added.append((portion, run))
+    return added
+
+
+def apply_run_format(pf, run: Run) -> None:
+    """Set the font attributes a run's markers ask for on a portion format; plain runs are left alone."""
+
+    if run.bold:
+        pf.font_bold = slides.NullableBool.TRUE
+    if run.italic:
+        pf.font_italic = slides.NullableBool.TRUE
+    if run.code:
+        pf.latin_font = slides.FontData(CODE_FONT)
+    if run.link is not None:
+        pf.hyperlink_manager.set_external_hyperlink_click(run.link)
+
+
+@profiled("render_html_into_shape")
 def render_html_into_shape(shape: slides.IShape, html: str) -> None:  # pyright: ignore[reportAttributeAccessIssue]
     tf = shape.text_frame
     tf.text = ""
@@ -52,20 +87,7 @@ def render_meeting_info_markdown(shape: slides.IShape, markdown: str) -> None:
             tf.paragraphs.add(para)
             para.paragraph_format.alignment = slides.TextAlignment.LEFT
             para.portions.clear()
-
-            parts = re.split(r"(\*\*.*?\*\*)", line)
-            for part in parts:
-                if not part:
-                    continue
-                is_bold = part.startswith("**") and part.endswith("**") and len(part) >= 4
-                text = part[2:-2] if is_bold else part
-                portion = slides.Portion(text)
-                pf = portion.portion_format
-                pf.font_height = 12 if is_bold else 18
-                pf.font_bold = slides.NullableBool.TRUE if is_bold else slides.NullableBool.FALSE
-                pf.fill_format.fill_type = FillType.SOLID
-                pf.fill_format.solid_fill_color.color = Color.black
-                para.portions.add(portion)
+            _add_meeting_portions(para, line)
         return
 
     # transparent base shape
@@ -80,14 +102,20 @@ def render_meeting_info_markdown(shape: slides.IShape, markdown: str) -> None:
     n = max(1, len(lines))
     per_h = max(30.0, (height - gap * (n - 1)) / n)
     per_h = min(per_h, 0.75 * 72)  # cap at 0.75 inches
-
-    for line in lines:
+    # Items whose wrapped text needs more than per_h get it, as long as the stack still fits.
+    texts = [[_plain_markdown_line(line)] for line in lines]
+    line_counts = wrapped_line_counts(texts, [max(width - 20, 1.0)] * len(texts), 18)
+    item_heights = [max(per_h, text_block_height(count, 18) + 16) for count in line_counts]
+    if sum(item_heights) + gap * (n - 1) > height:
+        item_heights = [per_h] * len(lines)
+
+    for line, item_height in zip(lines, item_heights):
         rect = slide.shapes.add_auto_shape(
             slides.ShapeType.RECTANGLE,
             x,
             y,
             width,
-            per_h,
+            item_height,
         )
         rect.fill_format.fill_type = FillType.SOLID
         rect.fill_format.solid_fill_color.color = Color.from_argb(64, 201, 203, 224)  # c9cbe0 alpha=25
@@ -110,22 +138,30 @@ def render_meeting_info_markdown(shape: slides.IShape, markdown: str) -> None:
         tf.paragraphs.add(para)
         para.paragraph_format.alignment = slides.TextAlignment.LEFT
         para.portions.clear()
+        _add_meeting_portions(para, line)
 
-        parts = re.split(r"(\*\*.*?\*\*)", line)
-        for part in parts:
-            if not part:
-                continue
-            is_bold = part.startswith("**") and part.endswith("**") and len(part) >= 4
-            text = part[2:-2] if is_bold else part
-            portion = slides.Portion(text)
-            pf = portion.portion_format
-            pf.font_height = 12 if is_bold else 18
-            pf.font_bold = slides.NullableBool.TRUE if is_bold else slides.NullableBool.FALSE
-            pf.fill_format.fill_type = FillType.SOLID
-            pf.fill_format.solid_fill_color.color = Color.black
-            para.portions.add(portion)
+        y += item_height + gap
+
+
+def _add_meeting_portions(para, line: str) -> None:
+    """Add a meeting-info line's runs: bold labels at 12pt, values at 18pt, all black."""
+
+    for portion, run in add_markdown_portions(para, line):
+        pf = portion.portion_format
+        pf.font_height = 12 if run.bold else 18
+        pf.font_bold = slides.NullableBool.TRUE if run.bold else slides.NullableBool.FALSE
+        pf.fill_format.fill_type = FillType.SOLID
+        pf.fill_format.solid_fill_color.color = Color.black
+        apply_run_format(pf, run)
+
+
+def _plain_markdown_line(line: str) -> str:
+    """Return a markdown line as it is drawn: no leading dash, no inline markers."""
+
+    if line.startswith("- "):
+        line = line[2:].strip()
+    return plain_text(line)
 
-        y += per_h + gap
 
 def _parse_markdown_list(md: str) -> list[tuple[int, str]]:
     entries: list[tuple[int, str]] = []
@@ -164,7 +200,7 @@ def render_list_into_shape(
 ) -> None:  # pyright: ignore[reportAttributeAccessIssue]
     """Render a (possibly nested) Python list as bullet points inside the shape."""
     styles = styles or {}
-    font_size = styles.get("font_size") or styles.get("fontSize") or 16
+    font_size = styles.get("fontSize") or 16
 
     tf = shape.text_frame
     tf.text = ""
@@ -186,6 +222,17 @@ def render_list_into_shape(
     else:
         entries = []
 
+    # Pick a font size whose wrapped text fits the shape instead of leaving it to autofit.
+    if entries and shape.width > 0 and shape.height > 0:
+        text_width = shape.width - 20
+        font_size = fit_font_size(
+            [["\u2022 " + plain_text(text)] for _, text in entries],
+            [max(text_width - depth * LIST_LEVEL_INDENT_EM * font_size, 1.0) for depth, _ in entries],
+            shape.height - 16,
+            font_size,
+            min(font_size, LIST_MIN_FONT_SIZE),
+        )
+
     for depth, text in entries:
         para = slides.Paragraph()
         para.paragraph_format.alignment = slides.TextAlignment.LEFT
@@ -194,11 +241,11 @@ def render_list_into_shape(
         para.paragraph_format.bullet.char = "\u2022"
         para.paragraph_format.bullet.color.color = Color.black
         para.portions.clear()
-        portion = slides.Portion(text)
-        pf = portion.portion_format
-        pf.font_height = font_size
-        pf.font_bold = slides.NullableBool.FALSE
-        pf.fill_format.fill_type = FillType.SOLID
-        pf.fill_format.solid_fill_color.color = Color.black
-        para.portions.add(portion)
+        for portion, run in add_markdown_portions(para, text):
+            pf = portion.portion_format
+            pf.font_height = font_size
+            pf.font_bold = slides.NullableBool.FALSE
+            pf.fill_format.fill_type = FillType.SOLID
+            pf.fill_format.solid_fill_color.color = Color.black
+            apply_run_format(pf, run)
         tf.paragraphs.add(para)
@@ -3,10 +3,16 @@ from aspose.pydrawing import Color  # pyright: ignore[reportAttributeAccessIssue
 from aspose.slides import FillType, NullableBool  # pyright: ignore[reportAttributeAccessIssue, reportMissingModuleSource]
 from aspose.slides.util import SlideUtil  # pyright: ignore[reportMissingModuleSource]
 
-from typing import TYPE_CHECKING
+from Components.layout_tools import SlideObject
 
-if TYPE_CHECKING:
-    from main import SlideObject
+TITLE_X = 40
+TITLE_Y = 30
+TITLE_WIDTH = 640
+TITLE_HEIGHT = 60
+TITLE_CONTENT_GAP = 20
+TITLE_SHAPE_NAME = "SlideTitle"
+TITLE_ONLY_SHAPE_NAME = "SlideTitleOnly"
+TITLE_ONLY_HEIGHT = 160
 
 
 def _find_existing_title_shape(slide: slides.ISlide) -> slides.IShape | None:  # pyright: ignore[reportAttributeAccessIssue]
@@ -31,21 +37,32 @@ def _emphasize_title_text(title_frame: slides.TextFrame) -> None:  # pyright: ig
         portion.portion_format.font_bold = NullableBool.TRUE
 
 
-def add_title(slide_object: "SlideObject", text: str) -> None:
-    """Ensure the slide has a bold title shape with no fill."""
+def _format_title_box(title_shape: slides.IShape) -> None:  # pyright: ignore[reportAttributeAccessIssue]
+    title_shape.fill_format.fill_type = FillType.NO_FILL
+    title_shape.line_format.fill_format.fill_type = FillType.NO_FILL
+    title_shape.text_frame.text_frame_format.anchoring_type = slides.TextAnchorType.CENTER  # pyright: ignore[reportAttributeAccessIssue]
 
-    slide = slide_object.aspose_object
-    title_shape = _find_existing_title_shape(slide)
 
+def add_title_box(slide: slides.ISlide) -> slides.IShape:  # pyright: ignore[reportAttributeAccessIssue]
+    """Return the slide's title shape, formatted but empty: its title placeholder or a new box."""
+
+    title_shape = _find_existing_title_shape(slide)
     if title_shape is None:
         title_shape = slide.shapes.add_auto_shape(
-            slides.ShapeType.RECTANGLE, 40, 30, 640, 60  # pyright: ignore[reportAttributeAccessIssue]
+            slides.ShapeType.RECTANGLE, TITLE_X, TITLE_Y, TITLE_WIDTH, TITLE_HEIGHT  # pyright: ignore[reportAttributeAccessIssue]
         )
+        title_shape.name = TITLE_SHAPE_NAME
+    _format_title_box(title_shape)
+    return title_shape
 
-    title_shape.fill_format.fill_type = FillType.NO_FILL
+
+def add_title(slide_object: "SlideObject", text: str) -> None:
+    """Ensure the slide has a bold title shape with no fill."""
+
+    slide_object.title = text
+    title_shape = slide_object.template_shape(TITLE_SHAPE_NAME) or add_title_box(slide_object.aspose_object)
     title_frame = title_shape.text_frame
     title_frame.text = text
-    title_frame.text_frame_format.anchoring_type = slides.TextAnchorType.CENTER  # pyright: ignore[reportAttributeAccessIssue]
     paragraph = title_frame.paragraphs[0]
     paragraph.paragraph_format.alignment = slides.TextAlignment.LEFT  # pyright: ignore[reportAttributeAccessIssue]
     for portion in paragraph.portions:
@@ -53,36 +70,71 @@ def add_title(slide_object: "SlideObject", text: str) -> None:
         portion.portion_format.font_bold = NullableBool.TRUE
         portion.portion_format.fill_format.fill_type = FillType.SOLID
         portion.portion_format.fill_format.solid_fill_color.color = Color.from_argb(255, 33, 45, 106)
-    title_shape.line_format.fill_format.fill_type = FillType.NO_FILL
     _emphasize_title_text(title_frame)
 
     title_bottom_y = title_shape.y + title_shape.height
     slide_object.last_bottom_y = max(slide_object.last_bottom_y, title_bottom_y)
-    slide_object.chart_start_y = slide_object.last_bottom_y + 20
-
+    slide_object.chart_start_y = slide_object.last_bottom_y + TITLE_CONTENT_GAP
+
+
+def reserve_title_space(slide_object: "SlideObject") -> None:
+    """Advance layout state as add_title would for a freshly created title box."""
+
+    slide_object.last_bottom_y = max(slide_object.last_bottom_y, TITLE_Y + TITLE_HEIGHT)
+    slide_object.chart_start_y = slide_object.last_bottom_y + TITLE_CONTENT_GAP
+
+
+def continuation_slide_object(slide_object: "SlideObject", page: int) -> "SlideObject":
+    """Return the page-th continuation of a slide, inserting blank slides with the same title as needed."""
+
+    while len(slide_object.continuations) < page:
+        previous = slide_object.continuations[-1] if slide_object.continuations else slide_object
+        slide = previous.aspose_object
+        slide_collection = slide.presentation.slides
+        new_slide = slide_collection.insert_empty_slide(slide_collection.index_of(slide) + 1, slide.layout_slide)
+        _remove_default_placeholders(new_slide)
+        continuation = SlideObject(
+            new_slide,
+            slide_object.slide_width,
+            slide_object.slide_height,
+            chart_columns=slide_object.chart_columns,
+            column_gap=slide_object.column_gap,
+            row_gap=slide_object.row_gap,
+            total_charts=slide_object.total_charts,
+            height_cap=slide_object.height_cap,
+            context=slide_object.context,
+        )
+        if slide_object.title:
+            add_title(continuation, slide_object.title)
+        slide_object.continuations.append(continuation)
+    return slide_object.continuations[page - 1]
 
-def add_title_only(slide_object: "SlideObject", text: str) -> None:
-    """Render a large, centered title for title-only slides."""
 
-    slide = slide_object.aspose_object
-    width = slide_object.slide_width - 80
-    height = 160
-    x = 40
-    y = (slide_object.slide_height - height) / 3
+def add_title_only_box(slide: slides.ISlide, slide_width: float, slide_height: float) -> slides.IShape:  # pyright: ignore[reportAttributeAccessIssue]
+    """Add the empty, formatted text box add_title_only writes into."""
 
     shape = slide.shapes.add_auto_shape(
         slides.ShapeType.RECTANGLE,
-        x,
-        y,
-        width,
-        height,
+        40,
+        (slide_height - TITLE_ONLY_HEIGHT) / 3,
+        slide_width - 80,
+        TITLE_ONLY_HEIGHT,
     )
+    shape.name = TITLE_ONLY_SHAPE_NAME
     shape.fill_format.fill_type = FillType.NO_FILL
     shape.line_format.fill_format.fill_type = FillType.NO_FILL
+    shape.text_frame.text_frame_format.anchoring_type = slides.TextAnchorType.CENTER  # pyright: ignore[reportAttributeAccessIssue]
+    return shape
 
+
+def add_title_only(slide_object: "SlideObject", text: str) -> None:
+    """Render a large, centered title for title-only slides."""
+
+    shape = slide_object.template_shape(TITLE_ONLY_SHAPE_NAME) or add_title_only_box(
+        slide_object.aspose_object, slide_object.slide_width, slide_object.slide_height
+    )
     tf = shape.text_frame
     tf.text = text
-    tf.text_frame_format.anchoring_type = slides.TextAnchorType.CENTER  # pyright: ignore[reportAttributeAccessIssue]
     para = tf.paragraphs[0]
     para.paragraph_format.alignment = slides.TextAlignment.LEFT  # pyright: ignore[reportAttributeAccessIssue]
     for portion in para.portions:
@@ -92,7 +144,7 @@ def add_title_only(slide_object: "SlideObject", text: str) -> None:
         pf.fill_format.fill_type = FillType.SOLID
         pf.fill_format.solid_fill_color.color = Color.from_argb(255, 33, 45, 106)
 
-    slide_object.last_bottom_y = y + height
+    slide_object.last_bottom_y = shape.y + shape.height
     slide_object.chart_start_y = slide_object.last_bottom_y + 20
 
 
@@ -1,6 +1,13 @@
+import argparse
+import gc
 import json
-import math
+import os
+import sys
+import time
+from io import BytesIO
+from itertools import islice
 from pathlib import Path
+from typing import Iterator
 
 import aspose.slides as slides
 from aspose.pydrawing import Color
@@ -8,282 +15,230 @@ from aspose.slides import FillType
 from Components.utils import (
     add_title,
     add_title_only,
-    _remove_default_placeholders,
+)
+from Components.batch_tools import (
+    DeckResult,
+    format_summary,
+    iter_deck_sources,
+    summarize_results,
+    unique_output_path,
 )
 from Components.chart_tools import add_graph
-from Components.map_tools import render_map_image
+from Components.deck_plan import DeckPlan, SlidePlan, compile_deck
+from Components.deck_schema import QUALITY_PROFILES, DeckValidationError, validate_deck
+from Components.image_buffers import image_buffer_stats
+from Components.image_formats import image_dedup_stats
+from Components.incremental_tools import (
+    SlideRecord,
+    load_manifest,
+    remove_manifest,
+    render_settings,
+    save_manifest,
+    slide_fingerprint,
+)
+from Components.json_tools import load_path, stream_deck
+from Components.layout_tools import (
+    SHAPE_MAX_HEIGHT,
+    BuildContext,
+    SlideObject,
+    chart_grid_slide_object,
+    manual_layout_slide_object,
+)
+from Components.map_tools import map_image_key, map_raster_scale, render_map_image
+from Components.profiling import disable_profiling, enable_profiling, format_profile, profiled, span
+from Components.raster_quality import QUALITY_ENV
+from Components.render_cache import configure_render_caches, format_render_cache_stats, render_cache_stats
+from Components.render_plan import plan_raster_jobs, prerender_raster_jobs
+from Components.slide_templates import (
+    SlideTemplates,
+    add_layout_guides,
+    add_slot_frame,
+    slide_template_stats,
+    slot_frame_name,
+)
 from Components.text_tools import render_html_into_shape, render_meeting_info_markdown, render_list_into_shape
 from Components.table_tools import render_table, render_meeting_info_table
 
-CARD_PADDING = 12
-INCH_TO_PT = 72
-SHAPE_MAX_HEIGHT_IN = 7
-SHAPE_MAX_HEIGHT = SHAPE_MAX_HEIGHT_IN * INCH_TO_PT
-CARD_MAX_HEIGHT_IN = 5.2
-CARD_MAX_HEIGHT = CARD_MAX_HEIGHT_IN * INCH_TO_PT
 INPUT_JSON_PATH = Path('Input.json')
+DEFAULT_OUTPUT_PATH = Path("NewPresentation.pptx")
+# Slides built per in-memory chunk when streaming; 0 builds the whole deck in one presentation.
+DEFAULT_CHUNK_SIZE = 20
+STREAMING_MAX_BLOB_BYTES = 32 * 1024 * 1024
+# Worker processes used to pre-render chart/map PNGs; 0 renders inline while slides are built.
+RENDER_WORKERS = int(os.environ.get("ACTIVEER_RENDER_WORKERS", "0") or 0)
 
 
 def load_deck(path: Path = INPUT_JSON_PATH) -> dict:
-    """Load the deck definition from Input.json."""
+    """Load and validate the deck definition from Input.json, raising DeckValidationError if it is malformed."""
 
     try:
-        with path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}
-
-    return data.get("deck", {})
-
-
-class SlideObject:
-    """State holder for a slide while we build it."""
-
-    def __init__(
-        self,
-        aspose_object: slides.ISlide,
-        slide_width: float,
-        slide_height: float,
-        chart_columns: int = 3,
-        column_gap: float = 60,
-        row_gap: float = 50,
-        total_charts: int = 0,
-        height_cap: float = CARD_MAX_HEIGHT,
-    ):  # pyright: ignore[reportAttributeAccessIssue]
-        self.aspose_object = aspose_object
-        self.last_right_x = 0
-        self.last_bottom_y = 0
-        self.slide_width = slide_width
-        self.slide_height = slide_height
-        self.left_margin = 20
-        self.chart_columns = max(1, chart_columns)
-        self.column_gap = max(25, column_gap)
-        self.row_gap = max(20, row_gap)
-        self.total_charts = max(1, total_charts)
-        self.max_rows = max(1, math.ceil(self.total_charts / self.chart_columns))
-        self.chart_start_y = 120
-        self.current_column = 0
-        self.current_row = 0
-        self.height_cap = height_cap
-        self.chart_width = (
-            (self.slide_width - self.left_margin * 2)
-            - self.column_gap * (self.chart_columns - 1)
-        ) / self.chart_columns
-
-    def get_next_chart_position(self, chart_height: float) -> tuple[float, float]:
-        if self.current_column >= self.chart_columns:
-            self.current_column = 0
-            self.current_row += 1
-        x = self.left_margin + (self.chart_width + self.column_gap) * self.current_column
-        y = self.chart_start_y + self.current_row * (chart_height + self.row_gap)
-        self.current_column += 1
-        self.last_bottom_y = y + chart_height
-        return x, y
-
-    def get_chart_height(self) -> float:
-        """Return a per-row height that keeps all charts within the slide."""
-
-        rows = max(1, self.max_rows)
-        available_height = (
-            self.slide_height
-            - self.chart_start_y
-            - self.row_gap * (rows - 1)
-            - CARD_PADDING * 1  # reduced bottom margin
-        )
-        per_row = available_height / rows if available_height > 0 else 120
-        per_row = min(per_row, self.height_cap)
-        return max(120, per_row)
+        data = load_path(path)
+    except json.JSONDecodeError as exc:
+        raise DeckValidationError([f"{path}: invalid JSON ({exc})"]) from exc
+    except OSError as exc:
+        raise DeckValidationError([f"{path}: cannot read file ({exc.strerror or exc})"]) from exc
+
+    deck = data.get("deck", {}) if isinstance(data, dict) else data
+    validate_deck(deck)
+    return deck
+
 
-def create_slide(presentation: slides.Presentation, deck_payload: dict) -> None:  # pyright: ignore[reportAttributeAccessIssue]
+@profiled("create_slide")
+def create_slide(
+    presentation: slides.Presentation,
+    deck_payload: dict,
+    render_workers: int = RENDER_WORKERS,
+) -> None:  # pyright: ignore[reportAttributeAccessIssue]
     """Build slides from the parsed deck JSON definition."""
 
     presentation.slide_size.set_size(
         slides.SlideSizeType.WIDESCREEN, slides.SlideSizeScaleType.MAXIMIZE
     )
     layout_slide = presentation.layout_slides[0]
-    slide_width = presentation.slide_size.size.width
-    slide_height = presentation.slide_size.size.height
-
-    slide_data = sorted(deck_payload.get("slides", []), key=lambda slide: slide.get("order", 0))
-    if not slide_data:
+    with span("compile"):
+        deck_plan = compile_deck(
+            deck_payload, presentation.slide_size.size.width, presentation.slide_size.size.height
+        )
+    if not deck_plan.slides:
         return
-    for slide_payload in slide_data:
-        slide_type = slide_payload.get("slide_type")
-        slide = presentation.slides.add_empty_slide(layout_slide)
-        _remove_default_placeholders(slide)
-        if slide_type == "title_only":
-            slide_object = SlideObject(
-                slide,
-                slide_width,
-                slide_height,
-                chart_columns=1,
-                column_gap=0,
-                row_gap=0,
-                total_charts=1,
-                height_cap=SHAPE_MAX_HEIGHT,
-            )
-            add_title_only(slide_object, slide_payload.get("title", ""))
-            continue
-
-        components = slide_payload.get("body") or []
-        chart_only = _all_charts(components)
-
-        if chart_only:
-            column_count = max(1, len(components))
-            slide_object = SlideObject(
-                slide,
-                slide_width,
-                slide_height,
-                chart_columns=column_count,
-                column_gap=35,
-                row_gap=35,
-                total_charts=max(1, len(components)),
-                height_cap=CARD_MAX_HEIGHT,
-            )
-            slide_title = slide_payload.get("title", "")
-            if slide_title:
-                add_title(slide_object, slide_title)
-            _add_layout_guides(slide_object, column_count)
-            for component in components:
-                add_graph(
-                    slide_object,
-                    component,
-                    component.get("name", slide_title or "Chart"),
-                )
-        else:
-            _render_manual_layout(
-                presentation,
-                slide,
-                components,
-                slide_width,
-                slide_height,
-                slide_payload.get("title", ""),
-                slide_payload.get("column_widths"),
-            )
-
-
-def _add_layout_guides(slide_object: SlideObject, columns: int) -> None:
-    """Draw plain background guides that divide the available width into columns."""
-
-    slide = slide_object.aspose_object
-    chart_height = slide_object.get_chart_height()
-    total_gap = (columns - 1) * slide_object.column_gap
-    col_width = (
-        (slide_object.slide_width - slide_object.left_margin * 2 - total_gap)
-        / max(1, columns)
+    context = _new_build_context(deck_plan, render_workers)
+    try:
+        with SlideTemplates(presentation, layout_slide) as templates:
+            for slide_plan in deck_plan.slides:
+                with span("slide", order=slide_plan.order, slide_type=slide_plan.slide_type):
+                    _build_slide(templates, slide_plan, deck_plan, context)
+    finally:
+        context.close()
+
+
+def _new_build_context(
+    deck_plan: DeckPlan,
+    render_workers: int,
+    slide_plans: list[SlidePlan] | None = None,
+) -> BuildContext:
+    """Create the per-build context, pre-rendering images when workers are requested."""
+
+    context = BuildContext(
+        paginate_tables=deck_plan.paginate_tables,
+        chart_backend=deck_plan.chart_backend,
+        image_format=deck_plan.image_format,
+        quality=deck_plan.quality,
     )
-
-    y = slide_object.chart_start_y
-    for idx in range(columns):
-        x = slide_object.left_margin + idx * (col_width + slide_object.column_gap)
-        guide = slide.shapes.add_auto_shape(
-            slides.ShapeType.RECTANGLE,
-            x,
-            y,
-            col_width,
-            chart_height,
+    if render_workers > 0:
+        # Fan image generation out to worker processes; Aspose calls below stay on this thread.
+        jobs = plan_raster_jobs(deck_plan, slide_plans)
+        with span("prerender", jobs=len(jobs), workers=render_workers):
+            context.prerendered = prerender_raster_jobs(jobs, render_workers)
+    return context
+
+
+def _build_slide(
+    templates: SlideTemplates,
+    slide_plan: SlidePlan,
+    deck_plan: DeckPlan,
+    context: BuildContext,
+) -> None:
+    """Append one slide, cloned from its layout's skeleton when one exists, and draw its compiled plan."""
+
+    slide_width = deck_plan.slide_width
+    slide_height = deck_plan.slide_height
+    slide, template_shapes = templates.new_slide(slide_plan)
+    if slide_plan.layout == "title_only":
+        slide_object = SlideObject(
+            slide,
+            slide_width,
+            slide_height,
+            chart_columns=1,
+            column_gap=0,
+            row_gap=0,
+            total_charts=1,
+            height_cap=SHAPE_MAX_HEIGHT,
+            context=context,
         )
-        guide.fill_format.fill_type = FillType.NO_FILL
-        guide.line_format.fill_format.fill_type = FillType.NO_FILL
-
-
-def _all_charts(components: list) -> bool:
-    if not components:
-        return False
-    return all(isinstance(c, dict) and c.get("component") == "chart" for c in components)
+        slide_object.template_shapes = template_shapes or {}
+        add_title_only(slide_object, slide_plan.title)
+        return
 
+    if slide_plan.layout == "chart_grid":
+        slide_object = chart_grid_slide_object(
+            slide,
+            slide_width,
+            slide_height,
+            slide_plan.body,
+            context=context,
+        )
+        slide_object.template_shapes = template_shapes or {}
+        if slide_plan.title:
+            add_title(slide_object, slide_plan.title)
+        if template_shapes is None:
+            add_layout_guides(slide_object, len(slide_plan.body))
+        for component in slide_plan.components:
+            add_graph(
+                slide_object,
+                component.payload,
+                component.payload.get("name", slide_plan.title or "Chart"),
+            )
+        return
 
-def _render_manual_layout(
-    presentation: slides.Presentation,
-    slide: slides.ISlide,
-    components: list,
-    slide_width: float,
-    slide_height: float,
-    title: str,
-    column_widths: list | None = None,
-) -> None:
-    slide_object = SlideObject(
+    slide_object = manual_layout_slide_object(
         slide,
         slide_width,
         slide_height,
-        chart_columns=len(components),
-        column_gap=35,
-        row_gap=35,
-        total_charts=len(components),
-        height_cap=SHAPE_MAX_HEIGHT,
+        slide_plan.body,
+        context=context,
+    )
+    slide_object.template_shapes = template_shapes or {}
+    if slide_plan.title:
+        add_title(slide_object, slide_plan.title)
+    for component in slide_plan.components:
+        with span("component", component=component.kind):
+            _render_component(
+                slide_object,
+                component.payload,
+                component.kind,
+                component.x,
+                component.y,
+                component.width,
+                component.height,
+            )
+    slide_object.last_bottom_y = slide_plan.content_bottom
+
+
+def _slot_frame(slide_object: SlideObject, x: float, y: float, width: float, height: float):
+    """Return the skeleton's text frame for this slot, or add one."""
+
+    return slide_object.template_shape(slot_frame_name(x, y)) or add_slot_frame(
+        slide_object.aspose_object, x, y, width, height
     )
-    if title:
-        add_title(slide_object, title)
-
-    chart_height = slide_object.get_chart_height()
-    total_gap = slide_object.column_gap * (len(components) - 1)
-    # Equal split unless ratios are provided via column_widths.
-    if isinstance(column_widths, list) and column_widths and all(isinstance(v, (int, float)) and v > 0 for v in column_widths):
-        ratios = column_widths[: len(components)]
-        if len(ratios) < len(components):
-            ratios += [1.0] * (len(components) - len(ratios))
-        total = sum(ratios) or len(components)
-        widths = [
-            (slide_object.slide_width - slide_object.left_margin * 2 - total_gap)
-            * r
-            / total
-            for r in ratios
-        ]
-    else:
-        widths = [
-            (slide_object.slide_width - slide_object.left_margin * 2 - total_gap)
-            / max(1, len(components))
-        ] * len(components)
-    base_y = slide_object.chart_start_y
-
-    for idx, component in enumerate(components):
-        col_width = widths[idx]
-        x = slide_object.left_margin + sum(widths[:idx]) + slide_object.column_gap * idx
-        _render_component_in_slot(slide_object, component, x, base_y, col_width, chart_height)
-
-    slide_object.last_bottom_y = base_y + chart_height
-
-
-def _render_component_in_slot(slide_object: SlideObject, component, x: float, y: float, width: float, height: float) -> None:
-    if isinstance(component, list):
-        items = [c for c in component if c]
-        if not items:
-            return
-        gap = 12
-        available_height = height - gap * (len(items) - 1)
-        if len(items) == 2:
-            heights = [available_height * 0.6, available_height * 0.4]
-        else:
-            per = available_height / len(items)
-            heights = [per] * len(items)
 
-        current_y = y
-        for item, h in zip(items, heights):
-            _render_component_in_slot(slide_object, item, x, current_y, width, h)
-            current_y += h + gap
-        return
 
-    if not isinstance(component, dict):
-        component = {"component": "text", "content": str(component)}
+def _render_component(
+    slide_object: SlideObject,
+    component: dict,
+    comp_type: str | None,
+    x: float,
+    y: float,
+    width: float,
+    height: float,
+) -> None:
+    """Draw one component dict into its slot."""
 
-    comp_type = component.get("component")
     if comp_type == "chart":
-        # Fallback to chart renderer using current slot; add_graph uses internal positioning, so temporarily override chart width/position.
-        original_left = slide_object.left_margin
-        original_chart_width = slide_object.chart_width
-        original_chart_start_y = slide_object.chart_start_y
-        slide_object.left_margin = x
-        slide_object.chart_width = width
-        slide_object.chart_start_y = y
-        slide_object.current_column = 0
-        slide_object.current_row = 0
-        add_graph(slide_object, component, component.get("name", "Chart"))
-        slide_object.left_margin = original_left
-        slide_object.chart_width = original_chart_width
-        slide_object.chart_start_y = original_chart_start_y
+        # add_graph uses internal positioning, so temporarily point the chart grid at this slot.
+        with slide_object.chart_slot(x, y, width):
+            add_graph(slide_object, component, component.get("name", "Chart"))
     elif comp_type == "map":
-        map_bytes = render_map_image(component.get("content", []) or [], width=int(width), height=int(height))
-        image = slide_object.aspose_object.presentation.images.add_image(map_bytes)
+        states = component.get("content", []) or []
+        image_format = slide_object.context.image_format
+        scale = map_raster_scale(width, height, slide_object.context.quality)
+        map_bytes = slide_object.context.prerendered.get(
+            map_image_key(states, int(width), int(height), image_format=image_format, scale=scale)
+        )
+        if map_bytes is None:
+            map_bytes = render_map_image(
+                states, width=int(width), height=int(height), image_format=image_format, scale=scale
+            )
+        image = slide_object.context.images.add(slide_object.aspose_object.presentation, map_bytes, image_format)
         frame = slide_object.aspose_object.shapes.add_picture_frame(
             slides.ShapeType.RECTANGLE,
             x,
@@ -298,15 +253,7 @@ def _render_component_in_slot(slide_object: SlideObject, component, x: float, y:
     elif comp_type == "meeting_info_table":
         render_meeting_info_table(slide_object, component, x, y, width, height)
     elif comp_type == "list":
-        shape = slide_object.aspose_object.shapes.add_auto_shape(
-            slides.ShapeType.RECTANGLE,
-            x,
-            y,
-            width,
-            height,
-        )
-        shape.fill_format.fill_type = FillType.NO_FILL
-        shape.line_format.fill_format.fill_type = FillType.NO_FILL
+        shape = _slot_frame(slide_object, x, y, width, height)
         render_list_into_shape(
             shape,
             None,
@@ -314,30 +261,421 @@ def _render_component_in_slot(slide_object: SlideObject, component, x: float, y:
             component.get("styles"),
         )
     elif comp_type == "meeting_info_text":
-        shape = slide_object.aspose_object.shapes.add_auto_shape(
-            slides.ShapeType.RECTANGLE,
-            x,
-            y,
-            width,
-            height,
-        )
-        shape.fill_format.fill_type = FillType.NO_FILL
-        shape.line_format.fill_format.fill_type = FillType.NO_FILL
+        shape = _slot_frame(slide_object, x, y, width, height)
         render_meeting_info_markdown(shape, component.get("content", ""))
     else:
-        shape = slide_object.aspose_object.shapes.add_auto_shape(
-            slides.ShapeType.RECTANGLE,
-            x,
-            y,
-            width,
-            height,
-        )
-        shape.fill_format.fill_type = FillType.NO_FILL
-        shape.line_format.fill_format.fill_type = FillType.NO_FILL
+        shape = _slot_frame(slide_object, x, y, width, height)
         render_html_into_shape(shape, component.get("content", ""))
 
-# Instantiate a Presentation object that represents a presentation file
-deck_definition = load_deck()
-with slides.Presentation() as presentation:  # pyright: ignore[reportAttributeAccessIssue]
-    create_slide(presentation, deck_definition)
-    presentation.save("NewPresentation.pptx", slides.export.SaveFormat.PPTX)
+
+def build_deck(
+    deck_payload: dict,
+    output_path: Path | str = DEFAULT_OUTPUT_PATH,
+    render_workers: int = RENDER_WORKERS,
+) -> int:
+    """Build one deck and save it as PPTX, returning the number of slides written."""
+
+    # Instantiate a Presentation object that represents a presentation file
+    with slides.Presentation() as presentation:  # pyright: ignore[reportAttributeAccessIssue]
+        create_slide(presentation, deck_payload, render_workers)
+        # An incremental manifest left for this path would describe the deck being replaced.
+        remove_manifest(output_path)
+        with span("presentation.save"):
+            presentation.save(str(output_path), slides.export.SaveFormat.PPTX)
+        return len(presentation.slides)
+
+
+def _streaming_load_options() -> slides.LoadOptions:  # pyright: ignore[reportAttributeAccessIssue]
+    """Load options that let Aspose keep image blobs in temporary files instead of memory."""
+
+    load_options = slides.LoadOptions()
+    blob_options = load_options.blob_management_options
+    blob_options.presentation_locking_behavior = slides.PresentationLockingBehavior.KEEP_LOCKED
+    blob_options.is_temporary_files_allowed = True
+    blob_options.max_blobs_bytes_in_memory = STREAMING_MAX_BLOB_BYTES
+    return load_options
+
+
+def build_deck_streaming(
+    deck_payload: dict,
+    output_path: Path | str = DEFAULT_OUTPUT_PATH,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    render_workers: int = RENDER_WORKERS,
+) -> int:
+    """Build a deck chunk by chunk, merging each chunk into the output and freeing it before the next."""
+
+    # Fail before the first chunk is built rather than part-way through the deck.
+    validate_deck(deck_payload)
+    slide_data = sorted(deck_payload.get("slides", []), key=lambda slide: slide.get("order", 0))
+    deck_options = {key: value for key, value in deck_payload.items() if key != "slides"}
+    return _build_chunked(deck_options, iter(slide_data), output_path, chunk_size, render_workers)
+
+
+def build_deck_from_json_stream(
+    path: Path | str,
+    output_path: Path | str = DEFAULT_OUTPUT_PATH,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    render_workers: int = RENDER_WORKERS,
+) -> int:
+    """Build a deck file while it is parsed, so rendering starts before the whole file is read.
+
+    Slides are built in file order, so their `order` values must already be ascending.
+    Each chunk is validated just before it is built, and nothing is saved if any chunk fails.
+    """
+
+    metadata, slide_iter = stream_deck(Path(path))
+    return _build_chunked({"metadata": metadata}, _ascending_slides(slide_iter), output_path, chunk_size, render_workers)
+
+
+def _ascending_slides(slide_iter: Iterator[dict]) -> Iterator[dict]:
+    """Pass slides through, rejecting one whose order would need the whole deck to sort."""
+
+    previous = None
+    for index, slide_payload in enumerate(slide_iter):
+        order = slide_payload.get("order", 0) if isinstance(slide_payload, dict) else 0
+        if isinstance(order, (int, float)) and not isinstance(order, bool):
+            if previous is not None and order < previous:
+                raise DeckValidationError([f"slides[{index}].order: streamed decks must list slides in ascending order"])
+            previous = order
+        yield slide_payload
+
+
+def _build_chunked(
+    deck_options: dict,
+    slide_iter: Iterator[dict],
+    output_path: Path | str,
+    chunk_size: int,
+    render_workers: int,
+) -> int:
+    """Build slides chunk_size at a time into one output presentation and save it."""
+
+    chunk_size = max(1, chunk_size)
+    with slides.Presentation(_streaming_load_options()) as presentation:  # pyright: ignore[reportAttributeAccessIssue]
+        presentation.slide_size.set_size(
+            slides.SlideSizeType.WIDESCREEN, slides.SlideSizeScaleType.MAXIMIZE
+        )
+        layout_slide = presentation.layout_slides[0]
+        while chunk := list(islice(slide_iter, chunk_size)):
+            chunk_payload = deck_options | {"slides": chunk}
+            with slides.Presentation() as chunk_presentation:  # pyright: ignore[reportAttributeAccessIssue]
+                create_slide(chunk_presentation, chunk_payload, render_workers)
+                # Index 0 is the blank slide every new Presentation starts with; the
+                # output keeps its own, so only the chunk's built slides are merged.
+                for chunk_slide in list(chunk_presentation.slides)[1:]:
+                    presentation.slides.add_clone(chunk_slide, layout_slide)
+            # Drop the chunk's payload, rendered images and Aspose wrappers before building the next one.
+            del chunk, chunk_payload
+            gc.collect()
+        remove_manifest(output_path)
+        with span("presentation.save"):
+            presentation.save(str(output_path), slides.export.SaveFormat.PPTX)
+        return len(presentation.slides)
+
+
+def build_deck_incremental(
+    deck_payload: dict,
+    output_path: Path | str = DEFAULT_OUTPUT_PATH,
+    render_workers: int = RENDER_WORKERS,
+) -> tuple[int, int, int]:
+    """Rebuild a deck, cloning slides whose fingerprint matches the previous build.
+
+    Returns (slides written, payloads cloned, payloads rendered). Fingerprints ignore
+    `order`, so moved slides are cloned from their old position rather than re-rendered.
+    """
+
+    validate_deck(deck_payload)
+    output_path = Path(output_path)
+    previous_records = load_manifest(output_path)
+    previous = slides.Presentation(str(output_path)) if previous_records else None  # pyright: ignore[reportAttributeAccessIssue]
+    if previous is not None:
+        # Ignore records that no longer fit, e.g. when the PPTX was edited by hand.
+        previous_count = len(previous.slides)
+        previous_records = {
+            fingerprint: record
+            for fingerprint, record in previous_records.items()
+            if record.index + record.count <= previous_count
+        }
+
+    metadata = deck_payload.get("metadata") or {}
+    records: list[SlideRecord] = []
+    cloned = 0
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        with slides.Presentation() as presentation:  # pyright: ignore[reportAttributeAccessIssue]
+            presentation.slide_size.set_size(
+                slides.SlideSizeType.WIDESCREEN, slides.SlideSizeScaleType.MAXIMIZE
+            )
+            layout_slide = presentation.layout_slides[0]
+            with span("compile"):
+                deck_plan = compile_deck(
+                    deck_payload, presentation.slide_size.size.width, presentation.slide_size.size.height
+                )
+            # Settings resolved from the environment change the output as much as the metadata does.
+            settings = render_settings(deck_plan)
+            fingerprints = [
+                slide_fingerprint(slide_plan.source, metadata, settings) for slide_plan in deck_plan.slides
+            ]
+            changed = [
+                slide_plan
+                for slide_plan, fingerprint in zip(deck_plan.slides, fingerprints)
+                if fingerprint not in previous_records
+            ]
+            context = _new_build_context(deck_plan, render_workers, changed)
+            try:
+                with SlideTemplates(presentation, layout_slide) as templates:
+                    for slide_plan, fingerprint in zip(deck_plan.slides, fingerprints):
+                        start_index = len(presentation.slides)
+                        record = previous_records.get(fingerprint)
+                        if record is not None:
+                            for offset in range(record.count):
+                                presentation.slides.add_clone(previous.slides[record.index + offset], layout_slide)
+                            cloned += 1
+                        else:
+                            with span("slide", order=slide_plan.order, slide_type=slide_plan.slide_type):
+                                _build_slide(templates, slide_plan, deck_plan, context)
+                        records.append(
+                            SlideRecord(fingerprint, start_index, len(presentation.slides) - start_index)
+                        )
+            finally:
+                context.close()
+
+            with span("presentation.save"):
+                presentation.save(str(tmp_path), slides.export.SaveFormat.PPTX)
+            slide_count = len(presentation.slides)
+    except BaseException:
+        # Leave no half-written .tmp next to the previous deck, which stays untouched.
+        tmp_path.unlink(missing_ok=True)
+        raise
+    finally:
+        if previous is not None:
+            previous.dispose()
+
+    # Without its manifest a crash below only costs a full rebuild, never clones from wrong indices.
+    remove_manifest(output_path)
+    os.replace(tmp_path, output_path)
+    save_manifest(output_path, records)
+    return slide_count, cloned, len(deck_plan.slides) - cloned
+
+
+def build_deck_bytes(deck_payload: dict, render_workers: int = 0) -> bytes:
+    """Build one deck in memory and return the PPTX bytes."""
+
+    stream = BytesIO()
+    with slides.Presentation() as presentation:  # pyright: ignore[reportAttributeAccessIssue]
+        create_slide(presentation, deck_payload, render_workers)
+        with span("presentation.save"):
+            presentation.save(stream, slides.export.SaveFormat.PPTX)
+    return stream.getvalue()
+
+
+def build_decks(
+    inputs: list[str],
+    output_dir: Path,
+    render_workers: int = RENDER_WORKERS,
+    chunk_size: int = 0,
+    incremental: bool = False,
+    stream_json: bool = False,
+) -> list[DeckResult]:
+    """Build every deck named by the inputs in this process, collecting per-deck timings and failures."""
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    used_names: set[str] = set()
+    results: list[DeckResult] = []
+    for source in iter_deck_sources(inputs, stream=stream_json):
+        if source.error:
+            results.append(DeckResult(source.name, source.origin, None, 0.0, 0, source.error))
+            continue
+
+        output_path = unique_output_path(output_dir, source.name, used_names)
+        start = time.perf_counter()
+        try:
+            with span("deck", deck=source.name):
+                if source.path is not None:
+                    slide_count = build_deck_from_json_stream(
+                        source.path, output_path, chunk_size or DEFAULT_CHUNK_SIZE, render_workers
+                    )
+                else:
+                    slide_count = _build_one_deck(source.payload, output_path, render_workers, chunk_size, incremental)
+        except Exception as exc:
+            elapsed = time.perf_counter() - start
+            results.append(
+                DeckResult(source.name, source.origin, None, elapsed, 0, f"{type(exc).__name__}: {exc}")
+            )
+            continue
+        elapsed = time.perf_counter() - start
+        results.append(DeckResult(source.name, source.origin, str(output_path), elapsed, slide_count))
+    return results
+
+
+def _build_one_deck(
+    deck_payload: dict,
+    output_path: Path,
+    render_workers: int,
+    chunk_size: int,
+    incremental: bool,
+) -> int:
+    """Build one batch deck with the selected strategy, returning the slide count."""
+
+    if incremental:
+        slide_count, _, _ = build_deck_incremental(deck_payload, output_path, render_workers)
+        return slide_count
+    if chunk_size > 0:
+        return build_deck_streaming(deck_payload, output_path, chunk_size, render_workers)
+    return build_deck(deck_payload, output_path, render_workers)
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Build PPTX decks from deck JSON definitions.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help=(
+            "Deck JSON files, directories, glob patterns, or JSONL files with one deck per line "
+            "('-' reads JSONL from stdin). Without inputs, Input.json is built into NewPresentation.pptx."
+        ),
+    )
+    parser.add_argument("-o", "--output-dir", type=Path, default=Path("."), help="Directory for built decks.")
+    parser.add_argument("--workers", type=int, default=RENDER_WORKERS, help="Processes used to pre-render images.")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=0,
+        help=f"Stream large decks in chunks of this many slides (e.g. {DEFAULT_CHUNK_SIZE}); 0 builds in one pass.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse unchanged slides from the previous output (tracked in <output>.slides.json).",
+    )
+    parser.add_argument(
+        "--stream-json",
+        action="store_true",
+        help=(
+            "Parse .json decks slide by slide while building them in chunks (uses ijson when installed). "
+            "Slides must be listed in ascending order."
+        ),
+    )
+    parser.add_argument(
+        "--quality",
+        choices=QUALITY_PROFILES,
+        help="Raster quality profile for decks that do not set metadata.quality (default: screen).",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable the chart/map/table render cache.")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Render cache directory shared by every deck, worker process and later run (default: .render_cache).",
+    )
+    parser.add_argument("--summary-json", type=Path, help="Write the batch summary as JSON to this path.")
+    parser.add_argument("--profile", action="store_true", help="Print wall/CPU/peak-memory totals per span.")
+    parser.add_argument("--profile-json", type=Path, help="Write the per-slide and per-component profile as JSON.")
+    parser.add_argument("--profile-trace", type=Path, help="Write a Chrome trace-event file (chrome://tracing, Perfetto).")
+    parser.add_argument(
+        "--profile-no-memory",
+        action="store_true",
+        help="Skip tracemalloc peak-memory tracking, which slows profiled builds.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+
+    parser = _build_arg_parser()
+    args = parser.parse_args(argv)
+    if args.stream_json and args.incremental:
+        parser.error("--stream-json cannot be combined with --incremental")
+    if args.no_cache:
+        configure_render_caches(enabled=False)
+    if args.cache_dir is not None:
+        configure_render_caches(directory=args.cache_dir)
+    if args.quality:
+        # Through the environment so pre-render worker processes resolve the same profile.
+        os.environ[QUALITY_ENV] = args.quality
+
+    profiling = args.profile or args.profile_json or args.profile_trace
+    if profiling:
+        enable_profiling(memory=not args.profile_no_memory)
+    try:
+        return _run(args)
+    finally:
+        if profiling:
+            _write_profile(args)
+
+
+def _write_profile(args: argparse.Namespace) -> None:
+    """Stop profiling and emit the requested report formats."""
+
+    profiler = disable_profiling()
+    if profiler is None:
+        return
+    if args.profile:
+        print(format_profile(profiler.report()))
+    if args.profile_json:
+        profiler.write_report(args.profile_json)
+    if args.profile_trace:
+        profiler.write_chrome_trace(args.profile_trace)
+
+
+def _report_image_dedup() -> dict:
+    """Print how many embedded images were reused in this process and return the counters."""
+
+    dedup = image_dedup_stats()
+    if dedup["reused"]:
+        print(f"Reused {dedup['reused']} duplicate images, saving {dedup['bytes_saved'] / 1024:.1f} KB")
+    return dedup
+
+
+def _run(args: argparse.Namespace) -> int:
+    """Build the decks selected on the command line."""
+
+    if not args.inputs:
+        if args.stream_json:
+            try:
+                build_deck_from_json_stream(
+                    INPUT_JSON_PATH, DEFAULT_OUTPUT_PATH, args.chunk_size or DEFAULT_CHUNK_SIZE, args.workers
+                )
+            except (OSError, ValueError) as exc:
+                print(exc, file=sys.stderr)
+                return 1
+            _report_image_dedup()
+            return 0
+        try:
+            deck_payload = load_deck()
+        except DeckValidationError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+        if args.incremental:
+            slide_count, cloned, rendered = build_deck_incremental(deck_payload, DEFAULT_OUTPUT_PATH, args.workers)
+            print(f"{slide_count} slides written: {cloned} reused, {rendered} rendered")
+        elif args.chunk_size > 0:
+            build_deck_streaming(deck_payload, DEFAULT_OUTPUT_PATH, args.chunk_size, args.workers)
+        else:
+            build_deck(deck_payload, DEFAULT_OUTPUT_PATH, args.workers)
+        _report_image_dedup()
+        return 0
+
+    start = time.perf_counter()
+    results = build_decks(
+        args.inputs, args.output_dir, args.workers, args.chunk_size, args.incremental, args.stream_json
+    )
+    total_seconds = time.perf_counter() - start
+    print(format_summary(results, total_seconds))
+    dedup = _report_image_dedup()
+    cache_stats = render_cache_stats()
+    print(format_render_cache_stats(cache_stats))
+
+    if args.summary_json:
+        summary = summarize_results(results, total_seconds)
+        summary["render_cache"] = cache_stats
+        summary["image_dedup"] = dedup
+        summary["slide_templates"] = slide_template_stats()
+        summary["image_buffers"] = image_buffer_stats()
+        args.summary_json.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    return 1 if any(result.error for result in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())